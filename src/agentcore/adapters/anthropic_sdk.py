@@ -116,17 +116,7 @@ class AnthropicAdapter(FrameworkAdapter):
                 )
                 try:
                     response = original_create(*args, **kwargs)
-                    adapter_ref._bus.emit_sync(
-                        AgentEvent(
-                            EventType.AGENT_STOPPED,
-                            adapter_ref._agent_id,
-                            data={"success": True},
-                        )
-                    )
-                    # Emit tool-use events for any tool_use blocks in the response
-                    _emit_tool_use_events(response, adapter_ref)
-                    # Emit cost event if usage data is present
-                    _emit_cost_event(response, adapter_ref)
+                    adapter_ref._bus.emit_many_sync(_response_events(response, adapter_ref))
                     return response
                 except Exception as exc:
                     adapter_ref._bus.emit_sync(
@@ -155,15 +145,9 @@ class AnthropicAdapter(FrameworkAdapter):
                     )
                     try:
                         response = await original_acreate(*args, **kwargs)
-                        await adapter_ref._bus.emit(
-                            AgentEvent(
-                                EventType.AGENT_STOPPED,
-                                adapter_ref._agent_id,
-                                data={"success": True},
-                            )
+                        await adapter_ref._bus.emit_many(
+                            _response_events(response, adapter_ref)
                         )
-                        _emit_tool_use_events(response, adapter_ref)
-                        _emit_cost_event(response, adapter_ref)
                         return response
                     except Exception as exc:
                         await adapter_ref._bus.emit(
@@ -192,17 +176,35 @@ class AnthropicAdapter(FrameworkAdapter):
 # ---------------------------------------------------------------------------
 
 
-def _emit_tool_use_events(response: object, adapter: AnthropicAdapter) -> None:
-    """Emit ``TOOL_CALLED`` events for any ``tool_use`` blocks in a response."""
+def _response_events(response: object, adapter: AnthropicAdapter) -> list[AgentEvent]:
+    """Build the events for a completed call, emitted together as one batch.
+
+    ``AGENT_STOPPED``, then ``TOOL_CALLED`` per ``tool_use`` block, then
+    ``COST_INCURRED`` if usage data is present.
+    """
+    stopped = AgentEvent(EventType.AGENT_STOPPED, adapter._agent_id, data={"success": True})
+    # Responses with neither content blocks nor usage need no further probing
+    if not getattr(response, "content", None) and getattr(response, "usage", None) is None:
+        return [stopped]
+    return [
+        stopped,
+        *_tool_use_events(response, adapter),
+        *_cost_events(response, adapter),
+    ]
+
+
+def _tool_use_events(response: object, adapter: AnthropicAdapter) -> list[AgentEvent]:
+    """Build ``TOOL_CALLED`` events for any ``tool_use`` blocks in a response."""
     content = getattr(response, "content", None)
     if not isinstance(content, list):
-        return
+        return []
+    events: list[AgentEvent] = []
     for block in content:
         block_type = getattr(block, "type", None)
         if block_type == "tool_use":
             tool_name = getattr(block, "name", "unknown_tool")
             tool_input = getattr(block, "input", {})
-            adapter._bus.emit_sync(
+            events.append(
                 ToolCallEvent(
                     event_type=EventType.TOOL_CALLED,
                     agent_id=adapter._agent_id,
@@ -210,16 +212,17 @@ def _emit_tool_use_events(response: object, adapter: AnthropicAdapter) -> None:
                     tool_input=dict(tool_input) if isinstance(tool_input, dict) else {},
                 )
             )
+    return events
 
 
-def _emit_cost_event(response: object, adapter: AnthropicAdapter) -> None:
-    """Emit a ``COST_INCURRED`` event from Anthropic usage metadata."""
+def _cost_events(response: object, adapter: AnthropicAdapter) -> list[AgentEvent]:
+    """Build the ``COST_INCURRED`` event from Anthropic usage metadata, if any."""
     usage = getattr(response, "usage", None)
     if usage is None:
-        return
+        return []
     input_tokens = getattr(usage, "input_tokens", 0) or 0
     output_tokens = getattr(usage, "output_tokens", 0) or 0
-    adapter._bus.emit_sync(
+    return [
         AgentEvent(
             EventType.COST_INCURRED,
             adapter._agent_id,
@@ -228,4 +231,4 @@ def _emit_cost_event(response: object, adapter: AnthropicAdapter) -> None:
                 "output_tokens": output_tokens,
             },
         )
-    )
+    ]
@@ -21,18 +21,84 @@ import inspect
 import logging
 import threading
 import uuid
+import weakref
 from collections import deque
-from typing import Callable
+from typing import TYPE_CHECKING, Callable
 
-from agentcore.bus.subscriber import Subscriber
+from agentcore.bus.filters import TypeFilter
+from agentcore.bus.subscriber import FilteredSubscriber, Subscriber
 from agentcore.schema.errors import EventBusError
 from agentcore.schema.events import AgentEvent, EventType
 
+if TYPE_CHECKING:
+    from collections.abc import Coroutine, Iterable
+
 logger = logging.getLogger(__name__)
 
 # Type alias for the handler callable stored in the registry
 _Handler = Callable[[AgentEvent], object]
 
+# A registered handler paired with whether it is a coroutine function,
+# classified once at subscribe time
+_Subscription = tuple[_Handler, bool]
+
+# Identifies one emitting context: a thread plus the asyncio task (if any)
+# running in it.  Each context drives its own pump.
+_PumpOwner = tuple[int, "asyncio.Task[object] | None"]
+
+
+def _subscription(handler: Subscriber) -> _Subscription:
+    """Pair *handler* with whether calling it returns a coroutine."""
+    is_async = inspect.iscoroutinefunction(handler) or inspect.iscoroutinefunction(
+        type(handler).__call__
+    )
+    return handler, is_async
+
+
+def _close_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Shut down *loop*'s async generators and close it, if still possible."""
+    if loop.is_closed() or loop.is_running():
+        return
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        # No loop running on this thread, so *loop* can be driven here
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    loop.close()
+
+
+def _cancel_leftover_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    """Cancel tasks that handlers left running on *loop*, as asyncio.run does."""
+    tasks = asyncio.all_tasks(loop)
+    if not tasks:
+        return
+    for task in tasks:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+
+class _ThreadLoop:
+    """One thread's ``emit_sync`` event loop, closed when this owner is freed.
+
+    Held in a ``threading.local``, so the loop is closed once its thread
+    exits (or the bus is dropped) rather than lingering with open file
+    descriptors.
+    """
+
+    __slots__ = ("__weakref__", "loop")
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        weakref.finalize(self, _close_loop, self.loop)
+
+
+def _current_pump_owner() -> _PumpOwner:
+    try:
+        task = asyncio.current_task()
+    except RuntimeError:
+        task = None
+    return (threading.get_ident(), task)
+
 
 class EventBus:
     """Thread-safe, in-process publish/subscribe event bus.
@@ -60,12 +126,28 @@ class EventBus:
 
     def __init__(self, max_history: int = 1000) -> None:
         self._lock = threading.Lock()
-        # Map from EventType -> {subscription_id: handler}
-        self._type_subscribers: dict[EventType, dict[str, _Handler]] = {}
+        # Map from EventType -> {subscription_id: (handler, is_async)}
+        self._type_subscribers: dict[EventType, dict[str, _Subscription]] = {}
         # Global subscribers interested in every event
-        self._global_subscribers: dict[str, _Handler] = {}
+        self._global_subscribers: dict[str, _Subscription] = {}
+        # Map from subscription_id -> the EventTypes it is filed under, or
+        # None for global handlers
+        self._sub_index: dict[str, tuple[EventType, ...] | None] = {}
+        # Per-type handlers followed by the global ones, built on first
+        # dispatch of that type and dropped whenever its subscriptions change
+        self._dispatch_cache: dict[EventType, tuple[_Subscription, ...]] = {}
         self._max_history = max_history
-        self._history: deque[AgentEvent] = deque(maxlen=max_history if max_history > 0 else None)
+        # None when history is disabled, so dispatch can skip it outright
+        self._history: deque[AgentEvent] | None = (
+            deque(maxlen=max_history if max_history > 0 else None) if max_history != 0 else None
+        )
+        # Pending events for every emitting context currently inside emit()
+        self._pumps: dict[_PumpOwner, deque[AgentEvent]] = {}
+        # Event loops reused by emit_sync outside async code, one per thread
+        # so concurrent sync emitters never share a running loop.  The weak
+        # set lets close() reach the loops of every live thread.
+        self._sync_local = threading.local()
+        self._sync_loops: weakref.WeakSet[_ThreadLoop] = weakref.WeakSet()
 
     # ------------------------------------------------------------------
     # Subscription management
@@ -90,19 +172,16 @@ class EventBus:
         Raises
         ------
         EventBusError
-            If ``event_type`` is not a valid ``EventType``.
+            If ``event_type`` is not a valid ``EventType`` or ``handler`` is
+            not callable.
         """
         if not isinstance(event_type, EventType):
             raise EventBusError(
                 f"Invalid event_type {event_type!r}; must be an EventType enum member."
             )
-        sub_id = str(uuid.uuid4())
-        with self._lock:
-            if event_type not in self._type_subscribers:
-                self._type_subscribers[event_type] = {}
-            self._type_subscribers[event_type][sub_id] = handler  # type: ignore[assignment]
-        logger.debug("Subscribed %s to %s (id=%s)", handler, event_type.value, sub_id)
-        return sub_id
+        if not callable(handler):
+            raise EventBusError(f"Handler {handler!r} is not callable.")
+        return self._subscribe_types((event_type,), handler)
 
     def subscribe_all(self, handler: Subscriber) -> str:
         """Register *handler* to receive every event regardless of type.
@@ -116,13 +195,47 @@ class EventBus:
         -------
         str
             Subscription ID for use with :meth:`unsubscribe`.
+
+        Raises
+        ------
+        EventBusError
+            If ``handler`` is not callable.
+
+        Notes
+        -----
+        A :class:`~agentcore.bus.subscriber.FilteredSubscriber` gated by a
+        plain :class:`~agentcore.bus.filters.TypeFilter` is filed under each
+        of the filter's event types instead, so events of other types never
+        reach it.  Its handler then runs alongside the type subscribers,
+        ahead of the global ones.
         """
+        if not callable(handler):
+            raise EventBusError(f"Handler {handler!r} is not callable.")
+        if type(handler) is FilteredSubscriber and type(handler._filter) is TypeFilter:
+            return self._subscribe_types(handler._filter._types, handler._handler)
         sub_id = str(uuid.uuid4())
         with self._lock:
-            self._global_subscribers[sub_id] = handler  # type: ignore[assignment]
+            self._global_subscribers[sub_id] = _subscription(handler)
+            self._sub_index[sub_id] = None
+            self._dispatch_cache.clear()
         logger.debug("Subscribed %s to ALL events (id=%s)", handler, sub_id)
         return sub_id
 
+    def _subscribe_types(self, event_types: Iterable[EventType], handler: Subscriber) -> str:
+        """File one subscription for *handler* under every type in *event_types*."""
+        sub_id = str(uuid.uuid4())
+        subscription = _subscription(handler)
+        types = tuple(event_types)
+        with self._lock:
+            for event_type in types:
+                self._type_subscribers.setdefault(event_type, {})[sub_id] = subscription
+                self._dispatch_cache.pop(event_type, None)
+            self._sub_index[sub_id] = types
+        logger.debug(
+            "Subscribed %s to %s (id=%s)", handler, ", ".join(t.value for t in types), sub_id
+        )
+        return sub_id
+
     def unsubscribe(self, subscription_id: str) -> None:
         """Cancel a subscription by its ID.
 
@@ -137,17 +250,18 @@ class EventBus:
             If ``subscription_id`` is not found in any subscriber map.
         """
         with self._lock:
-            # Check global subscribers first
-            if subscription_id in self._global_subscribers:
-                del self._global_subscribers[subscription_id]
-                logger.debug("Unsubscribed global handler id=%s", subscription_id)
-                return
-            # Check type-specific subscribers
-            for type_map in self._type_subscribers.values():
-                if subscription_id in type_map:
-                    del type_map[subscription_id]
+            if subscription_id in self._sub_index:
+                event_types = self._sub_index.pop(subscription_id)
+                if event_types is None:
+                    del self._global_subscribers[subscription_id]
+                    self._dispatch_cache.clear()
+                    logger.debug("Unsubscribed global handler id=%s", subscription_id)
+                else:
+                    for event_type in event_types:
+                        del self._type_subscribers[event_type][subscription_id]
+                        self._dispatch_cache.pop(event_type, None)
                     logger.debug("Unsubscribed type handler id=%s", subscription_id)
-                    return
+                return
         raise EventBusError(
             f"Subscription {subscription_id!r} not found; it may have already been cancelled."
         )
@@ -163,6 +277,12 @@ class EventBus:
         lock before invoking them so that handlers may themselves call
         ``subscribe`` or ``emit`` without deadlocking.
 
+        ``await bus.emit(event)`` returns only once *event* has been
+        delivered, including when a handler awaits it — so a handler can
+        emit a request and then wait for a subscriber to answer it.  Events
+        a handler emits through :meth:`emit_sync` are instead queued and
+        delivered after the current event has reached every subscriber.
+
         Async handlers are awaited; sync handlers are called directly.
         All handler exceptions are caught and logged — a misbehaving
         subscriber never prevents other subscribers from receiving the event.
@@ -172,72 +292,199 @@ class EventBus:
         event:
             The event to dispatch.
         """
-        with self._lock:
-            # Snapshot the handlers for this event type + global handlers
-            type_handlers = list(
-                self._type_subscribers.get(event.event_type, {}).values()
-            )
-            global_handlers = list(self._global_subscribers.values())
-            if self._max_history != 0:
-                self._history.append(event)
+        if self._is_unobserved(event.event_type):
+            return
+        await self.emit_many((event,))
+
+    async def emit_many(self, events: Iterable[AgentEvent]) -> None:
+        """Dispatch several events, in order, as one batch.
 
-        all_handlers: list[_Handler] = type_handlers + global_handlers
-        for handler in all_handlers:
-            await self._safe_call(handler, event)
+        Equivalent to awaiting :meth:`emit` for each event in turn, but the
+        batch is recorded in history and matched against subscribers under
+        a single lock acquisition.  Use it when one operation produces
+        several events at the same moment.
+
+        Parameters
+        ----------
+        events:
+            The events to dispatch, in emission order.
+        """
+        events = self._drop_unobserved(events)
+        if not events:
+            return
+        owner = _current_pump_owner()
+        if owner in self._pumps:
+            # Awaited from inside a handler: deliver now rather than queue,
+            # since the caller may be waiting on a subscriber's reaction.
+            await self._dispatch(list(events))
+            return
+
+        pending = deque(events)
+        self._pumps[owner] = pending
+        try:
+            while pending:
+                batch = list(pending)
+                pending.clear()
+                await self._dispatch(batch)
+        finally:
+            del self._pumps[owner]
 
     def emit_sync(self, event: AgentEvent) -> None:
         """Synchronous wrapper around :meth:`emit`.
 
         Runs the async emit coroutine on an existing event loop if one is
         running, or spins up a new one.  Prefer :meth:`emit` in async
-        contexts.
+        contexts.  Called from inside a handler, it queues *event* behind
+        the event currently being delivered instead.
 
         Parameters
         ----------
         event:
             The event to dispatch.
         """
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
+        if self._is_unobserved(event.event_type):
+            # Skip creating a coroutine (and possibly an event loop) for nothing
+            return
+        pending = self._pumps.get(_current_pump_owner())
+        if pending is not None:
+            # Called from a handler: the emit running below us delivers it
+            # once the current event has reached every subscriber.
+            pending.append(event)
+            return
+        self._run_sync(self.emit(event))
+
+    def emit_many_sync(self, events: Iterable[AgentEvent]) -> None:
+        """Synchronous wrapper around :meth:`emit_many`.
 
-        if loop is not None and loop.is_running():
-            # We are already inside an async context — schedule the coroutine
-            # as a task so it doesn't block the caller.
-            loop.create_task(self.emit(event))
-        else:
-            asyncio.run(self.emit(event))
+        Parameters
+        ----------
+        events:
+            The events to dispatch, in emission order.
+        """
+        events = self._drop_unobserved(events)
+        if not events:
+            # Skip creating a coroutine (and possibly an event loop) for nothing
+            return
+        pending = self._pumps.get(_current_pump_owner())
+        if pending is not None:
+            pending.extend(events)
+            return
+        self._run_sync(self.emit_many(events))
+
+    def close(self) -> None:
+        """Close the event loops :meth:`emit_sync` created outside async code.
+
+        Loops are otherwise closed when their thread exits or the bus is
+        garbage collected.  The bus stays usable: a later ``emit_sync``
+        creates a fresh loop.  Loops that are running at the time are left
+        open.
+        """
+        with self._lock:
+            owners = list(self._sync_loops)
+        for owner in owners:
+            _close_loop(owner.loop)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
-    async def _safe_call(self, handler: _Handler, event: AgentEvent) -> None:
-        """Invoke *handler* with *event*, absorbing all exceptions.
+    def _is_unobserved(self, event_type: EventType) -> bool:
+        """Return True if emitting *event_type* would have no effect at all.
 
-        Async handlers are awaited; sync handlers are called synchronously.
-        Any exception is logged at ERROR level and suppressed so that
-        downstream subscribers still receive the event.
+        That is: history is disabled and no subscriber would receive it.
+        Checked without the lock — a subscription racing with an emit may
+        miss that one event, exactly as if it had landed just after it.
+        """
+        return (
+            self._history is None
+            and not self._global_subscribers
+            and not self._type_subscribers.get(event_type)
+        )
 
-        Parameters
-        ----------
-        handler:
-            The subscriber callable.
-        event:
-            The event to pass.
+    def _drop_unobserved(self, events: Iterable[AgentEvent]) -> list[AgentEvent]:
+        """Return *events* without those :meth:`_is_unobserved` would skip."""
+        if self._history is not None:
+            # History records every event, so none can be skipped
+            return list(events)
+        return [event for event in events if not self._is_unobserved(event.event_type)]
+
+    def _run_sync(self, emission: Coroutine[object, object, None]) -> None:
+        """Run an emit coroutine from synchronous code.
+
+        Schedules it as a task on the running event loop if there is one —
+        so it doesn't block the caller — or otherwise runs it to completion
+        on this thread's private loop, created on first use.  Tasks that
+        handlers leave behind are cancelled afterwards, as ``asyncio.run``
+        would.
         """
         try:
-            result = handler(event)
-            if inspect.isawaitable(result):
-                await result
-        except Exception:
-            logger.exception(
-                "Unhandled exception in event handler %r for event %s (id=%s)",
-                handler,
-                event.event_type.value,
-                event.event_id,
-            )
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is not None and loop.is_running():
+            loop.create_task(emission)
+            return
+
+        owner: _ThreadLoop | None = getattr(self._sync_local, "owner", None)
+        if owner is None or owner.loop.is_closed():
+            owner = _ThreadLoop()
+            self._sync_local.owner = owner
+            with self._lock:
+                self._sync_loops.add(owner)
+        try:
+            owner.loop.run_until_complete(emission)
+        finally:
+            _cancel_leftover_tasks(owner.loop)
+
+    async def _dispatch(self, batch: list[AgentEvent]) -> None:
+        """Record *batch* in history and deliver each event to its subscribers.
+
+        Async handlers are awaited; sync handlers are called synchronously.
+        A sync handler that nonetheless returns an awaitable (for example a
+        :class:`~agentcore.bus.subscriber.FilteredSubscriber` wrapping an
+        async handler) still has its result awaited.  Any handler exception
+        is logged at ERROR level and suppressed so that downstream
+        subscribers still receive the event.
+        """
+        with self._lock:
+            # Snapshot the handlers for each event type present in the batch.
+            # Cached tuples are immutable, so later (un)subscribes replace
+            # rather than mutate them and the snapshot stays consistent.
+            cache = self._dispatch_cache
+            handlers_by_type: dict[EventType, tuple[_Subscription, ...]] = {}
+            for event in batch:
+                event_type = event.event_type
+                if event_type not in handlers_by_type:
+                    handlers = cache.get(event_type)
+                    if handlers is None:
+                        handlers = cache[event_type] = (
+                            *self._type_subscribers.get(event_type, {}).values(),
+                            *self._global_subscribers.values(),
+                        )
+                    handlers_by_type[event_type] = handlers
+            if self._history is not None:
+                self._history.extend(batch)
+
+        # Hot loop: the handler call is inlined rather than delegated to a
+        # helper coroutine, and lookups are hoisted into locals
+        isawaitable = inspect.isawaitable
+        for event in batch:
+            for handler, is_async in handlers_by_type[event.event_type]:
+                try:
+                    if is_async:
+                        await handler(event)  # type: ignore[misc]
+                    else:
+                        result = handler(event)
+                        if result is not None and isawaitable(result):
+                            await result
+                except Exception:
+                    logger.exception(
+                        "Unhandled exception in event handler %r for event %s (id=%s)",
+                        handler,
+                        event.event_type.value,
+                        event.event_id,
+                    )
 
     # ------------------------------------------------------------------
     # History
@@ -249,16 +496,18 @@ class EventBus:
         Returns
         -------
         list[AgentEvent]
-            Events in emission order, oldest first.  The list is a copy;
-            mutations do not affect the internal buffer.
+            Events in emission order, oldest first.  The list is a shallow
+            copy: adding or removing items does not affect the internal
+            buffer, but the events themselves are shared, not cloned.
         """
         with self._lock:
-            return list(self._history)
+            return list(self._history) if self._history is not None else []
 
     def clear_history(self) -> None:
         """Discard all events in the history buffer."""
         with self._lock:
-            self._history.clear()
+            if self._history is not None:
+                self._history.clear()
 
     # ------------------------------------------------------------------
     # Introspection
@@ -266,13 +515,13 @@ class EventBus:
 
     def subscriber_count(self) -> int:
         """Return the total number of active subscriptions."""
-        with self._lock:
-            type_count = sum(len(v) for v in self._type_subscribers.values())
-            return type_count + len(self._global_subscribers)
+        # _sub_index holds exactly one entry per live subscription, and
+        # len() of a dict is atomic, so no lock or per-type scan is needed
+        return len(self._sub_index)
 
     def __repr__(self) -> str:
         return (
             f"EventBus(subscribers={self.subscriber_count()}, "
-            f"history_size={len(self._history)}, "
+            f"history_size={len(self._history) if self._history is not None else 0}, "
             f"max_history={self._max_history})"
         )
@@ -20,11 +20,16 @@ Kafka/Pulsar topic mapping are available via plugins.
 """
 from __future__ import annotations
 
+import sys
 from abc import ABC, abstractmethod
 from enum import Enum
+from typing import TYPE_CHECKING
 
 from agentcore.schema.events import AgentEvent, EventType
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 
 class FilterMode(str, Enum):
     """Combinator mode for :class:`CompositeFilter`."""
@@ -38,8 +43,13 @@ class EventFilter(ABC):
 
     A filter is a pure predicate: it takes an :class:`AgentEvent` and returns
     ``True`` if the event should be forwarded to the subscriber.
+
+    The shipped filters declare ``__slots__``; subclasses that do not will
+    simply get an instance ``__dict__`` as usual.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def matches(self, event: AgentEvent) -> bool:
         """Return ``True`` if *event* passes this filter.
@@ -56,11 +66,31 @@ class EventFilter(ABC):
 
     def __and__(self, other: "EventFilter") -> "CompositeFilter":
         """Combine two filters with AND semantics via the ``&`` operator."""
-        return CompositeFilter(filters=[self, other], mode=FilterMode.ALL)
+        return self._combine(other, FilterMode.ALL)
 
     def __or__(self, other: "EventFilter") -> "CompositeFilter":
         """Combine two filters with OR semantics via the ``|`` operator."""
-        return CompositeFilter(filters=[self, other], mode=FilterMode.ANY)
+        return self._combine(other, FilterMode.ANY)
+
+    def _combine(self, other: "EventFilter", mode: FilterMode) -> "CompositeFilter":
+        """Build a *mode* composite of *self* and *other*.
+
+        Operands that are themselves plain composites of the same mode are
+        spliced in, so ``a & b & c`` yields one flat three-child filter
+        rather than a nested chain.  Composites that reorder their children
+        are kept intact to preserve their own statistics.
+        """
+        children: list[EventFilter] = []
+        for operand in (self, other):
+            if (
+                type(operand) is CompositeFilter
+                and operand._mode is mode
+                and not operand._reorder_interval
+            ):
+                children.extend(operand._filters)
+            else:
+                children.append(operand)
+        return CompositeFilter(filters=children, mode=mode)
 
 
 class TypeFilter(EventFilter):
@@ -78,15 +108,21 @@ class TypeFilter(EventFilter):
     True
     """
 
+    __slots__ = ("_repr", "_types")
+
     def __init__(self, *event_types: EventType) -> None:
         self._types: frozenset[EventType] = frozenset(event_types)
+        # Built on first repr(); the type set never changes afterwards
+        self._repr: str | None = None
 
     def matches(self, event: AgentEvent) -> bool:
         return event.event_type in self._types
 
     def __repr__(self) -> str:
-        names = ", ".join(t.value for t in sorted(self._types, key=lambda t: t.value))
-        return f"TypeFilter({names})"
+        if self._repr is None:
+            names = ", ".join(t.value for t in sorted(self._types, key=lambda t: t.value))
+            self._repr = f"TypeFilter({names})"
+        return self._repr
 
 
 class AgentFilter(EventFilter):
@@ -104,14 +140,25 @@ class AgentFilter(EventFilter):
     True
     """
 
+    __slots__ = ("_agent_ids", "_repr")
+
     def __init__(self, *agent_ids: str) -> None:
-        self._agent_ids: frozenset[str] = frozenset(agent_ids)
+        # Interned so that ids read from the wire compare by identity;
+        # sys.intern rejects str subclasses such as str-valued enums
+        self._agent_ids: frozenset[str] = frozenset(
+            sys.intern(agent_id) if type(agent_id) is str else agent_id
+            for agent_id in agent_ids
+        )
+        # Built on first repr(); sorting large id sets is not free
+        self._repr: str | None = None
 
     def matches(self, event: AgentEvent) -> bool:
         return event.agent_id in self._agent_ids
 
     def __repr__(self) -> str:
-        return f"AgentFilter({sorted(self._agent_ids)!r})"
+        if self._repr is None:
+            self._repr = f"AgentFilter({sorted(self._agent_ids)!r})"
+        return self._repr
 
 
 class MetadataFilter(EventFilter):
@@ -131,8 +178,10 @@ class MetadataFilter(EventFilter):
     True
     """
 
+    __slots__ = ("_key", "_value")
+
     def __init__(self, key: str, value: object) -> None:
-        self._key = key
+        self._key = sys.intern(key) if type(key) is str else key
         self._value = value
 
     def matches(self, event: AgentEvent) -> bool:
@@ -152,6 +201,11 @@ class CompositeFilter(EventFilter):
     mode:
         ``FilterMode.ALL`` requires every filter to match (AND);
         ``FilterMode.ANY`` requires at least one to match (OR).
+    reorder_interval:
+        When positive, track how often each child passes and call
+        :meth:`reorder` after every *reorder_interval* evaluations, so that
+        the children most likely to decide the result run first.  ``0``
+        (the default) keeps the given order and skips the bookkeeping.
 
     Examples
     --------
@@ -160,18 +214,84 @@ class CompositeFilter(EventFilter):
     True
     """
 
+    __slots__ = (
+        "_calls",
+        "_evaluate",
+        "_evaluations",
+        "_filters",
+        "_mode",
+        "_passes",
+        "_reorder_interval",
+    )
+
     def __init__(
         self,
         filters: list[EventFilter],
         mode: FilterMode = FilterMode.ALL,
+        reorder_interval: int = 0,
     ) -> None:
         self._filters = list(filters)
         self._mode = mode
+        self._reorder_interval = reorder_interval
+        # Per-child evaluation and pass counts, parallel to _filters
+        self._calls = [0] * len(self._filters)
+        self._passes = [0] * len(self._filters)
+        self._evaluations = 0
+        # Pick the evaluation strategy once so matches() does not re-check
+        # the mode and reorder settings on every event
+        self._evaluate: Callable[[AgentEvent], bool]
+        if reorder_interval > 0:
+            self._evaluate = self._matches_counting
+        elif mode is FilterMode.ALL:
+            self._evaluate = self._matches_all
+        else:
+            self._evaluate = self._matches_any
 
     def matches(self, event: AgentEvent) -> bool:
-        if self._mode is FilterMode.ALL:
-            return all(f.matches(event) for f in self._filters)
-        return any(f.matches(event) for f in self._filters)
+        return self._evaluate(event)
+
+    def reorder(self) -> None:
+        """Sort children so those most likely to decide the result run first.
+
+        In ``ALL`` mode the children that reject most often move to the
+        front; in ``ANY`` mode those that accept most often do.  Pass rates
+        are smoothed so that rarely evaluated children rank as neutral, and
+        ties keep their current relative order.
+        """
+        calls, passes = self._calls, self._passes
+        order = sorted(
+            range(len(self._filters)),
+            key=lambda i: (passes[i] + 1) / (calls[i] + 2),
+            reverse=self._mode is FilterMode.ANY,
+        )
+        self._filters = [self._filters[i] for i in order]
+        self._calls = [calls[i] for i in order]
+        self._passes = [passes[i] for i in order]
+
+    def _matches_all(self, event: AgentEvent) -> bool:
+        return all(child.matches(event) for child in self._filters)
+
+    def _matches_any(self, event: AgentEvent) -> bool:
+        return any(child.matches(event) for child in self._filters)
+
+    def _matches_counting(self, event: AgentEvent) -> bool:
+        """Evaluate like :meth:`matches` while recording per-child pass rates."""
+        # The verdict that settles the result: a miss for ALL, a hit for ANY
+        deciding = self._mode is FilterMode.ANY
+        result = not deciding
+        calls, passes = self._calls, self._passes
+        for i, child in enumerate(self._filters):
+            calls[i] += 1
+            verdict = bool(child.matches(event))
+            if verdict:
+                passes[i] += 1
+            if verdict is deciding:
+                result = deciding
+                break
+        self._evaluations += 1
+        if self._evaluations % self._reorder_interval == 0:
+            self.reorder()
+        return result
 
     def __repr__(self) -> str:
         combinator = " AND " if self._mode is FilterMode.ALL else " OR "
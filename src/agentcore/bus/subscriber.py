@@ -73,9 +73,13 @@ class FilteredSubscriber:
     1
     """
 
+    __slots__ = ("_filter", "_handler", "_match")
+
     def __init__(self, handler: Subscriber, event_filter: EventFilter) -> None:
         self._handler = handler
         self._filter = event_filter
+        # Bound once; __call__ runs for every event the bus dispatches here
+        self._match = event_filter.matches
 
     def __call__(self, event: AgentEvent) -> object:
         """Invoke the wrapped handler only if the filter matches.
@@ -90,9 +94,7 @@ class FilteredSubscriber:
         object
             Whatever the wrapped handler returns, or ``None`` if filtered out.
         """
-        if self._filter.matches(event):
-            return self._handler(event)
-        return None
+        return self._handler(event) if self._match(event) else None
 
     def __repr__(self) -> str:
         return (
@@ -15,13 +15,12 @@ with inotify, and encrypted field decryption are available via plugins.
 """
 from __future__ import annotations
 
+import functools
 import json
 import logging
 import os
 from pathlib import Path
 
-import yaml
-
 from agentcore.config.defaults import DEFAULT_CONFIG
 from agentcore.config.schema import validate_config
 from agentcore.schema.config import AgentConfig
@@ -39,6 +38,10 @@ _AUTO_SEARCH_PATHS: tuple[str, ...] = (
     ".agentcore.json",
 )
 
+# Parsed configs kept by _parse_config; enough for every auto-search
+# candidate across a handful of directories
+_FILE_CACHE_SIZE = 32
+
 
 class ConfigLoader:
     """Loads ``AgentConfig`` from multiple sources.
@@ -72,24 +75,7 @@ class ConfigLoader:
         ConfigurationError
             If the file cannot be read or fails validation.
         """
-        resolved = Path(path)
-        if not resolved.exists():
-            raise ConfigurationError(
-                f"YAML config file not found: {resolved}",
-                context={"path": str(resolved)},
-            )
-        try:
-            with resolved.open(encoding="utf-8") as fh:
-                raw: object = yaml.safe_load(fh)
-        except yaml.YAMLError as exc:
-            raise ConfigurationError(
-                f"Failed to parse YAML config at {resolved}: {exc}",
-                context={"path": str(resolved)},
-            ) from exc
-
-        data: dict[str, object] = dict(raw) if isinstance(raw, dict) else {}
-        logger.debug("Loaded YAML config from %s", resolved)
-        return validate_config(data)
+        return _load_cached(Path(path), "YAML")
 
     def load_json(self, path: str | Path) -> AgentConfig:
         """Load configuration from a JSON file.
@@ -108,24 +94,16 @@ class ConfigLoader:
         ConfigurationError
             If the file cannot be read or fails validation.
         """
-        resolved = Path(path)
-        if not resolved.exists():
-            raise ConfigurationError(
-                f"JSON config file not found: {resolved}",
-                context={"path": str(resolved)},
-            )
-        try:
-            with resolved.open(encoding="utf-8") as fh:
-                raw = json.load(fh)
-        except json.JSONDecodeError as exc:
-            raise ConfigurationError(
-                f"Failed to parse JSON config at {resolved}: {exc}",
-                context={"path": str(resolved)},
-            ) from exc
-
-        data = dict(raw) if isinstance(raw, dict) else {}
-        logger.debug("Loaded JSON config from %s", resolved)
-        return validate_config(data)
+        return _load_cached(Path(path), "JSON")
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget every parsed config so the next load parses its file again.
+
+        Cached configs are keyed on file content, so an edited file is always
+        re-parsed; this only releases the memory they hold.
+        """
+        _parse_config.cache_clear()
 
     def load_env(self, prefix: str = "AGENTCORE_") -> AgentConfig:
         """Build configuration from environment variables.
@@ -174,10 +152,17 @@ class ConfigLoader:
         base_dir = Path(search_dir) if search_dir is not None else Path.cwd()
         base_config: AgentConfig | None = None
 
+        # One directory listing instead of an exists() probe per candidate
+        try:
+            with os.scandir(base_dir) as entries:
+                present = {entry.name for entry in entries}
+        except OSError:
+            present = set()
+
         for candidate_name in _AUTO_SEARCH_PATHS:
-            candidate = base_dir / candidate_name
-            if not candidate.exists():
+            if candidate_name not in present:
                 continue
+            candidate = base_dir / candidate_name
             try:
                 if candidate.suffix in {".yaml", ".yml"}:
                     base_config = self.load_yaml(candidate)
@@ -200,3 +185,55 @@ class ConfigLoader:
             logger.debug("Applied environment variable overlay.")
 
         return base_config
+
+
+# ---------------------------------------------------------------------------
+# Cached file loading
+# ---------------------------------------------------------------------------
+
+
+def _load_cached(resolved: Path, file_format: str) -> AgentConfig:
+    """Return a private copy of the validated config stored in *resolved*.
+
+    The file is read on every call, but parsing and validation are cached
+    on its content.  ``AgentConfig`` is mutable, hence the deep copy.
+    """
+    try:
+        # Every parser takes the raw bytes and detects the encoding itself
+        content = resolved.read_bytes()
+    except FileNotFoundError:
+        raise ConfigurationError(
+            f"{file_format} config file not found: {resolved}",
+            context={"path": str(resolved)},
+        ) from None
+
+    import yaml
+
+    try:
+        config = _parse_config(file_format, content)
+    except (yaml.YAMLError, json.JSONDecodeError) as exc:
+        raise ConfigurationError(
+            f"Failed to parse {file_format} config at {resolved}: {exc}",
+            context={"path": str(resolved)},
+        ) from exc
+    logger.debug("Loaded %s config from %s", file_format, resolved)
+    return config.model_copy(deep=True)
+
+
+@functools.lru_cache(maxsize=_FILE_CACHE_SIZE)
+def _parse_config(file_format: str, content: bytes) -> AgentConfig:
+    """Parse and validate the raw bytes of a config file.
+
+    Keyed on the content itself rather than on file metadata, so an edit
+    is picked up even when it leaves the size and modification time
+    unchanged.  Failures are not cached.
+    """
+    import yaml
+
+    if file_format == "YAML":
+        # libyaml-backed loader when PyYAML was built with it
+        raw: object = yaml.load(content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    else:
+        raw = json.loads(content)
+    data: dict[str, object] = dict(raw) if isinstance(raw, dict) else {}
+    return validate_config(data)
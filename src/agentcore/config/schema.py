@@ -16,13 +16,17 @@ migration are available via plugins.
 """
 from __future__ import annotations
 
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from agentcore.schema.config import AgentConfig
 from agentcore.schema.errors import ConfigurationError
 
 __all__ = ["AgentConfig", "validate_config"]
 
+# Shares AgentConfig's compiled validator and skips model_validate's
+# per-call Python wrapper
+_ADAPTER: TypeAdapter[AgentConfig] = TypeAdapter(AgentConfig)
+
 
 def validate_config(data: dict[str, object]) -> AgentConfig:
     """Validate a raw dict against the ``AgentConfig`` schema.
@@ -49,7 +53,7 @@ def validate_config(data: dict[str, object]) -> AgentConfig:
     'bot'
     """
     try:
-        return AgentConfig.model_validate(data)
+        return _ADAPTER.validate_python(data)
     except ValidationError as exc:
         raise ConfigurationError(
             f"Configuration validation failed: {exc}",
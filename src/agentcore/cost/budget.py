@@ -114,6 +114,8 @@ class BasicBudgetManager(BudgetManager):
     """
 
     def __init__(self) -> None:
+        # Serialises read-modify-write updates; entries are immutable tuples
+        # replaced wholesale, so single-agent reads need no lock
         self._lock = threading.Lock()
         # Maps agent_id -> (budget_usd, spent_usd)
         self._budgets: dict[str, tuple[float, float]] = {}
@@ -158,8 +160,7 @@ class BasicBudgetManager(BudgetManager):
         CostTrackingError
             If no budget has been set for *agent_id*.
         """
-        with self._lock:
-            entry = self._budgets.get(agent_id)
+        entry = self._budgets.get(agent_id)
         if entry is None:
             raise CostTrackingError(
                 f"No budget set for agent {agent_id!r}. "
@@ -183,10 +184,10 @@ class BasicBudgetManager(BudgetManager):
             Non-negative USD amount to deduct.
         """
         with self._lock:
-            if agent_id not in self._budgets:
+            entry = self._budgets.get(agent_id)
+            if entry is None:
                 return
-            budget, spent = self._budgets[agent_id]
-            self._budgets[agent_id] = (budget, spent + amount_usd)
+            self._budgets[agent_id] = (entry[0], entry[1] + amount_usd)
 
     def is_over_budget(self, agent_id: str) -> bool:
         """Return ``True`` if *agent_id* has exceeded its spending limit.
@@ -202,8 +203,7 @@ class BasicBudgetManager(BudgetManager):
         -------
         bool
         """
-        with self._lock:
-            entry = self._budgets.get(agent_id)
+        entry = self._budgets.get(agent_id)
         if entry is None:
             return False
         budget, spent = entry
@@ -229,6 +229,4 @@ class BasicBudgetManager(BudgetManager):
         }
 
     def __repr__(self) -> str:
-        with self._lock:
-            count = len(self._budgets)
-        return f"BasicBudgetManager(agents_with_budget={count})"
+        return f"BasicBudgetManager(agents_with_budget={len(self._budgets)})"
@@ -17,6 +17,7 @@ support are available via plugins.
 """
 from __future__ import annotations
 
+import functools
 from typing import NamedTuple
 
 
@@ -56,17 +57,48 @@ MODEL_PRICING: dict[str, PricingEntry] = {
     "mistral-large": PricingEntry(input_cost_per_1k=0.004, output_cost_per_1k=0.012),
 }
 
-# Build a lower-cased alias index for fuzzy matching
-_MODEL_ALIAS_INDEX: dict[str, str] = {k.lower(): k for k in MODEL_PRICING}
+# Build a case-folded alias index for fuzzy matching.  Values are the
+# MODEL_PRICING key objects themselves, so the final lookup matches by identity
+_MODEL_ALIAS_INDEX: dict[str, str] = {k.casefold(): k for k in MODEL_PRICING}
+
+
+def _build_abbreviation_index(aliases: dict[str, str]) -> dict[str, str]:
+    """Map every proper prefix of an alias to the first model ID it abbreviates."""
+    index: dict[str, str] = {}
+    for alias, canonical in sorted(aliases.items(), key=lambda item: item[1]):
+        for end in range(1, len(alias)):
+            index.setdefault(alias[:end], canonical)
+    return index
+
+
+# Lets a truncated model ID resolve with one lookup
+_ABBREVIATION_INDEX: dict[str, str] = _build_abbreviation_index(_MODEL_ALIAS_INDEX)
+
+# Aliases longest first, so the first one that prefixes an ID is the longest
+_ALIASES_LONGEST_FIRST: tuple[str, ...] = tuple(
+    sorted(_MODEL_ALIAS_INDEX, key=len, reverse=True)
+)
+
+# Distinct model strings remembered by _resolve_model; callers use a few
+_RESOLVE_CACHE_SIZE = 512
 
 
 def get_pricing(model: str) -> PricingEntry | None:
     """Resolve a model identifier to its :class:`PricingEntry`.
 
     Lookup is case-insensitive.  If an exact match is not found, fuzzy
-    matching checks whether the provided string is a *prefix* of a known
-    model ID (e.g. ``"claude-sonnet"`` resolves to ``"claude-sonnet-4-5"``).
-    The first alphabetical match wins on ambiguity.
+    matching tries, in order:
+
+    1. *model* as an abbreviation of known model IDs (``"claude-sonnet"``
+       resolves to ``"claude-sonnet-4-5"``); the first alphabetical ID wins.
+    2. The longest known model ID that *model* starts with, so dated or
+       versioned IDs resolve to their family (``"gpt-4o-mini-2024-07-18"``
+       resolves to ``"gpt-4o-mini"``, not ``"gpt-4o"``).
+
+    Every step is a dictionary lookup against indexes built at import time,
+    and the resolved model ID is memoised per *model* string.  The entry
+    itself is read from ``MODEL_PRICING`` on each call, so price edits
+    take effect immediately.
 
     Parameters
     ----------
@@ -86,19 +118,21 @@ def get_pricing(model: str) -> PricingEntry | None:
     >>> get_pricing("unknown-model-xyz") is None
     True
     """
-    normalised = model.lower()
-
-    # Exact match first
-    if normalised in _MODEL_ALIAS_INDEX:
-        return MODEL_PRICING[_MODEL_ALIAS_INDEX[normalised]]
-
-    # Prefix fuzzy match
-    candidates = [
-        canonical
-        for alias, canonical in _MODEL_ALIAS_INDEX.items()
-        if alias.startswith(normalised) or normalised.startswith(alias)
-    ]
-    if candidates:
-        return MODEL_PRICING[sorted(candidates)[0]]
-
-    return None
+    canonical = _resolve_model(model)
+    return MODEL_PRICING[canonical] if canonical is not None else None
+
+
+@functools.lru_cache(maxsize=_RESOLVE_CACHE_SIZE)
+def _resolve_model(model: str) -> str | None:
+    """Return the ``MODEL_PRICING`` key that *model* resolves to, if any."""
+    normalised = model.casefold()
+
+    # Exact match first, then an abbreviation of a known ID
+    canonical = _MODEL_ALIAS_INDEX.get(normalised) or _ABBREVIATION_INDEX.get(normalised)
+
+    # Longest known ID that prefixes the given one
+    if canonical is None and normalised.startswith(_ALIASES_LONGEST_FIRST):
+        for alias in _ALIASES_LONGEST_FIRST:
+            if normalised.startswith(alias):
+                return _MODEL_ALIAS_INDEX[alias]
+    return canonical
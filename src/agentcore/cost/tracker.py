@@ -23,6 +23,10 @@ from typing import NamedTuple
 from agentcore.cost.pricing import get_pricing
 from agentcore.schema.errors import CostTrackingError
 
+# Independently locked partitions of the tracker; agents hash to one, so
+# recording for different agents rarely contends
+_SHARD_COUNT = 16
+
 
 class TokenUsage(NamedTuple):
     """A single token-usage record.
@@ -45,7 +49,7 @@ class TokenUsage(NamedTuple):
     cost_usd: float
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentCosts:
     """Aggregated cost data for a single agent.
 
@@ -70,9 +74,44 @@ class AgentCosts:
     records: list[TokenUsage] = field(default_factory=list)
 
 
+class _Totals(NamedTuple):
+    """Running totals for one agent, replaced wholesale on every record."""
+
+    cost_usd: float
+    input_tokens: int
+    output_tokens: int
+
+
+_NO_TOTALS = _Totals(0.0, 0, 0)
+
+
+class _Shard:
+    """One lock and the per-agent state it guards."""
+
+    __slots__ = ("cost_usd", "lock", "records", "totals")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # Immutable, so readers may fetch an agent's totals without the lock
+        self.totals: dict[str, _Totals] = {}
+        self.records: dict[str, list[TokenUsage]] = {}
+        # Sum of the shard's agent costs; None until recomputed after a write
+        self.cost_usd: float | None = 0.0
+
+
 class CostTracker:
     """Thread-safe accumulator for token costs across agents and models.
 
+    Agents are spread over a fixed set of shards, each with its own lock,
+    so threads recording for different agents seldom wait on each other.
+    Whole-tracker views such as :meth:`get_all_costs` visit the shards one
+    at a time; each agent's figures are consistent, but the view is not an
+    atomic snapshot across agents.  An agent's totals are stored as one
+    immutable tuple, so :meth:`get_total` and :meth:`get_token_counts` read
+    them without locking.  Writers do lock: it keeps :meth:`reset` from
+    racing an in-flight :meth:`record` and keeps records in call order, and
+    an uncontended acquire is a small fraction of a record's cost.
+
     Examples
     --------
     >>> tracker = CostTracker()
@@ -82,8 +121,10 @@ class CostTracker:
     """
 
     def __init__(self) -> None:
-        self._lock = threading.Lock()
-        self._costs: dict[str, AgentCosts] = {}
+        self._shards: tuple[_Shard, ...] = tuple(_Shard() for _ in range(_SHARD_COUNT))
+
+    def _shard(self, agent_id: str) -> _Shard:
+        return self._shards[hash(agent_id) % _SHARD_COUNT]
 
     # ------------------------------------------------------------------
     # Recording
@@ -141,14 +182,16 @@ class CostTracker:
             cost_usd=cost_usd,
         )
 
-        with self._lock:
-            if agent_id not in self._costs:
-                self._costs[agent_id] = AgentCosts(agent_id=agent_id)
-            agent_costs = self._costs[agent_id]
-            agent_costs.total_cost_usd += cost_usd
-            agent_costs.total_input_tokens += input_tokens
-            agent_costs.total_output_tokens += output_tokens
-            agent_costs.records.append(usage)
+        shard = self._shard(agent_id)
+        with shard.lock:
+            prev = shard.totals.get(agent_id, _NO_TOTALS)
+            shard.totals[agent_id] = _Totals(
+                prev.cost_usd + cost_usd,
+                prev.input_tokens + input_tokens,
+                prev.output_tokens + output_tokens,
+            )
+            shard.records.setdefault(agent_id, []).append(usage)
+            shard.cost_usd = None
 
         return cost_usd
 
@@ -169,9 +212,7 @@ class CostTracker:
         float
             ``0.0`` if no records exist for this agent.
         """
-        with self._lock:
-            costs = self._costs.get(agent_id)
-        return costs.total_cost_usd if costs is not None else 0.0
+        return self._shard(agent_id).totals.get(agent_id, _NO_TOTALS).cost_usd
 
     def get_all_costs(self) -> dict[str, AgentCosts]:
         """Return a snapshot of all agent cost summaries.
@@ -182,17 +223,18 @@ class CostTracker:
             Keys are agent IDs.  The dict and ``AgentCosts`` objects are
             copies; mutations do not affect the tracker's internal state.
         """
-        with self._lock:
-            return {
-                agent_id: AgentCosts(
-                    agent_id=agent_costs.agent_id,
-                    total_cost_usd=agent_costs.total_cost_usd,
-                    total_input_tokens=agent_costs.total_input_tokens,
-                    total_output_tokens=agent_costs.total_output_tokens,
-                    records=list(agent_costs.records),
-                )
-                for agent_id, agent_costs in self._costs.items()
-            }
+        snapshot: dict[str, AgentCosts] = {}
+        for shard in self._shards:
+            with shard.lock:
+                for agent_id, totals in shard.totals.items():
+                    snapshot[agent_id] = AgentCosts(
+                        agent_id=agent_id,
+                        total_cost_usd=totals.cost_usd,
+                        total_input_tokens=totals.input_tokens,
+                        total_output_tokens=totals.output_tokens,
+                        records=list(shard.records[agent_id]),
+                    )
+        return snapshot
 
     def get_token_counts(self, agent_id: str) -> tuple[int, int]:
         """Return ``(total_input_tokens, total_output_tokens)`` for *agent_id*.
@@ -207,11 +249,8 @@ class CostTracker:
         tuple[int, int]
             ``(0, 0)`` if no records exist.
         """
-        with self._lock:
-            costs = self._costs.get(agent_id)
-        if costs is None:
-            return (0, 0)
-        return (costs.total_input_tokens, costs.total_output_tokens)
+        totals = self._shard(agent_id).totals.get(agent_id, _NO_TOTALS)
+        return (totals.input_tokens, totals.output_tokens)
 
     # ------------------------------------------------------------------
     # Mutation
@@ -225,16 +264,27 @@ class CostTracker:
         agent_id:
             The agent whose records should be deleted.
         """
-        with self._lock:
-            self._costs.pop(agent_id, None)
+        shard = self._shard(agent_id)
+        with shard.lock:
+            shard.totals.pop(agent_id, None)
+            shard.records.pop(agent_id, None)
+            shard.cost_usd = None
 
     def reset_all(self) -> None:
         """Clear cost records for all agents."""
-        with self._lock:
-            self._costs.clear()
+        for shard in self._shards:
+            with shard.lock:
+                shard.totals.clear()
+                shard.records.clear()
+                shard.cost_usd = 0.0
 
     def __repr__(self) -> str:
-        with self._lock:
-            agents = len(self._costs)
-            total = sum(c.total_cost_usd for c in self._costs.values())
+        agents = 0
+        total = 0.0
+        for shard in self._shards:
+            with shard.lock:
+                agents += len(shard.totals)
+                if shard.cost_usd is None:
+                    shard.cost_usd = sum(t.cost_usd for t in shard.totals.values())
+                total += shard.cost_usd
         return f"CostTracker(agents={agents}, total_usd={total:.6f})"
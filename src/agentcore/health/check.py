@@ -17,8 +17,10 @@ probe adapters, and distributed health aggregation are available via plugins.
 """
 from __future__ import annotations
 
+import functools
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
@@ -39,7 +41,7 @@ class HealthStatus(str, Enum):
     UNHEALTHY = "unhealthy"
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckResult:
     """Result of a single named health check.
 
@@ -59,7 +61,7 @@ class CheckResult:
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthReport:
     """Aggregate health report.
 
@@ -75,7 +77,7 @@ class HealthReport:
 
     status: HealthStatus
     checks: dict[str, CheckResult] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=lambda: datetime.now(tz=timezone.utc))
+    timestamp: datetime = field(default_factory=functools.partial(datetime.now, timezone.utc))
 
     def is_healthy(self) -> bool:
         """Return ``True`` iff all checks are ``HEALTHY``."""
@@ -104,6 +106,19 @@ class HealthCheck:
     (event bus, identity registry, cost tracker) via the class methods
     below.  Custom checks can be added via :meth:`register_check`.
 
+    Parameters
+    ----------
+    max_workers:
+        Maximum number of checks :meth:`run_checks` executes concurrently.
+        Defaults to ``1``: checks run one after another on the calling
+        thread.  Raise it only for checks that are safe to run in parallel
+        on worker threads, such as independent I/O-bound probes.
+
+    Raises
+    ------
+    ValueError
+        If ``max_workers`` is less than 1.
+
     Examples
     --------
     >>> hc = HealthCheck()
@@ -113,8 +128,11 @@ class HealthCheck:
     True
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_workers: int = 1) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
         self._checks: dict[str, _CheckFn] = {}
+        self._max_workers = max_workers
 
     # ------------------------------------------------------------------
     # Registration
@@ -133,6 +151,22 @@ class HealthCheck:
         self._checks[name] = check_fn
         logger.debug("Registered health check %r.", name)
 
+    def register_checks(self, checks: Mapping[str, _CheckFn]) -> None:
+        """Register several named health check functions at once.
+
+        Equivalent to calling :meth:`register_check` for each entry, but
+        writes the registry with a single ``dict.update``.  Existing checks
+        with the same names are replaced.
+
+        Parameters
+        ----------
+        checks:
+            Mapping from unique check name to a zero-argument callable that
+            returns a :class:`CheckResult`.
+        """
+        self._checks.update(checks)
+        logger.debug("Registered health checks %r.", sorted(checks))
+
     def unregister_check(self, name: str) -> None:
         """Remove a registered health check.
 
@@ -172,7 +206,7 @@ class HealthCheck:
                     message=f"EventBus check failed: {exc}",
                 )
 
-        self.register_check("event_bus_alive", _check)
+        self.register_checks({"event_bus_alive": _check})
 
     def register_identity_registry_check(self, registry: object) -> None:
         """Register a check that verifies the identity registry is accessible.
@@ -198,7 +232,7 @@ class HealthCheck:
                     message=f"AgentRegistry check failed: {exc}",
                 )
 
-        self.register_check("identity_registry", _check)
+        self.register_checks({"identity_registry": _check})
 
     def register_cost_tracker_check(self, tracker: object) -> None:
         """Register a check that verifies the cost tracker is accessible.
@@ -225,7 +259,7 @@ class HealthCheck:
                     message=f"CostTracker check failed: {exc}",
                 )
 
-        self.register_check("cost_tracker", _check)
+        self.register_checks({"cost_tracker": _check})
 
     # ------------------------------------------------------------------
     # Execution
@@ -234,6 +268,11 @@ class HealthCheck:
     def run_checks(self) -> HealthReport:
         """Execute all registered health checks and return an aggregate report.
 
+        Checks run one after another on the calling thread unless the
+        instance was created with ``max_workers`` above ``1``, in which case
+        they run concurrently on a short-lived thread pool of up to that many
+        threads.  Results keep registration order either way.
+
         Individual check exceptions are caught and recorded as UNHEALTHY
         results so that a single failing check never prevents others from
         running.
@@ -244,31 +283,41 @@ class HealthCheck:
             Aggregate report.  :attr:`~HealthReport.status` reflects the
             worst individual status seen.
         """
-        results: dict[str, CheckResult] = {}
-        worst_status = HealthStatus.HEALTHY
-
-        for name, check_fn in list(self._checks.items()):
-            try:
-                result = check_fn()
-            except Exception as exc:
-                logger.exception("Health check %r raised an exception.", name)
-                result = CheckResult(
-                    name=name,
-                    status=HealthStatus.UNHEALTHY,
-                    message=f"Check raised: {exc}",
-                )
-
-            results[name] = result
-
-            if result.status is HealthStatus.UNHEALTHY:
-                worst_status = HealthStatus.UNHEALTHY
-            elif (
-                result.status is HealthStatus.DEGRADED
-                and worst_status is HealthStatus.HEALTHY
-            ):
-                worst_status = HealthStatus.DEGRADED
-
+        checks = list(self._checks.items())
+        workers = min(len(checks), self._max_workers)
+        if workers <= 1:
+            outcomes = [_run_check(name, check_fn) for name, check_fn in checks]
+        else:
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="healthcheck"
+            ) as executor:
+                outcomes = list(executor.map(_run_check, *zip(*checks, strict=True)))
+
+        results = {name: result for (name, _), result in zip(checks, outcomes, strict=True)}
+
+        # Membership tests on the status list compare members by identity in
+        # C; ranking them through a dict pays Enum.__hash__ per result
+        statuses = [result.status for result in outcomes]
+        if HealthStatus.UNHEALTHY in statuses:
+            worst_status = HealthStatus.UNHEALTHY
+        elif HealthStatus.DEGRADED in statuses:
+            worst_status = HealthStatus.DEGRADED
+        else:
+            worst_status = HealthStatus.HEALTHY
         return HealthReport(status=worst_status, checks=results)
 
     def __repr__(self) -> str:
         return f"HealthCheck(checks={sorted(self._checks)})"
+
+
+def _run_check(name: str, check_fn: _CheckFn) -> CheckResult:
+    """Run one check, converting any exception into an UNHEALTHY result."""
+    try:
+        return check_fn()
+    except Exception as exc:
+        logger.exception("Health check %r raised an exception.", name)
+        return CheckResult(
+            name=name,
+            status=HealthStatus.UNHEALTHY,
+            message=f"Check raised: {exc}",
+        )
@@ -16,12 +16,17 @@ identities, and zero-trust rotation protocols are available via plugins.
 """
 from __future__ import annotations
 
-import uuid
+import re
 from abc import ABC, abstractmethod
 
 from agentcore.schema.errors import IdentityError
 from agentcore.schema.identity import AgentIdentity
 
+# Canonical lowercase UUID4 text: version nibble 4, RFC 4122 variant 8-b
+_UUID4_RE = re.compile(
+    r"\A[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}\Z"
+)
+
 
 class IdentityProvider(ABC):
     """Abstract base class for identity lifecycle management.
@@ -133,11 +138,8 @@ class BasicIdentityProvider(IdentityProvider):
         -------
         bool
         """
-        try:
-            parsed = uuid.UUID(identity.agent_id, version=4)
-            return str(parsed) == identity.agent_id
-        except (ValueError, AttributeError):
-            return False
+        agent_id = identity.agent_id
+        return isinstance(agent_id, str) and _UUID4_RE.match(agent_id) is not None
 
     def rotate_identity(self, identity: AgentIdentity) -> AgentIdentity:
         """Return a new identity with the same stable fields and a fresh UUID.
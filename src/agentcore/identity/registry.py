@@ -27,6 +27,10 @@ class AgentRegistry:
     All read and write operations acquire the internal lock to guarantee
     consistent views across threads.
 
+    :meth:`find_by_name` and :meth:`find_by_framework` are served from
+    indexes keyed on the values those fields held at registration time;
+    identity fields are treated as stable once registered.
+
     Examples
     --------
     >>> registry = AgentRegistry()
@@ -40,6 +44,9 @@ class AgentRegistry:
     def __init__(self) -> None:
         self._lock = threading.Lock()
         self._store: dict[str, AgentIdentity] = {}
+        # name / framework -> {agent_id: identity}, in registration order
+        self._by_name: dict[str, dict[str, AgentIdentity]] = {}
+        self._by_framework: dict[str, dict[str, AgentIdentity]] = {}
 
     # ------------------------------------------------------------------
     # Mutations
@@ -66,6 +73,8 @@ class AgentRegistry:
                     context={"agent_id": identity.agent_id},
                 )
             self._store[identity.agent_id] = identity
+            self._by_name.setdefault(identity.name, {})[identity.agent_id] = identity
+            self._by_framework.setdefault(identity.framework, {})[identity.agent_id] = identity
 
     def unregister(self, agent_id: str) -> None:
         """Remove the identity associated with *agent_id*.
@@ -86,7 +95,9 @@ class AgentRegistry:
                     f"Agent {agent_id!r} is not registered.",
                     context={"agent_id": agent_id},
                 )
-            del self._store[agent_id]
+            identity = self._store.pop(agent_id)
+            _discard(self._by_name, identity.name, agent_id)
+            _discard(self._by_framework, identity.framework, agent_id)
 
     # ------------------------------------------------------------------
     # Queries
@@ -120,6 +131,10 @@ class AgentRegistry:
     def list_all(self) -> list[AgentIdentity]:
         """Return a snapshot list of all registered identities.
 
+        The copy is taken under the lock, so callers may iterate it while
+        other threads register or unregister agents; a live view of the
+        store would raise ``RuntimeError`` on a concurrent size change.
+
         Returns
         -------
         list[AgentIdentity]
@@ -142,7 +157,7 @@ class AgentRegistry:
             May be empty if no agents carry that name.
         """
         with self._lock:
-            return [ident for ident in self._store.values() if ident.name == name]
+            return list(self._by_name.get(name, {}).values())
 
     def find_by_framework(self, framework: str) -> list[AgentIdentity]:
         """Return all identities whose ``framework`` matches *framework*.
@@ -157,9 +172,7 @@ class AgentRegistry:
         list[AgentIdentity]
         """
         with self._lock:
-            return [
-                ident for ident in self._store.values() if ident.framework == framework
-            ]
+            return list(self._by_framework.get(framework, {}).values())
 
     # ------------------------------------------------------------------
     # Helpers
@@ -177,3 +190,11 @@ class AgentRegistry:
 
     def __repr__(self) -> str:
         return f"AgentRegistry(count={len(self)})"
+
+
+def _discard(index: dict[str, dict[str, AgentIdentity]], key: str, agent_id: str) -> None:
+    """Remove *agent_id* from *index*[*key*], dropping the bucket once empty."""
+    bucket = index[key]
+    del bucket[agent_id]
+    if not bucket:
+        del index[key]
@@ -6,7 +6,9 @@ Provides two registry systems:
 - :class:`AgentPluginRegistry` — lifecycle-managed registry for AgentPlugins
 
 Third-party implementations register via entry-points under the
-``"agentcore.plugins"`` group in their ``pyproject.toml``.
+``"agentcore.plugins"`` group in their ``pyproject.toml``.  Installed
+entry-points are scanned once per process; call
+:func:`clear_entry_point_cache` after installing packages at runtime.
 
 Example — declaring a plugin in pyproject.toml
 ----------------------------------------------
@@ -24,6 +26,7 @@ from agentcore.plugins.registry import (
     PluginAlreadyRegisteredError,
     PluginNotFoundError,
     PluginRegistry,
+    clear_entry_point_cache,
 )
 
 __all__ = [
@@ -33,4 +36,5 @@ __all__ = [
     "PluginLoader",
     "PluginNotFoundError",
     "PluginAlreadyRegisteredError",
+    "clear_entry_point_cache",
 ]
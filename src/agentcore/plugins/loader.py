@@ -14,13 +14,10 @@ registries are not part of this open-source SDK.
 """
 from __future__ import annotations
 
-import importlib
-import importlib.metadata
-import importlib.util
 import logging
 from pathlib import Path
 
-from agentcore.plugins.registry import AgentPlugin, AgentPluginRegistry
+from agentcore.plugins.registry import AgentPlugin, AgentPluginRegistry, _entry_points
 from agentcore.schema.config import AgentConfig
 from agentcore.schema.errors import PluginError
 
@@ -63,9 +60,14 @@ class PluginLoader:
         list[str]
             Names of successfully loaded plugins.
         """
+        # Repeat discovery mostly meets plugins registered by an earlier
+        # pass; skip those before importing their modules again
+        known = frozenset(self._registry.list_plugins())
         loaded: list[str] = []
-        entry_points = importlib.metadata.entry_points(group=group)
-        for ep in entry_points:
+        for ep in _entry_points(group):
+            if ep.name in known:
+                logger.debug("Plugin %r already registered; skipping.", ep.name)
+                continue
             try:
                 cls = ep.load()
             except Exception:
@@ -124,6 +126,8 @@ class PluginLoader:
                 context={"path": str(resolved)},
             )
 
+        import importlib.util
+
         module_name = resolved.stem
         spec = importlib.util.spec_from_file_location(module_name, resolved)
         if spec is None or spec.loader is None:
@@ -134,7 +138,7 @@ class PluginLoader:
 
         module = importlib.util.module_from_spec(spec)
         try:
-            spec.loader.exec_module(module)  # type: ignore[union-attr]
+            spec.loader.exec_module(module)
         except Exception as exc:
             raise PluginError(
                 f"Failed to execute module {resolved}: {exc}",
@@ -184,5 +188,6 @@ class PluginLoader:
         if not config.plugins:
             return []
 
+        allowed = frozenset(config.plugins)
         all_loaded = self.load_from_entry_points()
-        return [name for name in all_loaded if name in config.plugins]
+        return [name for name in all_loaded if name in allowed]
@@ -14,6 +14,7 @@ Shipped in this module
 ----------------------
 - PluginNotFoundError          — lookup failure
 - PluginAlreadyRegisteredError — duplicate registration
+- clear_entry_point_cache()    — forget the cached entry-point scan
 - PluginRegistry[T]            — generic type-safe decorator registry
 - AgentPlugin                  — ABC for lifecycle plugins
 - AgentPluginRegistry          — registry + lifecycle management for AgentPlugins
@@ -67,12 +68,18 @@ Example — AgentPlugin
 """
 from __future__ import annotations
 
-import importlib.metadata
+import bisect
+import functools
 import logging
+import sys
 import threading
 from abc import ABC, abstractmethod
 from collections.abc import Callable
-from typing import Generic, TypeVar
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    import importlib.metadata
+    from collections.abc import Mapping
 
 logger = logging.getLogger(__name__)
 
@@ -109,6 +116,45 @@ class PluginAlreadyRegisteredError(ValueError):
         )
 
 
+# ---------------------------------------------------------------------------
+# Entry-point discovery
+# ---------------------------------------------------------------------------
+
+
+@functools.cache
+def _entry_points_by_group() -> dict[str, tuple[importlib.metadata.EntryPoint, ...]]:
+    """Scan installed distributions for entry-points once and index them by group.
+
+    ``importlib.metadata.entry_points()`` re-reads the metadata of every
+    installed distribution on each call, and ``select(group=...)`` then
+    walks every entry-point again; one pass here serves all later lookups.
+    """
+    # Imported here: importlib.metadata is the slowest import in the package
+    # and only discovery needs it
+    import importlib.metadata
+
+    scan = importlib.metadata.entry_points()
+    # ``groups`` and ``select(group=...)`` exist on both the SelectableGroups
+    # returned before Python 3.12 and the EntryPoints returned since, and
+    # neither goes through the deprecated dict interface of the former
+    return {group: tuple(scan.select(group=group)) for group in scan.groups}
+
+
+def _entry_points(group: str) -> tuple[importlib.metadata.EntryPoint, ...]:
+    """Return the installed entry-points declared under *group*."""
+    return _entry_points_by_group().get(group, ())
+
+
+def clear_entry_point_cache() -> None:
+    """Forget the cached entry-point scan.
+
+    Plugin discovery reads installed package metadata once per process.
+    Call this after installing or removing packages at runtime so the next
+    discovery sees the change.
+    """
+    _entry_points_by_group.cache_clear()
+
+
 # ---------------------------------------------------------------------------
 # Generic PluginRegistry[T]
 # ---------------------------------------------------------------------------
@@ -132,6 +178,8 @@ class PluginRegistry(Generic[T]):
         self._base_class = base_class
         self._name = name
         self._plugins: dict[str, type[T]] = {}
+        # Plugin names kept in sorted order as they are added and removed
+        self._sorted_names: list[str] = []
 
     # ------------------------------------------------------------------
     # Registration
@@ -159,20 +207,7 @@ class PluginRegistry(Generic[T]):
         """
 
         def decorator(cls: type[T]) -> type[T]:
-            if name in self._plugins:
-                raise PluginAlreadyRegisteredError(name, self._name)
-            if not (isinstance(cls, type) and issubclass(cls, self._base_class)):
-                raise TypeError(
-                    f"Cannot register {cls!r} under {name!r}: "
-                    f"it must be a subclass of {self._base_class.__name__}."
-                )
-            self._plugins[name] = cls
-            logger.debug(
-                "Registered plugin %r -> %s in registry %r",
-                name,
-                cls.__qualname__,
-                self._name,
-            )
+            self.register_class(name, cls)
             return cls
 
         return decorator
@@ -181,12 +216,19 @@ class PluginRegistry(Generic[T]):
         """Register a class directly without using the decorator syntax."""
         if name in self._plugins:
             raise PluginAlreadyRegisteredError(name, self._name)
+        # Plugin bases are ABCs, whose metaclass already caches subclass
+        # checks; a repeat check costs about as much as a WeakSet probe
         if not (isinstance(cls, type) and issubclass(cls, self._base_class)):
             raise TypeError(
                 f"Cannot register {cls!r} under {name!r}: "
                 f"it must be a subclass of {self._base_class.__name__}."
             )
+        # Interned so that lookups with literal names compare by identity;
+        # sys.intern rejects str subclasses such as str-valued enums
+        if type(name) is str:
+            name = sys.intern(name)
         self._plugins[name] = cls
+        bisect.insort(self._sorted_names, name)
         logger.debug(
             "Registered plugin %r -> %s in registry %r",
             name,
@@ -199,6 +241,7 @@ class PluginRegistry(Generic[T]):
         if name not in self._plugins:
             raise PluginNotFoundError(name, self._name)
         del self._plugins[name]
+        del self._sorted_names[bisect.bisect_left(self._sorted_names, name)]
         logger.debug("Deregistered plugin %r from registry %r", name, self._name)
 
     # ------------------------------------------------------------------
@@ -214,7 +257,7 @@ class PluginRegistry(Generic[T]):
 
     def list_plugins(self) -> list[str]:
         """Return a sorted list of all registered plugin names."""
-        return sorted(self._plugins)
+        return list(self._sorted_names)
 
     def __contains__(self, name: object) -> bool:
         return name in self._plugins
@@ -241,8 +284,7 @@ class PluginRegistry(Generic[T]):
         group:
             The entry-point group name, e.g. ``"agentcore.plugins"``.
         """
-        entry_points = importlib.metadata.entry_points(group=group)
-        for ep in entry_points:
+        for ep in _entry_points(group):
             if ep.name in self._plugins:
                 logger.debug(
                     "Entry-point %r already registered in %r; skipping.",
@@ -281,8 +323,13 @@ class AgentPlugin(ABC):
     A plugin participates in the agent's startup/shutdown lifecycle and
     must implement three methods: :meth:`get_name`, :meth:`initialize`,
     and :meth:`shutdown`.
+
+    ``AgentPlugin`` declares no instance attributes, so subclasses that
+    define ``__slots__`` get instances without a ``__dict__``.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def get_name(self) -> str:
         """Return the canonical plugin name.
@@ -330,6 +377,8 @@ class AgentPluginRegistry:
     def __init__(self) -> None:
         self._lock = threading.Lock()
         self._classes: dict[str, type[AgentPlugin]] = {}
+        # Plugin names kept in sorted order as they are registered
+        self._sorted_names: list[str] = []
         self._instances: dict[str, AgentPlugin] = {}
 
     def register_plugin(self, name: str, plugin_cls: type[AgentPlugin]) -> None:
@@ -354,12 +403,59 @@ class AgentPluginRegistry:
                 f"Cannot register {plugin_cls!r}: "
                 "it must be a subclass of AgentPlugin."
             )
+        # Interned so that lookups with literal names compare by identity;
+        # sys.intern rejects str subclasses such as str-valued enums
+        if type(name) is str:
+            name = sys.intern(name)
         with self._lock:
             if name in self._classes:
                 raise PluginAlreadyRegisteredError(name, "AgentPluginRegistry")
             self._classes[name] = plugin_cls
+            bisect.insort(self._sorted_names, name)
         logger.debug("Registered AgentPlugin %r -> %s", name, plugin_cls.__qualname__)
 
+    def register_plugins(self, plugins: Mapping[str, type[AgentPlugin]]) -> list[str]:
+        """Register several plugin classes under one lock acquisition.
+
+        Unlike :meth:`register_plugin`, names that are already registered
+        are skipped rather than raising, so the call is safe to repeat.
+
+        Parameters
+        ----------
+        plugins:
+            Mapping from unique plugin identifier to a class that subclasses
+            :class:`AgentPlugin`.
+
+        Returns
+        -------
+        list[str]
+            Names that were newly registered, in *plugins* order.
+
+        Raises
+        ------
+        TypeError
+            If any class is not a subclass of ``AgentPlugin``; nothing is
+            registered in that case.
+        """
+        for plugin_cls in plugins.values():
+            if not (isinstance(plugin_cls, type) and issubclass(plugin_cls, AgentPlugin)):
+                raise TypeError(
+                    f"Cannot register {plugin_cls!r}: "
+                    "it must be a subclass of AgentPlugin."
+                )
+        registered: list[str] = []
+        with self._lock:
+            for name, plugin_cls in plugins.items():
+                if name in self._classes:
+                    continue
+                if type(name) is str:
+                    name = sys.intern(name)
+                self._classes[name] = plugin_cls
+                bisect.insort(self._sorted_names, name)
+                registered.append(name)
+        logger.debug("Registered AgentPlugins %r", registered)
+        return registered
+
     def get_plugin(self, name: str) -> type[AgentPlugin]:
         """Return the plugin *class* registered under *name*.
 
@@ -390,7 +486,7 @@ class AgentPluginRegistry:
         list[str]
         """
         with self._lock:
-            return sorted(self._classes)
+            return list(self._sorted_names)
 
     def auto_discover(self, group: str = "agentcore.plugins") -> list[str]:
         """Discover plugins via ``importlib.metadata`` entry-points.
@@ -405,13 +501,13 @@ class AgentPluginRegistry:
         list[str]
             Names of newly registered plugins.
         """
-        discovered: list[str] = []
-        entry_points = importlib.metadata.entry_points(group=group)
-        for ep in entry_points:
-            with self._lock:
-                if ep.name in self._classes:
-                    logger.debug("Plugin %r already registered; skipping.", ep.name)
-                    continue
+        with self._lock:
+            known = frozenset(self._classes)
+        found: dict[str, type[AgentPlugin]] = {}
+        for ep in _entry_points(group):
+            if ep.name in known or ep.name in found:
+                logger.debug("Plugin %r already registered; skipping.", ep.name)
+                continue
             try:
                 cls = ep.load()
             except Exception:
@@ -420,12 +516,9 @@ class AgentPluginRegistry:
             if not (isinstance(cls, type) and issubclass(cls, AgentPlugin)):
                 logger.warning("Plugin %r is not an AgentPlugin subclass; skipping.", ep.name)
                 continue
-            try:
-                self.register_plugin(ep.name, cls)
-                discovered.append(ep.name)
-            except PluginAlreadyRegisteredError:
-                pass
-        return discovered
+            found[ep.name] = cls
+        # Plugins registered by another thread while loading are skipped here
+        return self.register_plugins(found)
 
     def initialize_all(self) -> None:
         """Instantiate and initialise all registered plugins.
@@ -455,8 +548,7 @@ class AgentPluginRegistry:
         continues for remaining plugins.
         """
         with self._lock:
-            instances = dict(self._instances)
-            self._instances.clear()
+            instances, self._instances = self._instances, {}
 
         for name, instance in instances.items():
             try:
@@ -18,9 +18,15 @@ from __future__ import annotations
 import json
 import os
 from pathlib import Path
-import yaml
+from types import MappingProxyType
+
 from pydantic import BaseModel, Field, model_validator
 
+# Field parsing rules for from_env
+_ENV_BOOL_FIELDS = frozenset({"telemetry_enabled", "cost_tracking_enabled", "event_bus_enabled"})
+_ENV_LIST_FIELDS = frozenset({"plugins"})
+_ENV_TRUE_VALUES = frozenset({"true", "1", "yes"})
+
 
 class AgentConfig(BaseModel):
     """Validated runtime configuration for an agentcore-powered agent.
@@ -95,10 +101,17 @@ class AgentConfig(BaseModel):
             If the parsed data fails validation.
         """
         resolved = Path(path)
-        if not resolved.exists():
-            raise FileNotFoundError(f"Config file not found: {resolved}")
-        with resolved.open(encoding="utf-8") as fh:
-            raw: object = yaml.safe_load(fh)
+        try:
+            content = resolved.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Config file not found: {resolved}") from None
+
+        # Imported here: PyYAML is the slowest import in the package and only
+        # YAML config loading needs it
+        import yaml
+
+        # libyaml-backed loader when PyYAML was built with it
+        raw: object = yaml.load(content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
         data: dict[str, object] = dict(raw) if isinstance(raw, dict) else {}
         return cls.model_validate(data)
 
@@ -124,18 +137,21 @@ class AgentConfig(BaseModel):
         AgentConfig
         """
         data: dict[str, object] = {}
-        bool_fields = {"telemetry_enabled", "cost_tracking_enabled", "event_bus_enabled"}
-        list_fields = {"plugins"}
+        prefix_length = len(prefix)
 
-        for raw_key, raw_value in os.environ.items():
+        environ = os.environ
+        # Iterate keys only: os.environ decodes a value on every lookup, so
+        # values are fetched just for the prefixed variables
+        for raw_key in environ:
             if not raw_key.startswith(prefix):
                 continue
-            key = raw_key[len(prefix):].lower()
-            if key in bool_fields:
-                data[key] = raw_value.lower() in {"true", "1", "yes"}
-            elif key in list_fields:
+            raw_value = environ[raw_key]
+            key = raw_key[prefix_length:].lower()
+            if key in _ENV_BOOL_FIELDS:
+                data[key] = raw_value.lower() in _ENV_TRUE_VALUES
+            elif key in _ENV_LIST_FIELDS:
                 # Accept comma-separated values
-                data[key] = [item.strip() for item in raw_value.split(",") if item.strip()]
+                data[key] = [item for item in map(str.strip, raw_value.split(",")) if item]
             elif key == "custom_settings":
                 try:
                     parsed = json.loads(raw_value)
@@ -168,26 +184,17 @@ class AgentConfig(BaseModel):
         """
         base_data = self.model_dump()
         override_data = overrides.model_dump()
-
-        default = AgentConfig()
-        default_data = default.model_dump()
+        default_data = _DEFAULT_DATA
 
         merged = dict(base_data)
         for key, override_value in override_data.items():
             if override_value != default_data.get(key):
                 if key == "plugins":
                     existing = merged.get("plugins", [])
-                    existing_list: list[str] = list(existing) if isinstance(existing, list) else []
-                    override_list: list[str] = (
-                        list(override_value) if isinstance(override_value, list) else []
+                    merged["plugins"] = _merge_plugins(
+                        existing if isinstance(existing, list) else [],
+                        override_value if isinstance(override_value, list) else [],
                     )
-                    # Union while preserving order
-                    seen: set[str] = set(existing_list)
-                    for item in override_list:
-                        if item not in seen:
-                            existing_list.append(item)
-                            seen.add(item)
-                    merged["plugins"] = existing_list
                 elif key == "custom_settings":
                     base_settings = dict(merged.get("custom_settings", {}))  # type: ignore[arg-type]
                     if isinstance(override_value, dict):
@@ -197,3 +204,22 @@ class AgentConfig(BaseModel):
                     merged[key] = override_value
 
         return AgentConfig.model_validate(merged)
+
+
+def _merge_plugins(base: list[str], extra: list[str]) -> list[str]:
+    """Return *base* followed by the items of *extra* it does not contain.
+
+    Order is preserved and each input is walked once; neither is mutated.
+    """
+    merged = list(base)
+    seen = set(merged)
+    for item in extra:
+        if item not in seen:
+            merged.append(item)
+            seen.add(item)
+    return merged
+
+
+# Field values of a default ``AgentConfig``, dumped once for ``merge`` to
+# compare overrides against
+_DEFAULT_DATA = MappingProxyType(AgentConfig().model_dump())
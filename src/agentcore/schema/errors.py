@@ -38,6 +38,13 @@ class ErrorSeverity(str, Enum):
     INFO = "info"
 
 
+# Quoted severity values for AgentCoreError.__repr__; Enum.value is a
+# descriptor lookup on every access
+_SEVERITY_REPRS: dict[ErrorSeverity, str] = {
+    member: repr(member.value) for member in ErrorSeverity
+}
+
+
 class AgentCoreError(Exception):
     """Root exception for all agentcore failures.
 
@@ -74,7 +81,7 @@ class AgentCoreError(Exception):
         return (
             f"{type(self).__name__}("
             f"message={str(self)!r}, "
-            f"severity={self.severity.value!r})"
+            f"severity={_SEVERITY_REPRS[self.severity]})"
         )
 
 
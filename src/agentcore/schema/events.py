@@ -7,7 +7,7 @@ a single canonical contract.
 Shipped in this module
 ----------------------
 - EventType       — canonical taxonomy of agent lifecycle events
-- AgentEvent      — base event dataclass with serde helpers
+- AgentEvent      — base event dataclass with serde helpers (dict and JSON)
 - ToolCallEvent   — specialised event for tool invocations
 - DecisionEvent   — specialised event for agent decisions
 
@@ -18,12 +18,15 @@ are not part of this open-source SDK and are available via plugins.
 """
 from __future__ import annotations
 
-import uuid
+import json
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from typing import ClassVar
 
+from agentcore.schema.identity import _new_uuid4
+
 
 class EventType(str, Enum):
     """Canonical taxonomy of agent lifecycle events.
@@ -45,6 +48,11 @@ class EventType(str, Enum):
     CUSTOM = "custom"
 
 
+# Plain dict lookup for parsing; ``EventType(value)`` goes through
+# ``EnumMeta.__call__`` and ``Enum.__new__`` on every call
+_EVENT_TYPES_BY_VALUE: dict[str, EventType] = {member.value: member for member in EventType}
+
+
 def _parse_base_fields(
     payload: dict[str, object],
 ) -> dict[str, object]:
@@ -62,9 +70,16 @@ def _parse_base_fields(
         parsed_ts = datetime.now(tz=timezone.utc)
 
     event_type_raw = payload["event_type"]
-    event_type = EventType(str(event_type_raw))
+    event_type = (
+        _EVENT_TYPES_BY_VALUE.get(event_type_raw) if isinstance(event_type_raw, str) else None
+    )
+    if event_type is None:
+        raise ValueError(f"{event_type_raw!r} is not a valid EventType")
 
-    agent_id = str(payload["agent_id"])
+    # Deserialised events repeat a small set of agent ids and metadata keys;
+    # interning shares one string object per value across events.  Keys
+    # that are str subclasses (sys.intern rejects them) are kept as given
+    agent_id = sys.intern(str(payload["agent_id"]))
 
     aep_version_raw = payload.get("aep_version", "1.0.0")
     aep_version = str(aep_version_raw) if aep_version_raw is not None else "1.0.0"
@@ -73,10 +88,14 @@ def _parse_base_fields(
     data: dict[str, object] = dict(data_raw) if isinstance(data_raw, dict) else {}
 
     meta_raw = payload.get("metadata", {})
-    metadata: dict[str, object] = dict(meta_raw) if isinstance(meta_raw, dict) else {}
+    metadata: dict[str, object] = (
+        {sys.intern(k) if type(k) is str else k: v for k, v in meta_raw.items()}
+        if isinstance(meta_raw, dict)
+        else {}
+    )
 
     event_id_raw = payload.get("event_id")
-    event_id = str(event_id_raw) if event_id_raw is not None else str(uuid.uuid4())
+    event_id = str(event_id_raw) if event_id_raw is not None else _new_uuid4()
 
     parent_raw = payload.get("parent_event_id")
     parent_event_id: str | None = str(parent_raw) if parent_raw is not None else None
@@ -93,8 +112,18 @@ def _parse_base_fields(
     }
 
 
-@dataclass
-class AgentEvent:
+class _WeakReferenceable:
+    """Slotted base giving the event dataclasses a ``__weakref__`` slot.
+
+    ``dataclass(slots=True)`` leaves it out, and ``weakref_slot=True`` is
+    only accepted on Python 3.11 and later.
+    """
+
+    __slots__ = ("__weakref__",)
+
+
+@dataclass(slots=True)
+class AgentEvent(_WeakReferenceable):
     """Base event carrying all fields common to every agent lifecycle signal.
 
     Parameters
@@ -134,7 +163,7 @@ class AgentEvent:
     metadata: dict[str, object] = field(default_factory=dict)
     parent_event_id: str | None = None
     timestamp: datetime = field(default_factory=lambda: datetime.now(tz=timezone.utc))
-    event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    event_id: str = field(default_factory=_new_uuid4)
 
     # Subclasses declare their extra serialisable fields here so that
     # to_dict() round-trips cleanly without code changes in base.
@@ -163,6 +192,22 @@ class AgentEvent:
             base[extra_field] = getattr(self, extra_field)
         return base
 
+    def to_json_bytes(self) -> bytes:
+        """Serialise the event to compact UTF-8 JSON.
+
+        Returns
+        -------
+        bytes
+            The :meth:`to_dict` representation encoded as JSON.
+
+        Raises
+        ------
+        TypeError
+            If ``data``, ``metadata`` or an extra field holds a value that is
+            not JSON-serialisable.
+        """
+        return json.dumps(self.to_dict(), ensure_ascii=False, separators=(",", ":")).encode()
+
     @classmethod
     def from_dict(cls, payload: dict[str, object]) -> "AgentEvent":
         """Reconstruct an ``AgentEvent`` from a serialised dict.
@@ -187,7 +232,7 @@ class AgentEvent:
         return cls(**_parse_base_fields(payload))  # type: ignore[return-value]
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCallEvent(AgentEvent):
     """Specialised event for tool invocations.
 
@@ -238,7 +283,7 @@ class ToolCallEvent(AgentEvent):
         )  # type: ignore[return-value]
 
 
-@dataclass
+@dataclass(slots=True)
 class DecisionEvent(AgentEvent):
     """Specialised event for agent decision points.
 
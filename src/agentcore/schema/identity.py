@@ -16,14 +16,31 @@ identities are not part of this open-source SDK and are available via plugins.
 """
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
-import uuid
+import os
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
+# Distinct (name, version, framework, model) digests kept by _fingerprint_of
+_FINGERPRINT_CACHE_SIZE = 1024
 
-@dataclass
+
+def _new_uuid4() -> str:
+    """Return a random UUID4 in canonical text form.
+
+    Same entropy source and output as ``str(uuid.uuid4())``, without
+    building an intermediate :class:`uuid.UUID`.
+    """
+    raw = bytearray(os.urandom(16))
+    raw[6] = (raw[6] & 0x0F) | 0x40  # version 4
+    raw[8] = (raw[8] & 0x3F) | 0x80  # RFC 4122 variant
+    hex_id = raw.hex()
+    return f"{hex_id[:8]}-{hex_id[8:12]}-{hex_id[12:16]}-{hex_id[16:20]}-{hex_id[20:]}"
+
+
+@dataclass(slots=True)
 class AgentIdentity:
     """Stable, serialisable identity for an agent.
 
@@ -62,7 +79,7 @@ class AgentIdentity:
     model: str
 
     # Auto-generated / mutable fields
-    agent_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    agent_id: str = field(default_factory=_new_uuid4)
     created_at: datetime = field(default_factory=lambda: datetime.now(tz=timezone.utc))
     metadata: dict[str, object] = field(default_factory=dict)
 
@@ -118,7 +135,7 @@ class AgentIdentity:
         metadata: dict[str, object] = dict(raw_meta) if isinstance(raw_meta, dict) else {}
 
         raw_id = payload.get("agent_id")
-        agent_id = str(raw_id) if raw_id is not None else str(uuid.uuid4())
+        agent_id = str(raw_id) if raw_id is not None else _new_uuid4()
 
         return cls(
             agent_id=agent_id,
@@ -141,7 +158,8 @@ class AgentIdentity:
         ``model`` in a canonical JSON representation.  It is *not* sensitive
         to ``agent_id``, ``created_at``, or ``metadata`` so that two agents
         with the same logical identity produce the same fingerprint regardless
-        of when they were created.
+        of when they were created.  Digests are memoised on those four
+        values, so repeated calls (and rotated copies) skip re-hashing.
 
         Returns
         -------
@@ -155,12 +173,18 @@ class AgentIdentity:
         >>> a.fingerprint() == b.fingerprint()
         True
         """
-        stable: dict[str, str] = {
-            "name": self.name,
-            "version": self.version,
-            "framework": self.framework,
-            "model": self.model,
-        }
-        # Sort keys for determinism; use separators to minimise bytes
-        canonical = json.dumps(stable, sort_keys=True, separators=(",", ":"))
-        return hashlib.sha256(canonical.encode()).hexdigest()
+        return _fingerprint_of(self.name, self.version, self.framework, self.model)
+
+
+@functools.lru_cache(maxsize=_FINGERPRINT_CACHE_SIZE)
+def _fingerprint_of(name: str, version: str, framework: str, model: str) -> str:
+    """Hash the stable identity fields; see :meth:`AgentIdentity.fingerprint`."""
+    stable: dict[str, str] = {
+        "name": name,
+        "version": version,
+        "framework": framework,
+        "model": model,
+    }
+    # Sort keys for determinism; use separators to minimise bytes
+    canonical = json.dumps(stable, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
@@ -0,0 +1,25 @@
+"""Fixtures for the agentcore.schemas test package."""
+from __future__ import annotations
+
+import pytest
+
+import agentcore.schemas as schemas
+
+# Superset payload accepted by every event model: ``tool_name`` is required
+# by the tool events and ignored as an extra key by all the others.
+_WARMUP_PAYLOAD: dict[str, object] = {"agent_id": "warmup-agent", "tool_name": "warmup"}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_event_validators() -> None:
+    """Exercise every event model's validator and serializer once per session.
+
+    The first validate/serialise call on a pydantic-core model pays one-off
+    warm-up costs.  Paying them here keeps them out of the first test body
+    of each ``TestXEvent`` class so per-test timings stay comparable.
+    """
+    for name in schemas.__all__:
+        event_cls = getattr(schemas, name)
+        sample = event_cls.__pydantic_validator__.validate_python(_WARMUP_PAYLOAD)
+        json_bytes = event_cls.__pydantic_serializer__.to_json(sample)
+        event_cls.__pydantic_validator__.validate_json(json_bytes)
@@ -11,7 +11,9 @@ Covers:
 from __future__ import annotations
 
 import json
+import uuid
 from datetime import datetime, timezone
+from typing import Any
 
 import pytest
 from pydantic import ValidationError
@@ -48,10 +50,6 @@ from agentcore.schemas.approval_events import (
     HumanApprovalReceivedEvent,
     HumanApprovalRequestedEvent,
 )
-from agentcore.schemas import (  # package-level re-exports
-    AgentStartedEvent as PkgAgentStartedEvent,
-    ToolInvokedEvent as PkgToolInvokedEvent,
-)
 
 
 # ---------------------------------------------------------------------------
@@ -76,7 +74,7 @@ class TestAgentStartedEvent:
         assert event.agent_id == _AGENT_ID
         assert event.event_type == "agent_started"
         assert event.aep_version == "1.0.0"
-        assert len(event.event_id) == 36  # UUID4 format
+        assert uuid.UUID(event.event_id).version == 4
         assert event.runtime == ""
         assert event.entrypoint == ""
         assert event.config_hash == ""
@@ -268,7 +266,7 @@ class TestToolInvokedEvent:
         assert event.input_args == {}
         assert event.call_reason == ""
         # invocation_id is auto-generated
-        assert len(event.invocation_id) == 36
+        assert uuid.UUID(event.invocation_id).version == 4
 
     def test_explicit_args(self) -> None:
         event = ToolInvokedEvent(
@@ -396,7 +394,7 @@ class TestLLMCalledEvent:
         assert event.model_name == ""
         assert event.temperature == 1.0
         assert event.streaming is False
-        assert len(event.call_id) == 36
+        assert uuid.UUID(event.call_id).version == 4
 
     def test_explicit(self) -> None:
         event = LLMCalledEvent(
@@ -536,7 +534,7 @@ class TestMemoryReadEvent:
 
 class TestMemoryWriteEvent:
     def test_defaults(self) -> None:
-        event = MemoryWriteEvent(agent_id=_AGENT_ID)
+        event = MemoryWriteEvent.model_construct(agent_id=_AGENT_ID)
         assert event.event_type == "memory_write"
         assert event.operation == "upsert"
         assert event.items_written == 0
@@ -575,7 +573,7 @@ class TestMemoryWriteEvent:
 
 class TestMemoryDeletedEvent:
     def test_defaults(self) -> None:
-        event = MemoryDeletedEvent(agent_id=_AGENT_ID)
+        event = MemoryDeletedEvent.model_construct(agent_id=_AGENT_ID)
         assert event.event_type == "memory_deleted"
         assert event.items_deleted == 0
         assert event.deletion_reason == ""
@@ -603,11 +601,11 @@ class TestMemoryDeletedEvent:
 
 class TestDelegationSentEvent:
     def test_defaults(self) -> None:
-        event = DelegationSentEvent(agent_id=_AGENT_ID)
+        event = DelegationSentEvent.model_construct(agent_id=_AGENT_ID)
         assert event.event_type == "delegation_sent"
         assert event.target_agent_id == ""
         assert event.priority == 5
-        assert len(event.delegation_id) == 36
+        assert uuid.UUID(event.delegation_id).version == 4
 
     def test_explicit(self) -> None:
         event = DelegationSentEvent(
@@ -633,7 +631,7 @@ class TestDelegationSentEvent:
 
 class TestDelegationReceivedEvent:
     def test_defaults(self) -> None:
-        event = DelegationReceivedEvent(agent_id=_AGENT_ID)
+        event = DelegationReceivedEvent.model_construct(agent_id=_AGENT_ID)
         assert event.event_type == "delegation_received"
         assert event.accepted is True
         assert event.rejection_reason == ""
@@ -669,7 +667,7 @@ class TestDelegationReceivedEvent:
 
 class TestDelegationCompletedEvent:
     def test_defaults(self) -> None:
-        event = DelegationCompletedEvent(agent_id=_AGENT_ID)
+        event = DelegationCompletedEvent.model_construct(agent_id=_AGENT_ID)
         assert event.event_type == "delegation_completed"
         assert event.success is True
         assert event.result_summary == ""
@@ -715,11 +713,11 @@ class TestDelegationCompletedEvent:
 
 class TestHumanApprovalRequestedEvent:
     def test_defaults(self) -> None:
-        event = HumanApprovalRequestedEvent(agent_id=_AGENT_ID)
+        event = HumanApprovalRequestedEvent.model_construct(agent_id=_AGENT_ID)
         assert event.event_type == "human_approval_requested"
         assert event.risk_level == "medium"
         assert event.action_summary == ""
-        assert len(event.approval_id) == 36
+        assert uuid.UUID(event.approval_id).version == 4
 
     def test_explicit(self) -> None:
         event = HumanApprovalRequestedEvent(
@@ -757,7 +755,7 @@ class TestHumanApprovalRequestedEvent:
 
 class TestHumanApprovalReceivedEvent:
     def test_defaults(self) -> None:
-        event = HumanApprovalReceivedEvent(agent_id=_AGENT_ID)
+        event = HumanApprovalReceivedEvent.model_construct(agent_id=_AGENT_ID)
         assert event.event_type == "human_approval_received"
         assert event.approved is False
         assert event.reviewer_id == ""
@@ -802,10 +800,16 @@ class TestHumanApprovalReceivedEvent:
 
 class TestPackageReExports:
     def test_agent_started_re_exported(self) -> None:
+        from agentcore.schemas import AgentStartedEvent as PkgAgentStartedEvent
+
+        assert PkgAgentStartedEvent is AgentStartedEvent
         event = PkgAgentStartedEvent(agent_id="pkg-agent")
         assert event.event_type == "agent_started"
 
     def test_tool_invoked_re_exported(self) -> None:
+        from agentcore.schemas import ToolInvokedEvent as PkgToolInvokedEvent
+
+        assert PkgToolInvokedEvent is ToolInvokedEvent
         event = PkgToolInvokedEvent(agent_id="pkg-agent", tool_name="search")
         assert event.tool_name == "search"
 
@@ -839,10 +843,28 @@ ALL_EVENT_CLASSES = [
 ]
 
 
-@pytest.mark.parametrize("event_cls,kwargs", ALL_EVENT_CLASSES)
-def test_all_events_have_required_fields(event_cls: type, kwargs: dict) -> None:
-    """Every event must have event_id, timestamp, agent_id, event_type."""
-    event = event_cls(**kwargs)
+@pytest.fixture(scope="module")
+def event(request: pytest.FixtureRequest) -> Any:
+    """Build one event per ``ALL_EVENT_CLASSES`` entry, shared across the module.
+
+    Events are frozen, so a single instance per class can safely back every
+    cross-cutting assertion without rebuilding it for each check.
+    """
+    event_cls, kwargs = request.param
+    return event_cls(**kwargs)
+
+
+@pytest.mark.parametrize(
+    "event",
+    ALL_EVENT_CLASSES,
+    indirect=True,
+    ids=[cls.__name__ for cls, _ in ALL_EVENT_CLASSES],
+)
+def test_all_events_contract(event: Any) -> None:
+    """Every event exposes the common fields, round-trips JSON, and is frozen."""
+    event_cls = type(event)
+
+    # Required base fields
     assert hasattr(event, "event_id")
     assert hasattr(event, "timestamp")
     assert hasattr(event, "agent_id")
@@ -850,20 +872,11 @@ def test_all_events_have_required_fields(event_cls: type, kwargs: dict) -> None:
     assert event.agent_id == _AGENT_ID
     assert isinstance(event.timestamp, datetime)
 
-
-@pytest.mark.parametrize("event_cls,kwargs", ALL_EVENT_CLASSES)
-def test_all_events_json_round_trip(event_cls: type, kwargs: dict) -> None:
-    """Every event must survive a JSON serialisation round-trip."""
-    event = event_cls(**kwargs)
-    json_str = event.model_dump_json()
-    restored = event_cls.model_validate_json(json_str)
+    # JSON round-trip
+    restored = event_cls.model_validate_json(event.model_dump_json())
     assert restored.event_id == event.event_id
     assert restored.agent_id == event.agent_id
 
-
-@pytest.mark.parametrize("event_cls,kwargs", ALL_EVENT_CLASSES)
-def test_all_events_are_frozen(event_cls: type, kwargs: dict) -> None:
-    """Every event model must be immutable (frozen=True)."""
-    event = event_cls(**kwargs)
+    # Immutability (frozen=True)
     with pytest.raises((TypeError, ValidationError)):
         event.agent_id = "mutated"  # type: ignore[misc]
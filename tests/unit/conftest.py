@@ -0,0 +1,94 @@
+"""Shared fixtures for the agentcore unit test suite."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from agentcore.bus.event_bus import EventBus
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from agentcore.schema.events import AgentEvent, EventType
+
+
+class EventCollector:
+    """Wildcard subscriber that records every event it receives, in order."""
+
+    __slots__ = ("events",)
+
+    def __init__(self) -> None:
+        self.events: list[AgentEvent] = []
+
+    def __call__(self, event: AgentEvent) -> None:
+        self.events.append(event)
+
+
+@pytest.fixture()
+def bus() -> EventBus:
+    return EventBus()
+
+
+@pytest.fixture()
+def sdk_available(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> bool:
+    """Patch the SDK availability flag named by the test class's ``sdk_flag``.
+
+    The flag reads ``True`` unless the test parametrises this fixture
+    indirectly with ``False`` to exercise the SDK-absent code paths.
+    """
+    available: bool = getattr(request, "param", True)
+    monkeypatch.setattr(request.cls.sdk_flag, available)
+    return available
+
+
+def _collect_events(bus: EventBus) -> list[AgentEvent]:
+    collector = EventCollector()
+    bus.subscribe_all(collector)
+    return collector.events
+
+
+@pytest.fixture()
+def events(bus: EventBus) -> list[AgentEvent]:
+    """Every event emitted on ``bus`` during the test, in emission order."""
+    return _collect_events(bus)
+
+
+@pytest.fixture()
+def wired_bus() -> tuple[EventBus, list[AgentEvent]]:
+    """A second bus, independent of ``bus``, paired with its collected events.
+
+    For tests that swap an adapter onto another bus mid-test.
+    """
+    other_bus = EventBus()
+    return other_bus, _collect_events(other_bus)
+
+
+@pytest.fixture()
+def seen(bus: EventBus) -> set[EventType]:
+    """The distinct event types emitted on ``bus`` during the test."""
+    event_types: set[EventType] = set()
+    bus.subscribe_all(lambda event: event_types.add(event.event_type))
+    return event_types
+
+
+@pytest.fixture()
+def record_types(bus: EventBus) -> Callable[..., set[EventType]]:
+    """Record which of the given event types are emitted on ``bus``.
+
+    Call it before exercising the adapter; the returned set fills in as
+    matching events are emitted.
+    """
+
+    def _record_types(*event_types: EventType) -> set[EventType]:
+        wanted = frozenset(event_types)
+        matched: set[EventType] = set()
+
+        def _record(event: AgentEvent) -> None:
+            if event.event_type in wanted:
+                matched.add(event.event_type)
+
+        bus.subscribe_all(_record)
+        return matched
+
+    return _record_types
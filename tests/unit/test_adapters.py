@@ -8,8 +8,10 @@ Covers:
 """
 from __future__ import annotations
 
-import asyncio
-from unittest.mock import MagicMock, patch
+import inspect
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
 from uuid import UUID, uuid4
 
 import pytest
@@ -22,15 +24,40 @@ from agentcore.bus.event_bus import EventBus
 from agentcore.schema.errors import AdapterError
 from agentcore.schema.events import AgentEvent, EventType
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# No callback test asserts on run_id, so they all share one.
+_RUN_ID: UUID = uuid4()
+
+# Runs a test with the framework SDK patched in and again with it patched out
+_WITH_AND_WITHOUT_SDK = pytest.mark.parametrize(
+    "sdk_available", [True, False], indirect=True, ids=["sdk", "no-sdk"]
+)
+
 
 # ---------------------------------------------------------------------------
-# Helpers
+# Fixtures
 # ---------------------------------------------------------------------------
 
-def _collect_events(bus: EventBus) -> list[AgentEvent]:
-    collected: list[AgentEvent] = []
-    bus.subscribe_all(collected.append)
-    return collected
+@pytest.fixture()
+def concrete_adapter(bus: EventBus) -> ConcreteAdapter:
+    return ConcreteAdapter("my-agent", bus)
+
+
+@pytest.fixture()
+def callable_adapter(bus: EventBus) -> CallableAdapter:
+    return CallableAdapter("agent-1", bus)
+
+
+@pytest.fixture()
+def crewai_adapter(bus: EventBus) -> CrewAIAdapter:
+    return CrewAIAdapter("crew-1", bus)
+
+
+@pytest.fixture()
+def langchain_adapter(bus: EventBus) -> LangChainAdapter:
+    return LangChainAdapter("lc-1", bus)
 
 
 # ---------------------------------------------------------------------------
@@ -51,35 +78,31 @@ class ConcreteAdapter(FrameworkAdapter):
 
 
 class TestFrameworkAdapterBase:
-    def test_agent_id_property(self) -> None:
-        bus = EventBus()
-        adapter = ConcreteAdapter("my-agent", bus)
-        assert adapter.agent_id == "my-agent"
-
-    def test_repr_contains_framework_and_agent_id(self) -> None:
-        bus = EventBus()
-        adapter = ConcreteAdapter("my-agent", bus)
-        text = repr(adapter)
+    def test_agent_id_property(self, concrete_adapter: ConcreteAdapter) -> None:
+        assert concrete_adapter.agent_id == "my-agent"
+
+    def test_repr_contains_framework_and_agent_id(self, concrete_adapter: ConcreteAdapter) -> None:
+        text = repr(concrete_adapter)
         assert "test-framework" in text
         assert "my-agent" in text
 
-    def test_require_compatible_passes_for_correct_type(self) -> None:
-        bus = EventBus()
-        adapter = ConcreteAdapter("a", bus)
+    def test_require_compatible_passes_for_correct_type(
+        self, concrete_adapter: ConcreteAdapter
+    ) -> None:
         # Should not raise
-        adapter._require_compatible("hello", str)
+        concrete_adapter._require_compatible("hello", str)
 
-    def test_require_compatible_raises_adapter_error_for_wrong_type(self) -> None:
-        bus = EventBus()
-        adapter = ConcreteAdapter("a", bus)
+    def test_require_compatible_raises_adapter_error_for_wrong_type(
+        self, concrete_adapter: ConcreteAdapter
+    ) -> None:
         with pytest.raises(AdapterError):
-            adapter._require_compatible(42, str)
+            concrete_adapter._require_compatible(42, str)
 
-    def test_require_compatible_error_message_contains_framework(self) -> None:
-        bus = EventBus()
-        adapter = ConcreteAdapter("a", bus)
+    def test_require_compatible_error_message_contains_framework(
+        self, concrete_adapter: ConcreteAdapter
+    ) -> None:
         with pytest.raises(AdapterError, match="test-framework"):
-            adapter._require_compatible([], dict)
+            concrete_adapter._require_compatible([], dict)
 
 
 # ---------------------------------------------------------------------------
@@ -87,417 +110,339 @@ class TestFrameworkAdapterBase:
 # ---------------------------------------------------------------------------
 
 class TestCallableAdapterSync:
-    def test_wrap_sync_returns_coroutine(self) -> None:
-        bus = EventBus()
-        adapter = CallableAdapter("agent-1", bus)
-        wrapped = adapter.wrap(lambda: 42)
-        import inspect
+    def test_wrap_sync_returns_coroutine(self, callable_adapter: CallableAdapter) -> None:
+        wrapped = callable_adapter.wrap(lambda: 42)
         assert inspect.iscoroutinefunction(wrapped)
 
-    async def test_wrap_sync_callable_returns_correct_result(self) -> None:
-        bus = EventBus()
-        adapter = CallableAdapter("agent-1", bus)
-        wrapped = adapter.wrap(lambda x, y: x + y)
+    async def test_wrap_sync_callable_returns_correct_result(
+        self, callable_adapter: CallableAdapter
+    ) -> None:
+        wrapped = callable_adapter.wrap(lambda x, y: x + y)
         result = await wrapped(3, 4)
         assert result == 7
 
-    async def test_wrap_sync_emits_started_and_stopped_events(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = CallableAdapter("agent-1", bus)
-        wrapped = adapter.wrap(lambda: "ok")
+    async def test_wrap_sync_emits_started_and_stopped_events(
+        self, record_types: Callable[..., set[EventType]], callable_adapter: CallableAdapter
+    ) -> None:
+        recorded = record_types(EventType.AGENT_STARTED, EventType.AGENT_STOPPED)
+        wrapped = callable_adapter.wrap(lambda: "ok")
         await wrapped()
-        event_types = [e.event_type for e in events]
-        assert EventType.AGENT_STARTED in event_types
-        assert EventType.AGENT_STOPPED in event_types
-
-    async def test_wrap_sync_emits_error_event_on_exception(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = CallableAdapter("agent-1", bus)
+        assert recorded == {EventType.AGENT_STARTED, EventType.AGENT_STOPPED}
 
+    async def test_wrap_sync_emits_error_event_on_exception(
+        self, seen: set[EventType], callable_adapter: CallableAdapter
+    ) -> None:
         def failing_fn() -> None:
             raise ValueError("boom")
 
-        wrapped = adapter.wrap(failing_fn)
+        wrapped = callable_adapter.wrap(failing_fn)
         with pytest.raises(ValueError, match="boom"):
             await wrapped()
 
-        event_types = [e.event_type for e in events]
-        assert EventType.ERROR_OCCURRED in event_types
+        assert EventType.ERROR_OCCURRED in seen
 
-    def test_wrap_non_callable_raises_adapter_error(self) -> None:
-        bus = EventBus()
-        adapter = CallableAdapter("agent-1", bus)
+    def test_wrap_non_callable_raises_adapter_error(
+        self, callable_adapter: CallableAdapter
+    ) -> None:
         with pytest.raises(AdapterError):
-            adapter.wrap("not-a-callable")
+            callable_adapter.wrap("not-a-callable")
 
-    def test_wrap_non_callable_error_message_contains_type(self) -> None:
-        bus = EventBus()
-        adapter = CallableAdapter("agent-1", bus)
+    def test_wrap_non_callable_error_message_contains_type(
+        self, callable_adapter: CallableAdapter
+    ) -> None:
         with pytest.raises(AdapterError, match="str"):
-            adapter.wrap("not-a-callable")
+            callable_adapter.wrap("not-a-callable")
 
 
 class TestCallableAdapterAsync:
-    async def test_wrap_async_callable_returns_correct_result(self) -> None:
-        bus = EventBus()
-        adapter = CallableAdapter("agent-2", bus)
-
+    async def test_wrap_async_callable_returns_correct_result(
+        self, callable_adapter: CallableAdapter
+    ) -> None:
         async def async_double(x: int) -> int:
             return x * 2
 
-        wrapped = adapter.wrap(async_double)
+        wrapped = callable_adapter.wrap(async_double)
         result = await wrapped(5)
         assert result == 10
 
-    async def test_wrap_async_emits_started_and_stopped_events(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = CallableAdapter("agent-2", bus)
+    async def test_wrap_async_emits_started_and_stopped_events(
+        self, record_types: Callable[..., set[EventType]], callable_adapter: CallableAdapter
+    ) -> None:
+        recorded = record_types(EventType.AGENT_STARTED, EventType.AGENT_STOPPED)
 
         async def async_fn() -> str:
             return "async"
 
-        wrapped = adapter.wrap(async_fn)
+        wrapped = callable_adapter.wrap(async_fn)
         await wrapped()
-        event_types = [e.event_type for e in events]
-        assert EventType.AGENT_STARTED in event_types
-        assert EventType.AGENT_STOPPED in event_types
-
-    async def test_wrap_async_emits_error_event_on_exception(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = CallableAdapter("agent-2", bus)
+        assert recorded == {EventType.AGENT_STARTED, EventType.AGENT_STOPPED}
 
+    async def test_wrap_async_emits_error_event_on_exception(
+        self, seen: set[EventType], callable_adapter: CallableAdapter
+    ) -> None:
         async def async_fail() -> None:
             raise RuntimeError("async-fail")
 
-        wrapped = adapter.wrap(async_fail)
+        wrapped = callable_adapter.wrap(async_fail)
         with pytest.raises(RuntimeError):
             await wrapped()
 
-        event_types = [e.event_type for e in events]
-        assert EventType.ERROR_OCCURRED in event_types
+        assert EventType.ERROR_OCCURRED in seen
 
-    async def test_emit_events_swaps_bus(self) -> None:
-        bus1 = EventBus()
-        bus2 = EventBus()
-        events_on_bus2 = _collect_events(bus2)
-        adapter = CallableAdapter("agent-2", bus1)
-        adapter.emit_events(bus2)
-        wrapped = adapter.wrap(lambda: None)
+    async def test_emit_events_swaps_bus(
+        self,
+        wired_bus: tuple[EventBus, list[AgentEvent]],
+        callable_adapter: CallableAdapter,
+    ) -> None:
+        bus2, events_on_bus2 = wired_bus
+        callable_adapter.emit_events(bus2)
+        wrapped = callable_adapter.wrap(lambda: None)
         await wrapped()
         assert len(events_on_bus2) >= 2
 
-    def test_get_framework_name(self) -> None:
-        bus = EventBus()
-        adapter = CallableAdapter("a", bus)
-        assert adapter.get_framework_name() == "callable"
+    def test_get_framework_name(self, callable_adapter: CallableAdapter) -> None:
+        assert callable_adapter.get_framework_name() == "callable"
 
 
 # ---------------------------------------------------------------------------
-# CrewAIAdapter — crewai not installed (default in test env)
+# CrewAIAdapter
 # ---------------------------------------------------------------------------
 
-class TestCrewAIAdapterWithoutCrewAI:
-    def test_wrap_returns_original_when_crewai_absent(self) -> None:
-        bus = EventBus()
-        adapter = CrewAIAdapter("crew-1", bus)
+@pytest.mark.usefixtures("sdk_available")
+class TestCrewAIAdapter:
+    """CrewAIAdapter with crewai patched in (default) or out via ``sdk_available``."""
+
+    sdk_flag = "agentcore.adapters.crewai._CREWAI_AVAILABLE"
+
+    def _make_mock_crew(self) -> SimpleNamespace:
+        # No kickoff_async attribute: the sync-only crew shape
+        return SimpleNamespace(kickoff=lambda *args, **kwargs: "result")
 
+    @pytest.mark.parametrize("sdk_available", [False], indirect=True)
+    def test_wrap_returns_original_when_crewai_absent(self, crewai_adapter: CrewAIAdapter) -> None:
         sentinel = object()
-        with patch("agentcore.adapters.crewai._CREWAI_AVAILABLE", False):
-            result = adapter.wrap(sentinel)
+        result = crewai_adapter.wrap(sentinel)
         assert result is sentinel
 
-    def test_get_framework_name(self) -> None:
-        bus = EventBus()
-        adapter = CrewAIAdapter("crew-1", bus)
-        assert adapter.get_framework_name() == "crewai"
+    @_WITH_AND_WITHOUT_SDK
+    def test_get_framework_name(self, crewai_adapter: CrewAIAdapter) -> None:
+        assert crewai_adapter.get_framework_name() == "crewai"
 
-    def test_emit_events_updates_bus(self) -> None:
-        bus1 = EventBus()
+    @_WITH_AND_WITHOUT_SDK
+    def test_emit_events_updates_bus(self, crewai_adapter: CrewAIAdapter) -> None:
         bus2 = EventBus()
-        adapter = CrewAIAdapter("crew-1", bus1)
-        adapter.emit_events(bus2)
-        assert adapter._bus is bus2
-
-
-class TestCrewAIAdapterWithMockCrewAI:
-    """Tests exercising the patching logic when crewai is available."""
-
-    def _make_mock_crew(self) -> MagicMock:
-        crew = MagicMock()
-        crew.kickoff = MagicMock(return_value="result")
-        del crew.kickoff_async  # ensure it doesn't have async variant by default
-        return crew
-
-    def test_wrap_patches_kickoff_and_emits_started_stopped(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = CrewAIAdapter("crew-1", bus)
+        crewai_adapter.emit_events(bus2)
+        assert crewai_adapter._bus is bus2
 
+    def test_wrap_patches_kickoff_and_emits_started_stopped(
+        self, record_types: Callable[..., set[EventType]], crewai_adapter: CrewAIAdapter
+    ) -> None:
+        recorded = record_types(EventType.AGENT_STARTED, EventType.AGENT_STOPPED)
         crew = self._make_mock_crew()
-        with patch("agentcore.adapters.crewai._CREWAI_AVAILABLE", True):
-            result_crew = adapter.wrap(crew)
+        result_crew = crewai_adapter.wrap(crew)
 
         result_crew.kickoff()
-        event_types = [e.event_type for e in events]
-        assert EventType.AGENT_STARTED in event_types
-        assert EventType.AGENT_STOPPED in event_types
+        assert recorded == {EventType.AGENT_STARTED, EventType.AGENT_STOPPED}
 
-    def test_wrap_kickoff_propagates_exception_and_emits_error(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = CrewAIAdapter("crew-1", bus)
+    def test_wrap_kickoff_propagates_exception_and_emits_error(
+        self, seen: set[EventType], crewai_adapter: CrewAIAdapter
+    ) -> None:
+        def failing_kickoff(*args: object, **kwargs: object) -> None:
+            raise RuntimeError("kickoff-failed")
 
-        crew = self._make_mock_crew()
-        crew.kickoff.side_effect = RuntimeError("kickoff-failed")
+        crew = SimpleNamespace(kickoff=failing_kickoff)
 
-        with patch("agentcore.adapters.crewai._CREWAI_AVAILABLE", True):
-            result_crew = adapter.wrap(crew)
+        result_crew = crewai_adapter.wrap(crew)
 
         with pytest.raises(RuntimeError, match="kickoff-failed"):
             result_crew.kickoff()
 
-        event_types = [e.event_type for e in events]
-        assert EventType.ERROR_OCCURRED in event_types
-
-    def test_wrap_patches_kickoff_async_when_present(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = CrewAIAdapter("crew-1", bus)
+        assert EventType.ERROR_OCCURRED in seen
 
-        crew = MagicMock()
-        crew.kickoff = MagicMock(return_value="sync-result")
+    async def test_wrap_patches_kickoff_async_when_present(
+        self, record_types: Callable[..., set[EventType]], crewai_adapter: CrewAIAdapter
+    ) -> None:
+        recorded = record_types(EventType.AGENT_STARTED, EventType.AGENT_STOPPED)
 
         async def async_kickoff(*args: object, **kwargs: object) -> str:
             return "async-result"
 
-        crew.kickoff_async = async_kickoff
+        crew = SimpleNamespace(
+            kickoff=lambda *args, **kwargs: "sync-result", kickoff_async=async_kickoff
+        )
 
-        with patch("agentcore.adapters.crewai._CREWAI_AVAILABLE", True):
-            result_crew = adapter.wrap(crew)
+        result_crew = crewai_adapter.wrap(crew)
 
-        loop = asyncio.new_event_loop()
-        try:
-            result = loop.run_until_complete(result_crew.kickoff_async())
-        finally:
-            loop.close()
+        result = await result_crew.kickoff_async()
         assert result == "async-result"
-        event_types = [e.event_type for e in events]
-        assert EventType.AGENT_STARTED in event_types
-        assert EventType.AGENT_STOPPED in event_types
-
-    def test_wrap_kickoff_async_propagates_exception_and_emits_error(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = CrewAIAdapter("crew-1", bus)
-
-        crew = MagicMock()
-        crew.kickoff = MagicMock(return_value="ok")
+        assert recorded == {EventType.AGENT_STARTED, EventType.AGENT_STOPPED}
 
+    async def test_wrap_kickoff_async_propagates_exception_and_emits_error(
+        self, seen: set[EventType], crewai_adapter: CrewAIAdapter
+    ) -> None:
         async def async_kickoff_fail(*args: object, **kwargs: object) -> None:
             raise ValueError("async-boom")
 
-        crew.kickoff_async = async_kickoff_fail
+        crew = SimpleNamespace(
+            kickoff=lambda *args, **kwargs: "ok", kickoff_async=async_kickoff_fail
+        )
 
-        with patch("agentcore.adapters.crewai._CREWAI_AVAILABLE", True):
-            result_crew = adapter.wrap(crew)
+        result_crew = crewai_adapter.wrap(crew)
 
-        loop = asyncio.new_event_loop()
-        try:
-            with pytest.raises(ValueError, match="async-boom"):
-                loop.run_until_complete(result_crew.kickoff_async())
-        finally:
-            loop.close()
+        with pytest.raises(ValueError, match="async-boom"):
+            await result_crew.kickoff_async()
 
-        event_types = [e.event_type for e in events]
-        assert EventType.ERROR_OCCURRED in event_types
+        assert EventType.ERROR_OCCURRED in seen
 
 
 # ---------------------------------------------------------------------------
-# LangChainAdapter — langchain not installed path
+# LangChainAdapter
 # ---------------------------------------------------------------------------
 
-class TestLangChainAdapterWithoutLangChain:
-    def test_wrap_returns_original_when_langchain_absent(self) -> None:
-        bus = EventBus()
-        adapter = LangChainAdapter("lc-1", bus)
+class _BareChain:
+    """Chain exposing ``callbacks`` but no ``with_config``."""
+
+    def __init__(self) -> None:
+        self.callbacks: list[object] = []
+
+
+class _ResponseWithoutLLMOutput:
+    """LLM result lacking ``llm_output``; the handler must still emit a cost event."""
+
+
+def _llm_response(llm_output: dict[str, object]) -> SimpleNamespace:
+    return SimpleNamespace(llm_output=llm_output)
+
+
+# (callback method, positional args, event type it must emit)
+_CALLBACK_CASES = [
+    pytest.param(
+        "on_chain_start", ({"name": "chain"}, {"input": "x"}), EventType.AGENT_STARTED,
+        id="on_chain_start",
+    ),
+    pytest.param(
+        "on_chain_end", ({"output": "y"},), EventType.AGENT_STOPPED, id="on_chain_end"
+    ),
+    pytest.param(
+        "on_chain_error", (ValueError("chain-err"),), EventType.ERROR_OCCURRED,
+        id="on_chain_error",
+    ),
+    pytest.param(
+        "on_tool_start", ({"name": "my_tool"}, "input str"), EventType.TOOL_CALLED,
+        id="on_tool_start",
+    ),
+    pytest.param("on_tool_end", ("output",), EventType.TOOL_COMPLETED, id="on_tool_end"),
+    pytest.param(
+        "on_tool_error", (RuntimeError("tool-err"),), EventType.TOOL_FAILED,
+        id="on_tool_error",
+    ),
+    pytest.param(
+        "on_llm_end",
+        (_llm_response({"token_usage": {"prompt_tokens": 100, "completion_tokens": 50}}),),
+        EventType.COST_INCURRED,
+        id="on_llm_end",
+    ),
+    # Should still emit COST_INCURRED, just without token data
+    pytest.param(
+        "on_llm_end", (_llm_response({}),), EventType.COST_INCURRED,
+        id="on_llm_end-without-token-usage",
+    ),
+    pytest.param(
+        "on_llm_end", (_ResponseWithoutLLMOutput(),), EventType.COST_INCURRED,
+        id="on_llm_end-without-llm-output",
+    ),
+]
+
+
+@pytest.mark.usefixtures("sdk_available")
+class TestLangChainAdapter:
+    """LangChainAdapter with langchain patched in (default) or out via ``sdk_available``."""
+
+    sdk_flag = "agentcore.adapters.langchain._LANGCHAIN_AVAILABLE"
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def handler_factory(cls) -> Callable[..., _AgentCoreCallbackHandler]:
+        def _make(bus: EventBus, agent_id: str = "agent-lc") -> _AgentCoreCallbackHandler:
+            return _AgentCoreCallbackHandler(agent_id, bus)
+
+        return _make
+
+    @pytest.mark.parametrize("sdk_available", [False], indirect=True)
+    def test_wrap_returns_original_when_langchain_absent(
+        self, langchain_adapter: LangChainAdapter
+    ) -> None:
         sentinel = object()
-        with patch("agentcore.adapters.langchain._LANGCHAIN_AVAILABLE", False):
-            result = adapter.wrap(sentinel)
+        result = langchain_adapter.wrap(sentinel)
         assert result is sentinel
 
-    def test_get_framework_name(self) -> None:
-        bus = EventBus()
-        adapter = LangChainAdapter("lc-1", bus)
-        assert adapter.get_framework_name() == "langchain"
-
-    def test_emit_events_updates_bus_and_handler(self) -> None:
-        bus1 = EventBus()
+    @_WITH_AND_WITHOUT_SDK
+    def test_get_framework_name(self, langchain_adapter: LangChainAdapter) -> None:
+        assert langchain_adapter.get_framework_name() == "langchain"
+
+    @_WITH_AND_WITHOUT_SDK
+    def test_emit_events_updates_bus_and_handler(
+        self,
+        bus: EventBus,
+        langchain_adapter: LangChainAdapter,
+        handler_factory: Callable[..., _AgentCoreCallbackHandler],
+    ) -> None:
         bus2 = EventBus()
-        adapter = LangChainAdapter("lc-1", bus1)
         # Force a handler to exist
-        handler = _AgentCoreCallbackHandler("lc-1", bus1)
-        adapter._handler = handler
-        adapter.emit_events(bus2)
-        assert adapter._bus is bus2
+        handler = handler_factory(bus, "lc-1")
+        langchain_adapter._handler = handler
+        langchain_adapter.emit_events(bus2)
+        assert langchain_adapter._bus is bus2
         assert handler._bus is bus2
 
-    def test_emit_events_without_handler_is_safe(self) -> None:
-        bus1 = EventBus()
+    @_WITH_AND_WITHOUT_SDK
+    def test_emit_events_without_handler_is_safe(
+        self, langchain_adapter: LangChainAdapter
+    ) -> None:
         bus2 = EventBus()
-        adapter = LangChainAdapter("lc-1", bus1)
         # _handler is None by default
-        adapter.emit_events(bus2)  # must not raise
-        assert adapter._bus is bus2
-
-
-class TestLangChainAdapterWithMockLangChain:
-    """Tests that exercise the langchain-present code paths via mocking."""
-
-    def _make_handler(self) -> _AgentCoreCallbackHandler:
-        bus = EventBus()
-        return _AgentCoreCallbackHandler("agent-lc", bus)
-
-    def test_wrap_with_config_uses_with_config(self) -> None:
-        bus = EventBus()
-        adapter = LangChainAdapter("lc-1", bus)
+        langchain_adapter.emit_events(bus2)  # must not raise
+        assert langchain_adapter._bus is bus2
 
+    def test_wrap_with_config_uses_with_config(self, langchain_adapter: LangChainAdapter) -> None:
         runnable = MagicMock()
-        configured = MagicMock()
+        configured = object()
         runnable.with_config.return_value = configured
 
-        with patch("agentcore.adapters.langchain._LANGCHAIN_AVAILABLE", True):
-            result = adapter.wrap(runnable)
+        result = langchain_adapter.wrap(runnable)
 
         assert result is configured
         runnable.with_config.assert_called_once()
 
-    def test_wrap_with_callbacks_appends_handler(self) -> None:
-        bus = EventBus()
-        adapter = LangChainAdapter("lc-1", bus)
-
-        chain = MagicMock(spec=[])  # no with_config
-        chain.callbacks = []
+    def test_wrap_with_callbacks_appends_handler(
+        self, langchain_adapter: LangChainAdapter
+    ) -> None:
+        chain = _BareChain()
 
-        with patch("agentcore.adapters.langchain._LANGCHAIN_AVAILABLE", True):
-            result = adapter.wrap(chain)
+        result = langchain_adapter.wrap(chain)
 
         assert result is chain
         assert len(chain.callbacks) == 1
 
-    def test_wrap_raises_adapter_error_for_incompatible_object(self) -> None:
-        bus = EventBus()
-        adapter = LangChainAdapter("lc-1", bus)
-
+    def test_wrap_raises_adapter_error_for_incompatible_object(
+        self, langchain_adapter: LangChainAdapter
+    ) -> None:
         class Incompatible:
             pass
 
-        with patch("agentcore.adapters.langchain._LANGCHAIN_AVAILABLE", True):
-            with pytest.raises(AdapterError):
-                adapter.wrap(Incompatible())
-
-    def test_callback_handler_on_chain_start_emits_started(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        handler = _AgentCoreCallbackHandler("agent-lc", bus)
-
-        with patch("agentcore.adapters.langchain._LANGCHAIN_AVAILABLE", True):
-            handler.on_chain_start({"name": "chain"}, {"input": "x"}, run_id=uuid4())
-
-        assert any(e.event_type == EventType.AGENT_STARTED for e in events)
-
-    def test_callback_handler_on_chain_end_emits_stopped(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        handler = _AgentCoreCallbackHandler("agent-lc", bus)
-
-        with patch("agentcore.adapters.langchain._LANGCHAIN_AVAILABLE", True):
-            handler.on_chain_end({"output": "y"}, run_id=uuid4())
-
-        assert any(e.event_type == EventType.AGENT_STOPPED for e in events)
-
-    def test_callback_handler_on_chain_error_emits_error_occurred(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        handler = _AgentCoreCallbackHandler("agent-lc", bus)
-
-        with patch("agentcore.adapters.langchain._LANGCHAIN_AVAILABLE", True):
-            handler.on_chain_error(ValueError("chain-err"), run_id=uuid4())
-
-        assert any(e.event_type == EventType.ERROR_OCCURRED for e in events)
-
-    def test_callback_handler_on_tool_start_emits_tool_called(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        handler = _AgentCoreCallbackHandler("agent-lc", bus)
-
-        with patch("agentcore.adapters.langchain._LANGCHAIN_AVAILABLE", True):
-            handler.on_tool_start({"name": "my_tool"}, "input str", run_id=uuid4())
-
-        assert any(e.event_type == EventType.TOOL_CALLED for e in events)
-
-    def test_callback_handler_on_tool_end_emits_tool_completed(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        handler = _AgentCoreCallbackHandler("agent-lc", bus)
-
-        with patch("agentcore.adapters.langchain._LANGCHAIN_AVAILABLE", True):
-            handler.on_tool_end("output", run_id=uuid4())
-
-        assert any(e.event_type == EventType.TOOL_COMPLETED for e in events)
-
-    def test_callback_handler_on_tool_error_emits_tool_failed(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        handler = _AgentCoreCallbackHandler("agent-lc", bus)
-
-        with patch("agentcore.adapters.langchain._LANGCHAIN_AVAILABLE", True):
-            handler.on_tool_error(RuntimeError("tool-err"), run_id=uuid4())
-
-        assert any(e.event_type == EventType.TOOL_FAILED for e in events)
-
-    def test_callback_handler_on_llm_end_emits_cost_incurred(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        handler = _AgentCoreCallbackHandler("agent-lc", bus)
-
-        mock_response = MagicMock()
-        mock_response.llm_output = {
-            "token_usage": {"prompt_tokens": 100, "completion_tokens": 50}
-        }
-
-        with patch("agentcore.adapters.langchain._LANGCHAIN_AVAILABLE", True):
-            handler.on_llm_end(mock_response, run_id=uuid4())
-
-        assert any(e.event_type == EventType.COST_INCURRED for e in events)
-
-    def test_callback_handler_on_llm_end_without_token_usage(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        handler = _AgentCoreCallbackHandler("agent-lc", bus)
-
-        mock_response = MagicMock()
-        mock_response.llm_output = {}
-
-        with patch("agentcore.adapters.langchain._LANGCHAIN_AVAILABLE", True):
-            handler.on_llm_end(mock_response, run_id=uuid4())
-
-        # Should still emit COST_INCURRED, just without token data
-        assert any(e.event_type == EventType.COST_INCURRED for e in events)
-
-    def test_callback_handler_on_llm_end_without_llm_output(self) -> None:
-        """Handler should tolerate a response with no llm_output attribute."""
-        bus = EventBus()
-        events = _collect_events(bus)
-        handler = _AgentCoreCallbackHandler("agent-lc", bus)
-
-        class MinimalResponse:
-            pass
-
-        with patch("agentcore.adapters.langchain._LANGCHAIN_AVAILABLE", True):
-            handler.on_llm_end(MinimalResponse(), run_id=uuid4())
-
-        assert any(e.event_type == EventType.COST_INCURRED for e in events)
+        with pytest.raises(AdapterError):
+            langchain_adapter.wrap(Incompatible())
+
+    @pytest.mark.parametrize(("method", "args", "expected"), _CALLBACK_CASES)
+    def test_callback_handler_emits_event(
+        self,
+        bus: EventBus,
+        seen: set[EventType],
+        handler_factory: Callable[..., _AgentCoreCallbackHandler],
+        method: str,
+        args: tuple[object, ...],
+        expected: EventType,
+    ) -> None:
+        handler = handler_factory(bus)
+        getattr(handler, method)(*args, run_id=_RUN_ID)
+        assert expected in seen
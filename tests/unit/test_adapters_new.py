@@ -7,27 +7,89 @@ Covers:
 """
 from __future__ import annotations
 
-import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, NamedTuple
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from agentcore.adapters.anthropic_sdk import AnthropicAdapter, _emit_cost_event, _emit_tool_use_events
+from agentcore.adapters.anthropic_sdk import (
+    AnthropicAdapter,
+    _cost_events,
+    _response_events,
+    _tool_use_events,
+)
 from agentcore.adapters.microsoft_agents import MicrosoftAgentAdapter
 from agentcore.adapters.openai_agents import OpenAIAgentsAdapter
 from agentcore.bus.event_bus import EventBus
-from agentcore.schema.events import AgentEvent, EventType, ToolCallEvent
+from agentcore.schema.events import AgentEvent, EventType
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from agentcore.adapters.base import FrameworkAdapter
+
+# Runs a test with the framework SDK patched in and again with it patched out
+_WITH_AND_WITHOUT_SDK = pytest.mark.parametrize(
+    "sdk_available", [True, False], indirect=True, ids=["sdk", "no-sdk"]
+)
 
 
 # ---------------------------------------------------------------------------
-# Helpers
+# Fixtures
 # ---------------------------------------------------------------------------
 
 
-def _collect_events(bus: EventBus) -> list[AgentEvent]:
-    collected: list[AgentEvent] = []
-    bus.subscribe_all(collected.append)
-    return collected
+@pytest.fixture()
+def openai_adapter(bus: EventBus) -> OpenAIAgentsAdapter:
+    return OpenAIAgentsAdapter("oai-1", bus)
+
+
+@pytest.fixture()
+def anthropic_adapter(bus: EventBus) -> AnthropicAdapter:
+    return AnthropicAdapter("ant-1", bus)
+
+
+@pytest.fixture()
+def microsoft_adapter(bus: EventBus) -> MicrosoftAgentAdapter:
+    return MicrosoftAgentAdapter("ms-1", bus)
+
+
+class _StubMessages:
+    """Stand-in for ``client.messages``: ``create`` returns ``response`` or raises ``error``."""
+
+    def __init__(self) -> None:
+        self.response: object = SimpleNamespace(content=[], usage=None)
+        self.error: Exception | None = None
+
+    def create(self, **kwargs: object) -> object:
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+
+class _StubBot:
+    """Stand-in Bot Framework handler whose ``on_turn`` raises ``turn_error`` if set."""
+
+    def __init__(self) -> None:
+        self.turn_error: Exception | None = None
+
+    async def on_turn(self, turn_context: object) -> None:
+        if self.turn_error is not None:
+            raise self.turn_error
+
+    async def on_message_activity(self, turn_context: object) -> None:
+        return None
+
+
+@pytest.fixture()
+def anthropic_stub_client() -> SimpleNamespace:
+    return SimpleNamespace(messages=_StubMessages())
+
+
+@pytest.fixture()
+def ms_bot_stub() -> _StubBot:
+    return _StubBot()
 
 
 # ===========================================================================
@@ -35,591 +97,485 @@ def _collect_events(bus: EventBus) -> list[AgentEvent]:
 # ===========================================================================
 
 
-class TestOpenAIAgentsAdapterWithoutSDK:
-    def test_get_framework_name(self) -> None:
-        bus = EventBus()
-        adapter = OpenAIAgentsAdapter("oai-1", bus)
-        assert adapter.get_framework_name() == "openai_agents"
+@pytest.mark.usefixtures("sdk_available")
+class TestOpenAIAgentsAdapter:
+    """OpenAIAgentsAdapter with the SDK patched in (default) or out via ``sdk_available``."""
 
-    def test_wrap_returns_original_when_sdk_absent(self) -> None:
-        bus = EventBus()
-        adapter = OpenAIAgentsAdapter("oai-1", bus)
+    sdk_flag = "agentcore.adapters.openai_agents._OPENAI_AGENTS_AVAILABLE"
+
+    @pytest.fixture()
+    def runner_success(self) -> SimpleNamespace:
+        result = SimpleNamespace(final_output="agent output")
+        return SimpleNamespace(run=AsyncMock(return_value=result))
+
+    @pytest.fixture()
+    def runner_fail(self) -> SimpleNamespace:
+        return SimpleNamespace(run=AsyncMock(side_effect=ValueError("sdk-error")))
+
+    @_WITH_AND_WITHOUT_SDK
+    def test_get_framework_name(self, openai_adapter: OpenAIAgentsAdapter) -> None:
+        assert openai_adapter.get_framework_name() == "openai_agents"
+
+    @pytest.mark.parametrize("sdk_available", [False], indirect=True)
+    def test_wrap_returns_original_when_sdk_absent(
+        self, openai_adapter: OpenAIAgentsAdapter
+    ) -> None:
         sentinel = object()
-        with patch("agentcore.adapters.openai_agents._OPENAI_AGENTS_AVAILABLE", False):
-            result = adapter.wrap(sentinel)
+        result = openai_adapter.wrap(sentinel)
         assert result is sentinel
 
-    def test_emit_events_updates_bus(self) -> None:
-        bus1 = EventBus()
+    @_WITH_AND_WITHOUT_SDK
+    def test_emit_events_updates_bus(self, openai_adapter: OpenAIAgentsAdapter) -> None:
         bus2 = EventBus()
-        adapter = OpenAIAgentsAdapter("oai-1", bus1)
-        adapter.emit_events(bus2)
-        assert adapter._bus is bus2
+        openai_adapter.emit_events(bus2)
+        assert openai_adapter._bus is bus2
 
-    def test_agent_id_property(self) -> None:
-        bus = EventBus()
+    @_WITH_AND_WITHOUT_SDK
+    def test_agent_id_property(self, bus: EventBus) -> None:
         adapter = OpenAIAgentsAdapter("oai-agent-xyz", bus)
         assert adapter.agent_id == "oai-agent-xyz"
 
-    def test_repr_contains_framework_and_agent_id(self) -> None:
-        bus = EventBus()
-        adapter = OpenAIAgentsAdapter("oai-1", bus)
-        text = repr(adapter)
+    @_WITH_AND_WITHOUT_SDK
+    def test_repr_contains_framework_and_agent_id(
+        self, openai_adapter: OpenAIAgentsAdapter
+    ) -> None:
+        text = repr(openai_adapter)
         assert "openai_agents" in text
         assert "oai-1" in text
 
+    @pytest.mark.parametrize("sdk_available", [False], indirect=True)
+    async def test_run_raises_when_sdk_absent(self, openai_adapter: OpenAIAgentsAdapter) -> None:
+        with pytest.raises(RuntimeError, match="openai-agents"):
+            await openai_adapter.run("hello")
 
-class TestOpenAIAgentsAdapterWithMockSDK:
-    def test_wrap_with_hooks_patches_hooks_attribute(self) -> None:
-        bus = EventBus()
-        adapter = OpenAIAgentsAdapter("oai-1", bus)
+    def test_wrap_with_hooks_patches_hooks_attribute(
+        self, openai_adapter: OpenAIAgentsAdapter
+    ) -> None:
+        mock_agent = SimpleNamespace(hooks=None)
 
-        mock_agent = MagicMock()
-        mock_agent.hooks = None
-
-        with patch("agentcore.adapters.openai_agents._OPENAI_AGENTS_AVAILABLE", True):
-            result = adapter.wrap(mock_agent)
+        result = openai_adapter.wrap(mock_agent)
 
         assert result is mock_agent
         # hooks attribute should be replaced with the event-emitting wrapper
         assert mock_agent.hooks is not None
 
-    def test_wrap_agent_without_hooks_returns_original(self) -> None:
-        bus = EventBus()
-        adapter = OpenAIAgentsAdapter("oai-1", bus)
-
+    def test_wrap_agent_without_hooks_returns_original(
+        self, openai_adapter: OpenAIAgentsAdapter
+    ) -> None:
         class BareAgent:
             pass
 
         mock_agent = BareAgent()
 
-        with patch("agentcore.adapters.openai_agents._OPENAI_AGENTS_AVAILABLE", True):
-            result = adapter.wrap(mock_agent)
+        result = openai_adapter.wrap(mock_agent)
 
         # The adapter should always return the original object
         assert result is mock_agent
 
-    def test_run_raises_when_sdk_absent(self) -> None:
-        bus = EventBus()
-        adapter = OpenAIAgentsAdapter("oai-1", bus)
+    async def test_run_emits_started_stopped_events(
+        self,
+        record_types: Callable[..., set[EventType]],
+        openai_adapter: OpenAIAgentsAdapter,
+        runner_success: SimpleNamespace,
+    ) -> None:
+        recorded = record_types(EventType.AGENT_STARTED, EventType.AGENT_STOPPED)
+        with patch("agentcore.adapters.openai_agents.Runner", runner_success):
+            openai_adapter._original_agent = object()
+            await openai_adapter.run("hello")
+
+        assert recorded == {EventType.AGENT_STARTED, EventType.AGENT_STOPPED}
+
+    async def test_run_emits_error_event_on_exception(
+        self,
+        seen: set[EventType],
+        openai_adapter: OpenAIAgentsAdapter,
+        runner_fail: SimpleNamespace,
+    ) -> None:
+        with patch("agentcore.adapters.openai_agents.Runner", runner_fail):
+            openai_adapter._original_agent = object()
+            with pytest.raises(ValueError, match="sdk-error"):
+                await openai_adapter.run("hello")
 
-        async def _run() -> None:
-            await adapter.run("hello")
+        assert EventType.ERROR_OCCURRED in seen
 
-        with patch("agentcore.adapters.openai_agents._OPENAI_AGENTS_AVAILABLE", False):
-            with pytest.raises(RuntimeError, match="openai-agents"):
-                asyncio.run(_run())
+    async def test_hooks_on_agent_start_emits_event(
+        self, seen: set[EventType], openai_adapter: OpenAIAgentsAdapter
+    ) -> None:
+        mock_agent = SimpleNamespace(hooks=None)
 
-    def test_run_emits_started_stopped_events(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = OpenAIAgentsAdapter("oai-1", bus)
+        openai_adapter.wrap(mock_agent)
 
-        mock_result = MagicMock()
-        mock_result.final_output = "agent output"
+        await mock_agent.hooks.on_agent_start(None, None)
 
-        mock_runner = MagicMock()
-        mock_runner.run = AsyncMock(return_value=mock_result)
+        assert EventType.AGENT_STARTED in seen
 
-        async def _run() -> None:
-            await adapter.run("hello")
+    async def test_hooks_on_agent_end_emits_stopped_event(
+        self, seen: set[EventType], openai_adapter: OpenAIAgentsAdapter
+    ) -> None:
+        mock_agent = SimpleNamespace(hooks=None)
 
-        with patch("agentcore.adapters.openai_agents._OPENAI_AGENTS_AVAILABLE", True), \
-             patch("agentcore.adapters.openai_agents.Runner", mock_runner):
-            adapter._original_agent = MagicMock()
-            asyncio.run(_run())
+        openai_adapter.wrap(mock_agent)
 
-        event_types = [e.event_type for e in events]
-        assert EventType.AGENT_STARTED in event_types
-        assert EventType.AGENT_STOPPED in event_types
+        await mock_agent.hooks.on_agent_end(None, None, "output")
 
-    def test_run_emits_error_event_on_exception(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = OpenAIAgentsAdapter("oai-1", bus)
+        assert EventType.AGENT_STOPPED in seen
 
-        mock_runner = MagicMock()
-        mock_runner.run = AsyncMock(side_effect=ValueError("sdk-error"))
+    async def test_hooks_on_tool_start_emits_tool_called(
+        self, seen: set[EventType], openai_adapter: OpenAIAgentsAdapter
+    ) -> None:
+        mock_agent = SimpleNamespace(hooks=None)
+        mock_tool = SimpleNamespace(name="my_tool")
 
-        async def _run() -> None:
-            await adapter.run("hello")
+        openai_adapter.wrap(mock_agent)
 
-        with patch("agentcore.adapters.openai_agents._OPENAI_AGENTS_AVAILABLE", True), \
-             patch("agentcore.adapters.openai_agents.Runner", mock_runner):
-            adapter._original_agent = MagicMock()
-            with pytest.raises(ValueError, match="sdk-error"):
-                asyncio.run(_run())
+        await mock_agent.hooks.on_tool_start(None, None, mock_tool)
 
-        event_types = [e.event_type for e in events]
-        assert EventType.ERROR_OCCURRED in event_types
+        assert EventType.TOOL_CALLED in seen
 
-    def test_hooks_on_agent_start_emits_event(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = OpenAIAgentsAdapter("oai-1", bus)
+    async def test_hooks_on_tool_end_emits_tool_completed(
+        self, seen: set[EventType], openai_adapter: OpenAIAgentsAdapter
+    ) -> None:
+        mock_agent = SimpleNamespace(hooks=None)
+        mock_tool = SimpleNamespace(name="my_tool")
 
-        mock_agent = MagicMock()
-        mock_agent.hooks = None
+        openai_adapter.wrap(mock_agent)
 
-        with patch("agentcore.adapters.openai_agents._OPENAI_AGENTS_AVAILABLE", True):
-            adapter.wrap(mock_agent)
+        await mock_agent.hooks.on_tool_end(None, None, mock_tool, "result")
 
-        loop = asyncio.new_event_loop()
-        try:
-            loop.run_until_complete(mock_agent.hooks.on_agent_start(None, None))
-        finally:
-            loop.close()
+        assert EventType.TOOL_COMPLETED in seen
 
-        assert any(e.event_type == EventType.AGENT_STARTED for e in events)
 
-    def test_hooks_on_agent_end_emits_stopped_event(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = OpenAIAgentsAdapter("oai-1", bus)
+# ===========================================================================
+# AnthropicAdapter
+# ===========================================================================
 
-        mock_agent = MagicMock()
-        mock_agent.hooks = None
 
-        with patch("agentcore.adapters.openai_agents._OPENAI_AGENTS_AVAILABLE", True):
-            adapter.wrap(mock_agent)
+@pytest.mark.usefixtures("sdk_available")
+class TestAnthropicAdapterWithMockSDK:
+    sdk_flag = "agentcore.adapters.anthropic_sdk._ANTHROPIC_AVAILABLE"
 
-        loop = asyncio.new_event_loop()
-        try:
-            loop.run_until_complete(mock_agent.hooks.on_agent_end(None, None, "output"))
-        finally:
-            loop.close()
+    def test_wrap_patches_messages_create(
+        self, anthropic_stub_client: SimpleNamespace, anthropic_adapter: AnthropicAdapter
+    ) -> None:
+        client = anthropic_stub_client
+        original_create = client.messages.create
 
-        assert any(e.event_type == EventType.AGENT_STOPPED for e in events)
+        result = anthropic_adapter.wrap(client)
 
-    def test_hooks_on_tool_start_emits_tool_called(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = OpenAIAgentsAdapter("oai-1", bus)
+        assert result is client
+        # create should now be the patched version (not the stub's own method)
+        assert client.messages.create != original_create
 
-        mock_agent = MagicMock()
-        mock_agent.hooks = None
-        mock_tool = MagicMock()
-        mock_tool.name = "my_tool"
+    def test_wrap_client_without_messages_logs_warning(
+        self, anthropic_adapter: AnthropicAdapter
+    ) -> None:
+        class NoMessages:
+            pass
 
-        with patch("agentcore.adapters.openai_agents._OPENAI_AGENTS_AVAILABLE", True):
-            adapter.wrap(mock_agent)
+        obj = NoMessages()
+        result = anthropic_adapter.wrap(obj)
 
-        loop = asyncio.new_event_loop()
-        try:
-            loop.run_until_complete(
-                mock_agent.hooks.on_tool_start(None, None, mock_tool)
-            )
-        finally:
-            loop.close()
+        assert result is obj
 
-        assert any(e.event_type == EventType.TOOL_CALLED for e in events)
+    def test_patched_create_emits_started_stopped(
+        self,
+        record_types: Callable[..., set[EventType]],
+        anthropic_stub_client: SimpleNamespace,
+        anthropic_adapter: AnthropicAdapter,
+    ) -> None:
+        recorded = record_types(EventType.AGENT_STARTED, EventType.AGENT_STOPPED)
+        client = anthropic_stub_client
 
-    def test_hooks_on_tool_end_emits_tool_completed(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = OpenAIAgentsAdapter("oai-1", bus)
+        anthropic_adapter.wrap(client)
 
-        mock_agent = MagicMock()
-        mock_agent.hooks = None
-        mock_tool = MagicMock()
-        mock_tool.name = "my_tool"
+        client.messages.create()  # call the patched method
 
-        with patch("agentcore.adapters.openai_agents._OPENAI_AGENTS_AVAILABLE", True):
-            adapter.wrap(mock_agent)
+        assert recorded == {EventType.AGENT_STARTED, EventType.AGENT_STOPPED}
 
-        loop = asyncio.new_event_loop()
-        try:
-            loop.run_until_complete(
-                mock_agent.hooks.on_tool_end(None, None, mock_tool, "result")
-            )
-        finally:
-            loop.close()
+    def test_patched_create_emits_error_on_exception(
+        self,
+        seen: set[EventType],
+        anthropic_stub_client: SimpleNamespace,
+        anthropic_adapter: AnthropicAdapter,
+    ) -> None:
+        client = anthropic_stub_client
+        client.messages.error = RuntimeError("api-error")
 
-        assert any(e.event_type == EventType.TOOL_COMPLETED for e in events)
+        anthropic_adapter.wrap(client)
 
+        with pytest.raises(RuntimeError, match="api-error"):
+            client.messages.create()
 
-# ===========================================================================
-# AnthropicAdapter
-# ===========================================================================
+        assert EventType.ERROR_OCCURRED in seen
 
+    def test_patched_create_emits_tool_called_for_tool_use_block(
+        self,
+        seen: set[EventType],
+        anthropic_stub_client: SimpleNamespace,
+        anthropic_adapter: AnthropicAdapter,
+    ) -> None:
+        tool_block = SimpleNamespace(type="tool_use", name="my_function", input={"query": "test"})
 
-class TestAnthropicAdapterWithoutSDK:
-    def test_get_framework_name(self) -> None:
-        bus = EventBus()
-        adapter = AnthropicAdapter("ant-1", bus)
-        assert adapter.get_framework_name() == "anthropic"
+        client = anthropic_stub_client
+        client.messages.response = SimpleNamespace(content=[tool_block], usage=None)
 
-    def test_wrap_returns_original_when_sdk_absent(self) -> None:
-        bus = EventBus()
-        adapter = AnthropicAdapter("ant-1", bus)
-        sentinel = object()
-        with patch("agentcore.adapters.anthropic_sdk._ANTHROPIC_AVAILABLE", False):
-            result = adapter.wrap(sentinel)
-        assert result is sentinel
+        anthropic_adapter.wrap(client)
 
-    def test_emit_events_updates_bus(self) -> None:
-        bus1 = EventBus()
-        bus2 = EventBus()
-        adapter = AnthropicAdapter("ant-1", bus1)
-        adapter.emit_events(bus2)
-        assert adapter._bus is bus2
+        client.messages.create()
 
-    def test_agent_id_property(self) -> None:
-        bus = EventBus()
-        adapter = AnthropicAdapter("ant-agent-42", bus)
-        assert adapter.agent_id == "ant-agent-42"
+        assert EventType.TOOL_CALLED in seen
 
-    def test_repr_contains_framework_and_agent_id(self) -> None:
-        bus = EventBus()
-        adapter = AnthropicAdapter("ant-1", bus)
-        text = repr(adapter)
-        assert "anthropic" in text
-        assert "ant-1" in text
+    def test_patched_create_emits_cost_incurred_with_usage(
+        self,
+        events: list[AgentEvent],
+        anthropic_stub_client: SimpleNamespace,
+        anthropic_adapter: AnthropicAdapter,
+    ) -> None:
+        usage = SimpleNamespace(input_tokens=100, output_tokens=50)
 
+        client = anthropic_stub_client
+        client.messages.response = SimpleNamespace(content=[], usage=usage)
 
-class TestAnthropicAdapterWithMockSDK:
-    def _make_mock_client(self) -> MagicMock:
-        client = MagicMock()
-        client.messages = MagicMock()
-        client.messages.create = MagicMock(return_value=MagicMock(content=[], usage=None))
-        return client
+        anthropic_adapter.wrap(client)
 
-    def test_wrap_patches_messages_create(self) -> None:
-        bus = EventBus()
-        adapter = AnthropicAdapter("ant-1", bus)
-        client = self._make_mock_client()
+        client.messages.create()
 
-        with patch("agentcore.adapters.anthropic_sdk._ANTHROPIC_AVAILABLE", True):
-            result = adapter.wrap(client)
+        cost_events = [e for e in events if e.event_type is EventType.COST_INCURRED]
+        assert len(cost_events) == 1
+        assert cost_events[0].data["input_tokens"] == 100
+        assert cost_events[0].data["output_tokens"] == 50
 
-        assert result is client
-        # create should now be the patched version (not the original MagicMock)
-        assert callable(client.messages.create)
 
-    def test_wrap_client_without_messages_logs_warning(self) -> None:
-        bus = EventBus()
-        adapter = AnthropicAdapter("ant-1", bus)
+class TestAnthropicHelpers:
+    def test_tool_use_events_with_tool_use_block(
+        self, anthropic_adapter: AnthropicAdapter
+    ) -> None:
+        block = SimpleNamespace(type="tool_use", name="search", input={"q": "hello"})
+        response = SimpleNamespace(content=[block])
 
-        class NoMessages:
-            pass
+        events = _tool_use_events(response, anthropic_adapter)
 
-        obj = NoMessages()
-        with patch("agentcore.adapters.anthropic_sdk._ANTHROPIC_AVAILABLE", True):
-            result = adapter.wrap(obj)
+        assert [e.event_type for e in events] == [EventType.TOOL_CALLED]
 
-        assert result is obj
+    def test_tool_use_events_skips_non_tool_blocks(
+        self, anthropic_adapter: AnthropicAdapter
+    ) -> None:
+        block = SimpleNamespace(type="text", text="hello")
+        response = SimpleNamespace(content=[block])
 
-    def test_patched_create_emits_started_stopped(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = AnthropicAdapter("ant-1", bus)
-        client = self._make_mock_client()
+        assert _tool_use_events(response, anthropic_adapter) == []
 
-        with patch("agentcore.adapters.anthropic_sdk._ANTHROPIC_AVAILABLE", True):
-            adapter.wrap(client)
+    def test_cost_events_with_none_usage(self, anthropic_adapter: AnthropicAdapter) -> None:
+        response = SimpleNamespace(usage=None)
 
-        client.messages.create()  # call the patched method
+        assert _cost_events(response, anthropic_adapter) == []
 
-        event_types = [e.event_type for e in events]
-        assert EventType.AGENT_STARTED in event_types
-        assert EventType.AGENT_STOPPED in event_types
+    def test_cost_events_builds_cost_incurred(self, anthropic_adapter: AnthropicAdapter) -> None:
+        usage = SimpleNamespace(input_tokens=200, output_tokens=75)
+        response = SimpleNamespace(usage=usage)
 
-    def test_patched_create_emits_error_on_exception(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = AnthropicAdapter("ant-1", bus)
-        client = self._make_mock_client()
-        client.messages.create.side_effect = RuntimeError("api-error")
+        cost_events = _cost_events(response, anthropic_adapter)
 
-        with patch("agentcore.adapters.anthropic_sdk._ANTHROPIC_AVAILABLE", True):
-            adapter.wrap(client)
+        assert len(cost_events) == 1
+        assert cost_events[0].event_type is EventType.COST_INCURRED
+        assert cost_events[0].data["input_tokens"] == 200
 
-        with pytest.raises(RuntimeError, match="api-error"):
-            client.messages.create()
+    def test_response_events_for_empty_response_is_just_stopped(
+        self, anthropic_adapter: AnthropicAdapter
+    ) -> None:
+        response = SimpleNamespace(content=[], usage=None)
 
-        assert any(e.event_type == EventType.ERROR_OCCURRED for e in events)
+        events = _response_events(response, anthropic_adapter)
 
-    def test_patched_create_emits_tool_called_for_tool_use_block(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = AnthropicAdapter("ant-1", bus)
+        assert [e.event_type for e in events] == [EventType.AGENT_STOPPED]
 
-        tool_block = MagicMock()
-        tool_block.type = "tool_use"
-        tool_block.name = "my_function"
-        tool_block.input = {"query": "test"}
+    def test_response_events_orders_stopped_tools_then_cost(
+        self, anthropic_adapter: AnthropicAdapter
+    ) -> None:
+        block = SimpleNamespace(type="tool_use", name="search", input={})
+        usage = SimpleNamespace(input_tokens=1, output_tokens=2)
+        response = SimpleNamespace(content=[block], usage=usage)
 
-        mock_response = MagicMock()
-        mock_response.content = [tool_block]
-        mock_response.usage = None
+        events = _response_events(response, anthropic_adapter)
 
-        client = self._make_mock_client()
-        client.messages.create.return_value = mock_response
+        assert [e.event_type for e in events] == [
+            EventType.AGENT_STOPPED,
+            EventType.TOOL_CALLED,
+            EventType.COST_INCURRED,
+        ]
 
-        with patch("agentcore.adapters.anthropic_sdk._ANTHROPIC_AVAILABLE", True):
-            adapter.wrap(client)
 
-        client.messages.create()
+# ===========================================================================
+# MicrosoftAgentAdapter
+# ===========================================================================
+
+
+@pytest.mark.usefixtures("sdk_available")
+class TestMicrosoftAgentAdapterWithMockSDK:
+    sdk_flag = "agentcore.adapters.microsoft_agents._MICROSOFT_AGENTS_AVAILABLE"
 
-        assert any(e.event_type == EventType.TOOL_CALLED for e in events)
+    def test_wrap_patches_on_turn(
+        self, ms_bot_stub: _StubBot, microsoft_adapter: MicrosoftAgentAdapter
+    ) -> None:
+        bot = ms_bot_stub
+        original_turn = bot.on_turn
 
-    def test_patched_create_emits_cost_incurred_with_usage(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = AnthropicAdapter("ant-1", bus)
+        result = microsoft_adapter.wrap(bot)
 
-        usage = MagicMock()
-        usage.input_tokens = 100
-        usage.output_tokens = 50
+        assert result is bot
+        # on_turn should now be the patched function
+        assert bot.on_turn != original_turn
 
-        mock_response = MagicMock()
-        mock_response.content = []
-        mock_response.usage = usage
+    def test_wrap_patches_on_message_activity(
+        self, ms_bot_stub: _StubBot, microsoft_adapter: MicrosoftAgentAdapter
+    ) -> None:
+        bot = ms_bot_stub
+        original_message = bot.on_message_activity
 
-        client = self._make_mock_client()
-        client.messages.create.return_value = mock_response
+        microsoft_adapter.wrap(bot)
 
-        with patch("agentcore.adapters.anthropic_sdk._ANTHROPIC_AVAILABLE", True):
-            adapter.wrap(client)
+        assert bot.on_message_activity != original_message
 
-        client.messages.create()
+    async def test_patched_on_turn_emits_started_stopped(
+        self,
+        record_types: Callable[..., set[EventType]],
+        ms_bot_stub: _StubBot,
+        microsoft_adapter: MicrosoftAgentAdapter,
+    ) -> None:
+        recorded = record_types(EventType.AGENT_STARTED, EventType.AGENT_STOPPED)
+        bot = ms_bot_stub
 
-        cost_events = [e for e in events if e.event_type == EventType.COST_INCURRED]
-        assert len(cost_events) == 1
-        assert cost_events[0].data["input_tokens"] == 100
-        assert cost_events[0].data["output_tokens"] == 50
+        microsoft_adapter.wrap(bot)
 
+        turn_context = SimpleNamespace()
+        await bot.on_turn(turn_context)
 
-class TestAnthropicHelpers:
-    def test_emit_tool_use_events_with_tool_use_block(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = AnthropicAdapter("ant-1", bus)
+        assert recorded == {EventType.AGENT_STARTED, EventType.AGENT_STOPPED}
 
-        block = MagicMock()
-        block.type = "tool_use"
-        block.name = "search"
-        block.input = {"q": "hello"}
+    async def test_patched_on_turn_emits_error_on_exception(
+        self, seen: set[EventType], ms_bot_stub: _StubBot, microsoft_adapter: MicrosoftAgentAdapter
+    ) -> None:
+        bot = ms_bot_stub
+        bot.turn_error = RuntimeError("turn-error")
 
-        response = MagicMock()
-        response.content = [block]
+        microsoft_adapter.wrap(bot)
 
-        _emit_tool_use_events(response, adapter)
+        with pytest.raises(RuntimeError, match="turn-error"):
+            await bot.on_turn(SimpleNamespace())
 
-        assert any(e.event_type == EventType.TOOL_CALLED for e in events)
+        assert EventType.ERROR_OCCURRED in seen
 
-    def test_emit_tool_use_events_skips_non_tool_blocks(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = AnthropicAdapter("ant-1", bus)
+    async def test_patched_on_message_emits_message_received(
+        self, seen: set[EventType], ms_bot_stub: _StubBot, microsoft_adapter: MicrosoftAgentAdapter
+    ) -> None:
+        bot = ms_bot_stub
 
-        block = MagicMock()
-        block.type = "text"
-        block.text = "hello"
+        microsoft_adapter.wrap(bot)
 
-        response = MagicMock()
-        response.content = [block]
+        turn_context = SimpleNamespace(activity=SimpleNamespace(text="Hello bot!"))
+        await bot.on_message_activity(turn_context)
 
-        _emit_tool_use_events(response, adapter)
+        assert EventType.MESSAGE_RECEIVED in seen
 
-        assert not any(e.event_type == EventType.TOOL_CALLED for e in events)
+    async def test_wrap_patches_on_invoke_activity_when_present(
+        self,
+        record_types: Callable[..., set[EventType]],
+        ms_bot_stub: _StubBot,
+        microsoft_adapter: MicrosoftAgentAdapter,
+    ) -> None:
+        recorded = record_types(EventType.TOOL_CALLED, EventType.TOOL_COMPLETED)
 
-    def test_emit_cost_event_with_none_usage(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = AnthropicAdapter("ant-1", bus)
+        async def on_invoke_activity(turn_context: object) -> str:
+            return "invoke-result"
 
-        response = MagicMock()
-        response.usage = None
+        bot = ms_bot_stub
+        bot.on_invoke_activity = on_invoke_activity  # type: ignore[attr-defined]
 
-        _emit_cost_event(response, adapter)
+        microsoft_adapter.wrap(bot)
 
-        assert not any(e.event_type == EventType.COST_INCURRED for e in events)
+        turn_context = SimpleNamespace(activity=SimpleNamespace(name="my_invoke"))
+        await bot.on_invoke_activity(turn_context)
 
-    def test_emit_cost_event_emits_cost_incurred(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = AnthropicAdapter("ant-1", bus)
+        assert recorded == {EventType.TOOL_CALLED, EventType.TOOL_COMPLETED}
 
-        usage = MagicMock()
-        usage.input_tokens = 200
-        usage.output_tokens = 75
+    async def test_wrap_on_invoke_activity_emits_tool_failed_on_error(
+        self, seen: set[EventType], ms_bot_stub: _StubBot, microsoft_adapter: MicrosoftAgentAdapter
+    ) -> None:
+        async def on_invoke_activity(turn_context: object) -> None:
+            raise ValueError("invoke-err")
 
-        response = MagicMock()
-        response.usage = usage
+        bot = ms_bot_stub
+        bot.on_invoke_activity = on_invoke_activity  # type: ignore[attr-defined]
 
-        _emit_cost_event(response, adapter)
+        microsoft_adapter.wrap(bot)
 
-        cost_events = [e for e in events if e.event_type == EventType.COST_INCURRED]
-        assert len(cost_events) == 1
-        assert cost_events[0].data["input_tokens"] == 200
+        with pytest.raises(ValueError, match="invoke-err"):
+            await bot.on_invoke_activity(SimpleNamespace())
+
+        assert EventType.TOOL_FAILED in seen
 
 
 # ===========================================================================
-# MicrosoftAgentAdapter
+# Anthropic and Microsoft adapters without their SDK
 # ===========================================================================
 
-
-class TestMicrosoftAgentAdapterWithoutSDK:
-    def test_get_framework_name(self) -> None:
-        bus = EventBus()
-        adapter = MicrosoftAgentAdapter("ms-1", bus)
-        assert adapter.get_framework_name() == "microsoft_agents"
-
-    def test_wrap_returns_original_when_sdk_absent(self) -> None:
-        bus = EventBus()
-        adapter = MicrosoftAgentAdapter("ms-1", bus)
+class _SdkLessCase(NamedTuple):
+    adapter_cls: type[FrameworkAdapter]
+    framework_name: str
+    available_flag: str
+    agent_id: str
+
+
+_SDK_LESS_ADAPTERS = [
+    pytest.param(
+        _SdkLessCase(
+            AnthropicAdapter,
+            "anthropic",
+            "agentcore.adapters.anthropic_sdk._ANTHROPIC_AVAILABLE",
+            "ant-1",
+        ),
+        id="anthropic",
+    ),
+    pytest.param(
+        _SdkLessCase(
+            MicrosoftAgentAdapter,
+            "microsoft_agents",
+            "agentcore.adapters.microsoft_agents._MICROSOFT_AGENTS_AVAILABLE",
+            "ms-1",
+        ),
+        id="microsoft_agents",
+    ),
+]
+
+
+@pytest.mark.parametrize("case", _SDK_LESS_ADAPTERS)
+class TestAdapterWithoutSDK:
+    @pytest.fixture()
+    def adapter(self, case: _SdkLessCase, bus: EventBus) -> FrameworkAdapter:
+        return case.adapter_cls(case.agent_id, bus)
+
+    def test_get_framework_name(self, adapter: FrameworkAdapter, case: _SdkLessCase) -> None:
+        assert adapter.get_framework_name() == case.framework_name
+
+    def test_wrap_returns_original_when_sdk_absent(
+        self, adapter: FrameworkAdapter, case: _SdkLessCase
+    ) -> None:
         sentinel = object()
-        with patch("agentcore.adapters.microsoft_agents._MICROSOFT_AGENTS_AVAILABLE", False):
+        with patch(case.available_flag, False):
             result = adapter.wrap(sentinel)
         assert result is sentinel
 
-    def test_emit_events_updates_bus(self) -> None:
-        bus1 = EventBus()
+    def test_emit_events_updates_bus(self, adapter: FrameworkAdapter) -> None:
         bus2 = EventBus()
-        adapter = MicrosoftAgentAdapter("ms-1", bus1)
         adapter.emit_events(bus2)
         assert adapter._bus is bus2
 
-    def test_agent_id_property(self) -> None:
-        bus = EventBus()
-        adapter = MicrosoftAgentAdapter("ms-agent-99", bus)
-        assert adapter.agent_id == "ms-agent-99"
+    def test_agent_id_property(self, adapter: FrameworkAdapter, case: _SdkLessCase) -> None:
+        assert adapter.agent_id == case.agent_id
 
-    def test_repr_contains_framework_and_agent_id(self) -> None:
-        bus = EventBus()
-        adapter = MicrosoftAgentAdapter("ms-1", bus)
+    def test_repr_contains_framework_and_agent_id(
+        self, adapter: FrameworkAdapter, case: _SdkLessCase
+    ) -> None:
         text = repr(adapter)
-        assert "microsoft_agents" in text
-        assert "ms-1" in text
-
-
-class TestMicrosoftAgentAdapterWithMockSDK:
-    def _make_mock_bot(self) -> MagicMock:
-        bot = MagicMock()
-        bot.on_turn = AsyncMock()
-        bot.on_message_activity = AsyncMock()
-        return bot
-
-    def test_wrap_patches_on_turn(self) -> None:
-        bus = EventBus()
-        adapter = MicrosoftAgentAdapter("ms-1", bus)
-        bot = self._make_mock_bot()
-        original_turn = bot.on_turn
-
-        with patch("agentcore.adapters.microsoft_agents._MICROSOFT_AGENTS_AVAILABLE", True):
-            result = adapter.wrap(bot)
-
-        assert result is bot
-        # on_turn should now be the patched function
-        assert bot.on_turn is not original_turn
-
-    def test_wrap_patches_on_message_activity(self) -> None:
-        bus = EventBus()
-        adapter = MicrosoftAgentAdapter("ms-1", bus)
-        bot = self._make_mock_bot()
-        original_message = bot.on_message_activity
-
-        with patch("agentcore.adapters.microsoft_agents._MICROSOFT_AGENTS_AVAILABLE", True):
-            adapter.wrap(bot)
-
-        assert bot.on_message_activity is not original_message
-
-    def test_patched_on_turn_emits_started_stopped(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = MicrosoftAgentAdapter("ms-1", bus)
-        bot = self._make_mock_bot()
-
-        with patch("agentcore.adapters.microsoft_agents._MICROSOFT_AGENTS_AVAILABLE", True):
-            adapter.wrap(bot)
-
-        mock_context = MagicMock()
-        loop = asyncio.new_event_loop()
-        try:
-            loop.run_until_complete(bot.on_turn(mock_context))
-        finally:
-            loop.close()
-
-        event_types = [e.event_type for e in events]
-        assert EventType.AGENT_STARTED in event_types
-        assert EventType.AGENT_STOPPED in event_types
-
-    def test_patched_on_turn_emits_error_on_exception(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = MicrosoftAgentAdapter("ms-1", bus)
-        bot = self._make_mock_bot()
-        bot.on_turn.side_effect = RuntimeError("turn-error")
-
-        with patch("agentcore.adapters.microsoft_agents._MICROSOFT_AGENTS_AVAILABLE", True):
-            adapter.wrap(bot)
-
-        loop = asyncio.new_event_loop()
-        try:
-            with pytest.raises(RuntimeError, match="turn-error"):
-                loop.run_until_complete(bot.on_turn(MagicMock()))
-        finally:
-            loop.close()
-
-        assert any(e.event_type == EventType.ERROR_OCCURRED for e in events)
-
-    def test_patched_on_message_emits_message_received(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = MicrosoftAgentAdapter("ms-1", bus)
-        bot = self._make_mock_bot()
-
-        with patch("agentcore.adapters.microsoft_agents._MICROSOFT_AGENTS_AVAILABLE", True):
-            adapter.wrap(bot)
-
-        mock_context = MagicMock()
-        mock_context.activity.text = "Hello bot!"
-        loop = asyncio.new_event_loop()
-        try:
-            loop.run_until_complete(bot.on_message_activity(mock_context))
-        finally:
-            loop.close()
-
-        assert any(e.event_type == EventType.MESSAGE_RECEIVED for e in events)
-
-    def test_wrap_patches_on_invoke_activity_when_present(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = MicrosoftAgentAdapter("ms-1", bus)
-        bot = self._make_mock_bot()
-        bot.on_invoke_activity = AsyncMock(return_value="invoke-result")
-
-        with patch("agentcore.adapters.microsoft_agents._MICROSOFT_AGENTS_AVAILABLE", True):
-            adapter.wrap(bot)
-
-        mock_context = MagicMock()
-        mock_context.activity.name = "my_invoke"
-        loop = asyncio.new_event_loop()
-        try:
-            loop.run_until_complete(bot.on_invoke_activity(mock_context))
-        finally:
-            loop.close()
-
-        event_types = [e.event_type for e in events]
-        assert EventType.TOOL_CALLED in event_types
-        assert EventType.TOOL_COMPLETED in event_types
-
-    def test_wrap_on_invoke_activity_emits_tool_failed_on_error(self) -> None:
-        bus = EventBus()
-        events = _collect_events(bus)
-        adapter = MicrosoftAgentAdapter("ms-1", bus)
-        bot = self._make_mock_bot()
-        bot.on_invoke_activity = AsyncMock(side_effect=ValueError("invoke-err"))
-
-        with patch("agentcore.adapters.microsoft_agents._MICROSOFT_AGENTS_AVAILABLE", True):
-            adapter.wrap(bot)
-
-        loop = asyncio.new_event_loop()
-        try:
-            with pytest.raises(ValueError, match="invoke-err"):
-                loop.run_until_complete(bot.on_invoke_activity(MagicMock()))
-        finally:
-            loop.close()
-
-        assert any(e.event_type == EventType.TOOL_FAILED for e in events)
+        assert case.framework_name in text
+        assert case.agent_id in text
@@ -6,10 +6,15 @@ emit_sync, history, introspection, and exception safety.
 from __future__ import annotations
 
 import asyncio
+import gc
+import threading
+from unittest.mock import patch
 
 import pytest
 
 from agentcore.bus.event_bus import EventBus
+from agentcore.bus.filters import AgentFilter, TypeFilter
+from agentcore.bus.subscriber import FilteredSubscriber
 from agentcore.schema.errors import EventBusError
 from agentcore.schema.events import AgentEvent, EventType
 
@@ -24,6 +29,20 @@ def bus() -> EventBus:
     return EventBus()
 
 
+@pytest.fixture()
+def created_loops(monkeypatch: pytest.MonkeyPatch) -> list[asyncio.AbstractEventLoop]:
+    """Every event loop the bus creates during the test, in creation order."""
+    loops: list[asyncio.AbstractEventLoop] = []
+    real_new_event_loop = asyncio.new_event_loop
+
+    def recording_new_event_loop() -> asyncio.AbstractEventLoop:
+        loops.append(real_new_event_loop())
+        return loops[-1]
+
+    monkeypatch.setattr("agentcore.bus.event_bus.asyncio.new_event_loop", recording_new_event_loop)
+    return loops
+
+
 def _evt(
     event_type: EventType = EventType.CUSTOM, agent_id: str = "agent-1"
 ) -> AgentEvent:
@@ -66,10 +85,32 @@ class TestEventBusSubscription:
         with pytest.raises(EventBusError):
             bus.unsubscribe("non-existent-id")
 
+    def test_unsubscribe_twice_raises(self, bus: EventBus) -> None:
+        sub_id = bus.subscribe(EventType.CUSTOM, lambda e: None)
+        bus.unsubscribe(sub_id)
+        with pytest.raises(EventBusError):
+            bus.unsubscribe(sub_id)
+
+    async def test_unsubscribe_leaves_other_types_subscribed(self, bus: EventBus) -> None:
+        received: list[AgentEvent] = []
+        started_id = bus.subscribe(EventType.AGENT_STARTED, received.append)
+        bus.subscribe(EventType.AGENT_STOPPED, received.append)
+        bus.unsubscribe(started_id)
+        await bus.emit(_evt(EventType.AGENT_STARTED))
+        await bus.emit(_evt(EventType.AGENT_STOPPED))
+        assert [e.event_type for e in received] == [EventType.AGENT_STOPPED]
+
     def test_subscribe_with_invalid_event_type_raises(self, bus: EventBus) -> None:
         with pytest.raises(EventBusError):
             bus.subscribe("not_an_event_type", lambda e: None)  # type: ignore[arg-type]
 
+    def test_subscribe_non_callable_handler_raises(self, bus: EventBus) -> None:
+        with pytest.raises(EventBusError, match="not callable"):
+            bus.subscribe(EventType.CUSTOM, "handler")  # type: ignore[arg-type]
+        with pytest.raises(EventBusError, match="not callable"):
+            bus.subscribe_all(None)  # type: ignore[arg-type]
+        assert bus.subscriber_count() == 0
+
     def test_multiple_subscribers_for_same_type(self, bus: EventBus) -> None:
         bus.subscribe(EventType.CUSTOM, lambda e: None)
         bus.subscribe(EventType.CUSTOM, lambda e: None)
@@ -137,10 +178,202 @@ class TestEventBusEmit:
         await bus.emit(_evt())
         assert len(received) == 1
 
+    async def test_async_callable_object_is_awaited(self, bus: EventBus) -> None:
+        received: list[AgentEvent] = []
+
+        class AsyncHandler:
+            async def __call__(self, event: AgentEvent) -> None:
+                received.append(event)
+
+        bus.subscribe(EventType.CUSTOM, AsyncHandler())
+        await bus.emit(_evt())
+        assert len(received) == 1
+
+    async def test_sync_handler_returning_coroutine_is_awaited(self, bus: EventBus) -> None:
+        received: list[AgentEvent] = []
+
+        async def async_handler(event: AgentEvent) -> None:
+            received.append(event)
+
+        bus.subscribe_all(lambda event: async_handler(event))
+        await bus.emit(_evt())
+        assert len(received) == 1
+
+    async def test_subscription_changes_between_emits_take_effect(
+        self, bus: EventBus
+    ) -> None:
+        received: list[str] = []
+        bus.subscribe(EventType.CUSTOM, lambda e: received.append("type"))
+        await bus.emit(_evt())
+        global_id = bus.subscribe_all(lambda e: received.append("global"))
+        await bus.emit(_evt())
+        bus.unsubscribe(global_id)
+        await bus.emit(_evt())
+        assert received == ["type", "type", "global", "type"]
+
     async def test_emit_adds_to_history(self, bus: EventBus) -> None:
         await bus.emit(_evt())
         assert len(bus.get_history()) == 1
 
+    async def test_emit_sync_from_handler_is_delivered_after_current_event(
+        self, bus: EventBus
+    ) -> None:
+        """A synchronous emit from a handler reaches everyone after the current event."""
+        order: list[tuple[str, EventType]] = []
+
+        def first(event: AgentEvent) -> None:
+            order.append(("first", event.event_type))
+            if event.event_type == EventType.AGENT_STARTED:
+                bus.emit_sync(_evt(EventType.AGENT_STOPPED))
+
+        def second(event: AgentEvent) -> None:
+            order.append(("second", event.event_type))
+
+        bus.subscribe_all(first)
+        bus.subscribe_all(second)
+        await bus.emit(_evt(EventType.AGENT_STARTED))
+        assert order == [
+            ("first", EventType.AGENT_STARTED),
+            ("second", EventType.AGENT_STARTED),
+            ("first", EventType.AGENT_STOPPED),
+            ("second", EventType.AGENT_STOPPED),
+        ]
+        assert [e.event_type for e in bus.get_history()] == [
+            EventType.AGENT_STARTED,
+            EventType.AGENT_STOPPED,
+        ]
+
+    async def test_awaited_emit_from_handler_is_delivered_before_returning(
+        self, bus: EventBus
+    ) -> None:
+        """A handler can await an emit and then wait for a subscriber's reply."""
+        reply: asyncio.Future[AgentEvent] = asyncio.get_running_loop().create_future()
+        replies: list[AgentEvent] = []
+
+        async def requester(event: AgentEvent) -> None:
+            await bus.emit(_evt(EventType.TOOL_CALLED))
+            replies.append(await asyncio.wait_for(reply, timeout=1.0))
+
+        bus.subscribe(EventType.AGENT_STARTED, requester)
+        bus.subscribe(EventType.TOOL_CALLED, reply.set_result)
+        await bus.emit(_evt(EventType.AGENT_STARTED))
+        assert [e.event_type for e in replies] == [EventType.TOOL_CALLED]
+        assert [e.event_type for e in bus.get_history()] == [
+            EventType.AGENT_STARTED,
+            EventType.TOOL_CALLED,
+        ]
+
+    async def test_concurrent_emitters_each_deliver_before_returning(
+        self, bus: EventBus
+    ) -> None:
+        received: list[AgentEvent] = []
+
+        async def slow_handler(event: AgentEvent) -> None:
+            await asyncio.sleep(0)
+            received.append(event)
+
+        bus.subscribe_all(slow_handler)
+
+        async def emit_and_check(event: AgentEvent) -> bool:
+            await bus.emit(event)
+            return event in received
+
+        results = await asyncio.gather(
+            emit_and_check(_evt(agent_id="a")), emit_and_check(_evt(agent_id="b"))
+        )
+        assert results == [True, True]
+
+
+# ---------------------------------------------------------------------------
+# Type-filtered global subscribers
+# ---------------------------------------------------------------------------
+
+
+class TestEventBusTypeFilteredSubscribers:
+    async def test_only_matching_type_handler_is_invoked(self, bus: EventBus) -> None:
+        calls: dict[EventType, int] = dict.fromkeys(EventType, 0)
+        for event_type in EventType:
+
+            def handler(event: AgentEvent, event_type: EventType = event_type) -> None:
+                calls[event_type] += 1
+
+            bus.subscribe_all(FilteredSubscriber(handler, TypeFilter(event_type)))
+        with patch.object(TypeFilter, "matches", side_effect=AssertionError("scanned")):
+            await bus.emit(_evt(EventType.TOOL_CALLED))
+        assert calls[EventType.TOOL_CALLED] == 1
+        assert sum(calls.values()) == 1
+
+    async def test_multi_type_filter_receives_each_type(self, bus: EventBus) -> None:
+        received: list[AgentEvent] = []
+        gate = TypeFilter(EventType.AGENT_STARTED, EventType.AGENT_STOPPED)
+        bus.subscribe_all(FilteredSubscriber(received.append, gate))
+        for event_type in (EventType.AGENT_STARTED, EventType.CUSTOM, EventType.AGENT_STOPPED):
+            await bus.emit(_evt(event_type))
+        assert [e.event_type for e in received] == [
+            EventType.AGENT_STARTED,
+            EventType.AGENT_STOPPED,
+        ]
+
+    async def test_unsubscribe_removes_every_type(self, bus: EventBus) -> None:
+        received: list[AgentEvent] = []
+        gate = TypeFilter(EventType.AGENT_STARTED, EventType.AGENT_STOPPED)
+        sub_id = bus.subscribe_all(FilteredSubscriber(received.append, gate))
+        assert bus.subscriber_count() == 1
+        bus.unsubscribe(sub_id)
+        await bus.emit(_evt(EventType.AGENT_STARTED))
+        await bus.emit(_evt(EventType.AGENT_STOPPED))
+        assert received == []
+        assert bus.subscriber_count() == 0
+
+    async def test_other_filters_stay_global(self, bus: EventBus) -> None:
+        received: list[AgentEvent] = []
+        bus.subscribe_all(FilteredSubscriber(received.append, AgentFilter("agent-2")))
+        await bus.emit(_evt(agent_id="agent-1"))
+        await bus.emit(_evt(agent_id="agent-2"))
+        assert [e.agent_id for e in received] == ["agent-2"]
+
+
+# ---------------------------------------------------------------------------
+# Emission — batches
+# ---------------------------------------------------------------------------
+
+
+class TestEventBusEmitMany:
+    async def test_emit_many_delivers_in_order(self, bus: EventBus) -> None:
+        received: list[AgentEvent] = []
+        bus.subscribe_all(received.append)
+        batch = [
+            _evt(EventType.AGENT_STARTED),
+            _evt(EventType.CUSTOM),
+            _evt(EventType.AGENT_STOPPED),
+        ]
+        await bus.emit_many(batch)
+        assert received == batch
+
+    async def test_emit_many_routes_by_type(self, bus: EventBus) -> None:
+        started: list[AgentEvent] = []
+        bus.subscribe(EventType.AGENT_STARTED, started.append)
+        await bus.emit_many([_evt(EventType.AGENT_STARTED), _evt(EventType.CUSTOM)])
+        assert [e.event_type for e in started] == [EventType.AGENT_STARTED]
+
+    async def test_emit_many_adds_batch_to_history(self, bus: EventBus) -> None:
+        batch = [_evt(), _evt()]
+        await bus.emit_many(batch)
+        assert bus.get_history() == batch
+
+    async def test_emit_many_empty_is_noop(self, bus: EventBus) -> None:
+        received: list[AgentEvent] = []
+        bus.subscribe_all(received.append)
+        await bus.emit_many([])
+        assert received == []
+        assert bus.get_history() == []
+
+    def test_emit_many_sync_delivers_events(self, bus: EventBus) -> None:
+        received: list[AgentEvent] = []
+        bus.subscribe_all(received.append)
+        bus.emit_many_sync([_evt(), _evt()])
+        assert len(received) == 2
+
 
 # ---------------------------------------------------------------------------
 # Emission — sync wrapper
@@ -161,6 +394,54 @@ class TestEventBusEmitSync:
         bus.emit_sync(_evt(EventType.AGENT_STARTED))
         assert len(received) == 1
 
+    def test_emit_sync_reuses_its_event_loop(self, bus: EventBus) -> None:
+        received: list[AgentEvent] = []
+        bus.subscribe_all(received.append)
+        real_new_event_loop = asyncio.new_event_loop
+        with patch(
+            "agentcore.bus.event_bus.asyncio.new_event_loop", wraps=real_new_event_loop
+        ) as new_loop:
+            for _ in range(3):
+                bus.emit_sync(_evt())
+        assert len(received) == 3
+        assert new_loop.call_count == 1
+
+    def test_emit_sync_cancels_tasks_left_by_handlers(self, bus: EventBus) -> None:
+        spawned: list[asyncio.Task[None]] = []
+
+        async def spawning_handler(event: AgentEvent) -> None:
+            spawned.append(asyncio.get_running_loop().create_task(asyncio.sleep(60)))
+
+        bus.subscribe_all(spawning_handler)
+        bus.emit_sync(_evt())
+        assert len(spawned) == 1
+        assert spawned[0].cancelled()
+
+    def test_emit_sync_loop_is_closed_when_its_thread_exits(
+        self, bus: EventBus, created_loops: list[asyncio.AbstractEventLoop]
+    ) -> None:
+        bus.subscribe_all(lambda e: None)
+        for _ in range(5):
+            thread = threading.Thread(target=bus.emit_sync, args=(_evt(),))
+            thread.start()
+            thread.join()
+        gc.collect()
+        assert len(created_loops) == 5
+        assert all(loop.is_closed() for loop in created_loops)
+
+    def test_close_closes_sync_loops_and_bus_stays_usable(
+        self, bus: EventBus, created_loops: list[asyncio.AbstractEventLoop]
+    ) -> None:
+        received: list[AgentEvent] = []
+        bus.subscribe_all(received.append)
+        bus.emit_sync(_evt())
+        bus.close()
+        assert created_loops[0].is_closed()
+        bus.emit_sync(_evt())
+        assert len(created_loops) == 2
+        assert len(received) == 2
+        bus.close()
+
 
 # ---------------------------------------------------------------------------
 # History
@@ -199,6 +480,37 @@ class TestEventBusHistory:
         await no_hist_bus.emit(_evt())
         assert no_hist_bus.get_history() == []
 
+    def test_emit_sync_without_observers_skips_dispatch(self) -> None:
+        no_hist_bus = EventBus(max_history=0)
+        no_hist_bus.subscribe(EventType.AGENT_STOPPED, lambda e: None)
+        with patch.object(no_hist_bus, "_run_sync") as run_sync:
+            no_hist_bus.emit_sync(_evt(EventType.AGENT_STARTED))
+        run_sync.assert_not_called()
+
+    def test_emit_many_sync_without_observers_skips_dispatch(self) -> None:
+        no_hist_bus = EventBus(max_history=0)
+        no_hist_bus.subscribe(EventType.AGENT_STOPPED, lambda e: None)
+        with patch.object(no_hist_bus, "_run_sync") as run_sync:
+            no_hist_bus.emit_many_sync([_evt(EventType.AGENT_STARTED), _evt(EventType.CUSTOM)])
+        run_sync.assert_not_called()
+
+    async def test_emit_many_delivers_only_observed_events(self) -> None:
+        no_hist_bus = EventBus(max_history=0)
+        received: list[AgentEvent] = []
+        no_hist_bus.subscribe(EventType.AGENT_STOPPED, received.append)
+        with patch.object(no_hist_bus, "_dispatch", wraps=no_hist_bus._dispatch) as dispatch:
+            await no_hist_bus.emit_many([_evt(EventType.AGENT_STARTED), _evt(EventType.CUSTOM)])
+            dispatch.assert_not_called()
+            stopped = _evt(EventType.AGENT_STOPPED)
+            await no_hist_bus.emit_many([_evt(EventType.CUSTOM), stopped])
+        assert received == [stopped]
+        assert dispatch.call_args.args == ([stopped],)
+
+    def test_clear_history_when_disabled_is_safe(self) -> None:
+        no_hist_bus = EventBus(max_history=0)
+        no_hist_bus.clear_history()  # must not raise
+        assert "history_size=0" in repr(no_hist_bus)
+
 
 # ---------------------------------------------------------------------------
 # Introspection
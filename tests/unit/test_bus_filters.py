@@ -5,6 +5,8 @@ and the operator shortcuts (& / |).
 """
 from __future__ import annotations
 
+from enum import Enum
+
 import pytest
 
 from agentcore.bus.filters import (
@@ -35,6 +37,25 @@ def make_event(
     )
 
 
+class Key(str, Enum):
+    """str-valued enum standing in for callers' own key and id constants."""
+
+    AGENT = "agent-1"
+    TENANT = "tenant_id"
+
+
+class CountingFilter(EventFilter):
+    """Filter with a fixed verdict that counts how often it is evaluated."""
+
+    def __init__(self, verdict: bool) -> None:
+        self.verdict = verdict
+        self.calls = 0
+
+    def matches(self, event: AgentEvent) -> bool:
+        self.calls += 1
+        return self.verdict
+
+
 # ---------------------------------------------------------------------------
 # FilterMode
 # ---------------------------------------------------------------------------
@@ -100,6 +121,17 @@ class TestAgentFilter:
         assert f.matches(make_event(agent_id="a3")) is True
         assert f.matches(make_event(agent_id="a4")) is False
 
+    def test_large_agent_id_set(self) -> None:
+        f = AgentFilter(*(f"agent-{i}" for i in range(1000)))
+        assert f.matches(make_event(agent_id="agent-999")) is True
+        assert f.matches(make_event(agent_id="agent-1000")) is False
+
+    def test_repr_is_sorted_regardless_of_argument_order(self) -> None:
+        assert repr(AgentFilter("b", "a")) == repr(AgentFilter("a", "b"))
+        assert repr(TypeFilter(EventType.TOOL_CALLED, EventType.CUSTOM)) == repr(
+            TypeFilter(EventType.CUSTOM, EventType.TOOL_CALLED)
+        )
+
     def test_repr_contains_agent_ids(self) -> None:
         f = AgentFilter("my-agent")
         assert "my-agent" in repr(f)
@@ -107,6 +139,10 @@ class TestAgentFilter:
     def test_is_event_filter_subclass(self) -> None:
         assert isinstance(AgentFilter("x"), EventFilter)
 
+    def test_accepts_str_enum_agent_id(self) -> None:
+        f = AgentFilter(Key.AGENT)
+        assert f.matches(make_event(agent_id="agent-1")) is True
+
 
 # ---------------------------------------------------------------------------
 # MetadataFilter
@@ -137,6 +173,15 @@ class TestMetadataFilter:
     def test_is_event_filter_subclass(self) -> None:
         assert isinstance(MetadataFilter("k", "v"), EventFilter)
 
+    def test_metadata_filter_none_value_matches_missing_key(self) -> None:
+        f = MetadataFilter("env", None)
+        assert f.matches(make_event(metadata={})) is True
+        assert f.matches(make_event(metadata={"env": None})) is True
+
+    def test_accepts_str_enum_key(self) -> None:
+        f = MetadataFilter(Key.TENANT, "t1")
+        assert f.matches(make_event(metadata={"tenant_id": "t1"})) is True
+
 
 # ---------------------------------------------------------------------------
 # CompositeFilter
@@ -176,6 +221,62 @@ class TestCompositeFilter:
         evt = make_event(EventType.CUSTOM, "agent-99")
         assert f.matches(evt) is False
 
+    @pytest.mark.parametrize("reorder_interval", [0, 10])
+    @pytest.mark.parametrize(
+        ("mode", "deciding_verdict"), [(FilterMode.ALL, False), (FilterMode.ANY, True)]
+    )
+    def test_stops_at_first_deciding_child(
+        self, mode: FilterMode, deciding_verdict: bool, reorder_interval: int
+    ) -> None:
+        first = CountingFilter(deciding_verdict)
+        rest = [CountingFilter(not deciding_verdict) for _ in range(3)]
+        f = CompositeFilter([first, *rest], mode=mode, reorder_interval=reorder_interval)
+        assert f.matches(make_event()) is deciding_verdict
+        assert first.calls == 1
+        assert [child.calls for child in rest] == [0, 0, 0]
+
+    def test_reorder_moves_rejecting_child_first_in_all_mode(self) -> None:
+        never = CountingFilter(False)
+        children = [CountingFilter(True), CountingFilter(True), never]
+        f = CompositeFilter(
+            children,
+            mode=FilterMode.ALL,
+            reorder_interval=100,
+        )
+        event = make_event()
+        for _ in range(1000):
+            assert f.matches(event) is False
+        for child in children:
+            child.calls = 0
+        assert f.matches(event) is False
+        # Only the deciding child, now first, is evaluated
+        assert [child.calls for child in children] == [0, 0, 1]
+
+    def test_reorder_moves_accepting_child_first_in_any_mode(self) -> None:
+        always = CountingFilter(True)
+        children = [CountingFilter(False), CountingFilter(False), always]
+        f = CompositeFilter(
+            children,
+            mode=FilterMode.ANY,
+            reorder_interval=100,
+        )
+        event = make_event()
+        for _ in range(1000):
+            assert f.matches(event) is True
+        for child in children:
+            child.calls = 0
+        assert f.matches(event) is True
+        # Only the deciding child, now first, is evaluated
+        assert [child.calls for child in children] == [0, 0, 1]
+
+    def test_order_is_fixed_without_reorder_interval(self) -> None:
+        always, never = CountingFilter(True), CountingFilter(False)
+        f = CompositeFilter([always, never], mode=FilterMode.ALL)
+        event = make_event()
+        for _ in range(1000):
+            assert f.matches(event) is False
+        assert always.calls == never.calls == 1000
+
     def test_default_mode_is_all(self) -> None:
         f = CompositeFilter([TypeFilter(EventType.CUSTOM)])
         assert f._mode is FilterMode.ALL
@@ -201,6 +302,31 @@ class TestCompositeFilter:
 
 
 class TestFilterOperators:
+    def test_and_flattens_nested_all_composites(self) -> None:
+        a, b, c = TypeFilter(EventType.CUSTOM), AgentFilter("agent-1"), MetadataFilter("k", 1)
+        flat = repr(CompositeFilter([a, b, c], mode=FilterMode.ALL))
+        assert repr(a & b & c) == flat
+        assert repr(a & (b & c)) == flat
+
+    def test_or_flattens_nested_any_composites(self) -> None:
+        a, b, c = TypeFilter(EventType.CUSTOM), AgentFilter("agent-1"), MetadataFilter("k", 1)
+        assert repr(a | b | c) == repr(CompositeFilter([a, b, c], mode=FilterMode.ANY))
+
+    def test_mixed_modes_stay_nested(self) -> None:
+        a, b, c = TypeFilter(EventType.CUSTOM), AgentFilter("agent-1"), MetadataFilter("k", 1)
+        result = (a | b) & c
+        assert repr(result) == repr(CompositeFilter([a | b, c], mode=FilterMode.ALL))
+        assert result.matches(make_event(agent_id="agent-1", metadata={"k": 1})) is True
+        assert result.matches(make_event(agent_id="agent-1")) is False
+
+    def test_reordering_composite_is_not_flattened(self) -> None:
+        adaptive = CompositeFilter(
+            [TypeFilter(EventType.CUSTOM), AgentFilter("agent-1")], reorder_interval=10
+        )
+        metadata = MetadataFilter("k", 1)
+        result = adaptive & metadata
+        assert repr(result) == repr(CompositeFilter([adaptive, metadata], mode=FilterMode.ALL))
+
     def test_and_operator_creates_composite_all(self) -> None:
         f = TypeFilter(EventType.TOOL_CALLED) & AgentFilter("agent-1")
         assert isinstance(f, CompositeFilter)
@@ -223,3 +349,41 @@ class TestFilterOperators:
         assert f.matches(make_event(EventType.AGENT_STARTED, "agent-2")) is True
         assert f.matches(make_event(EventType.CUSTOM, "agent-9")) is True
         assert f.matches(make_event(EventType.CUSTOM, "agent-1")) is False
+
+
+# ---------------------------------------------------------------------------
+# Memory layout
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "event_filter",
+    [
+        TypeFilter(EventType.CUSTOM),
+        AgentFilter("agent-1"),
+        MetadataFilter("env", "prod"),
+        CompositeFilter([TypeFilter(EventType.CUSTOM)]),
+    ],
+    ids=lambda f: type(f).__name__,
+)
+def test_shipped_filters_have_slots(event_filter: EventFilter) -> None:
+    assert not hasattr(event_filter, "__dict__")
+
+
+@pytest.mark.parametrize(
+    "event_filter",
+    [TypeFilter(EventType.CUSTOM, EventType.TOOL_CALLED), AgentFilter("b", "a")],
+    ids=lambda f: type(f).__name__,
+)
+def test_repr_is_cached(event_filter: EventFilter) -> None:
+    assert repr(event_filter) is repr(event_filter)
+
+
+def test_composite_repr_follows_reorder() -> None:
+    always, never = CountingFilter(True), CountingFilter(False)
+    f = CompositeFilter([always, never], mode=FilterMode.ALL, reorder_interval=10)
+    before = repr(f)
+    event = make_event()
+    for _ in range(10):
+        f.matches(event)
+    assert repr(f) != before
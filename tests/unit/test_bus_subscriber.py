@@ -85,6 +85,10 @@ class TestFilteredSubscriber:
         result = fs(_make_event(EventType.CUSTOM))
         assert result is None
 
+    def test_filtered_subscriber_has_slots(self) -> None:
+        fs = FilteredSubscriber(handler=lambda e: None, event_filter=AgentFilter("a"))
+        assert not hasattr(fs, "__dict__")
+
     def test_compound_filter_and_semantics(self) -> None:
         received: list[AgentEvent] = []
         compound = TypeFilter(EventType.TOOL_CALLED) & AgentFilter("agent-1")
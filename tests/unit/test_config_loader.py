@@ -2,12 +2,14 @@
 from __future__ import annotations
 
 import json
+import math
 import os
 from pathlib import Path
 
 import pytest
 import yaml
 
+import agentcore.config.schema as schema_module
 from agentcore.config.loader import ConfigLoader, _AUTO_SEARCH_PATHS
 from agentcore.config.schema import validate_config
 from agentcore.schema.config import AgentConfig
@@ -37,6 +39,22 @@ class TestValidateConfig:
             validate_config({"plugins": 5})
         assert exc_info.value.__cause__ is not None
 
+    def test_validate_config_reuses_module_adapter(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        seen: list[object] = []
+        adapter = schema_module._ADAPTER
+
+        class SpyAdapter:
+            def validate_python(self, data: object) -> AgentConfig:
+                seen.append(data)
+                return adapter.validate_python(data)
+
+        monkeypatch.setattr(schema_module, "_ADAPTER", SpyAdapter())
+        payload = {"agent_name": "spy"}
+        assert validate_config(payload).agent_name == "spy"
+        assert seen == [payload]
+
 
 # ---------------------------------------------------------------------------
 # ConfigLoader.load_yaml
@@ -59,6 +77,17 @@ class TestConfigLoaderLoadYaml:
         config = loader.load_yaml(str(config_file))
         assert config.agent_name == "str-path-agent"
 
+    def test_load_yaml_decodes_utf8(self, tmp_path: Path) -> None:
+        config_file = tmp_path / "agentcore.yaml"
+        config_file.write_text("agent_name: agént-ü\n", encoding="utf-8")
+        assert ConfigLoader().load_yaml(config_file).agent_name == "agént-ü"
+
+    def test_non_utf8_yaml_raises_configuration_error(self, tmp_path: Path) -> None:
+        config_file = tmp_path / "agentcore.yaml"
+        config_file.write_bytes(b"agent_name: \xc3\x28\n")
+        with pytest.raises(ConfigurationError, match="parse"):
+            ConfigLoader().load_yaml(config_file)
+
     def test_missing_yaml_file_raises_configuration_error(self, tmp_path: Path) -> None:
         loader = ConfigLoader()
         with pytest.raises(ConfigurationError, match="not found"):
@@ -71,6 +100,24 @@ class TestConfigLoaderLoadYaml:
         with pytest.raises(ConfigurationError, match="parse"):
             loader.load_yaml(bad_yaml)
 
+    def test_uses_libyaml_safe_loader_when_available(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        ConfigLoader.clear_cache()
+        loaders: list[type] = []
+        real_load = yaml.load
+
+        def recording_load(stream: object, Loader: type) -> object:  # noqa: N803
+            loaders.append(Loader)
+            return real_load(stream, Loader=Loader)
+
+        monkeypatch.setattr(yaml, "load", recording_load)
+        config_file = tmp_path / "agentcore.yaml"
+        config_file.write_text("agent_name: libyaml\n", encoding="utf-8")
+        ConfigLoader().load_yaml(config_file)
+        expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+        assert loaders == [expected]
+
     def test_non_mapping_yaml_returns_defaults(self, tmp_path: Path) -> None:
         # A YAML file containing a list instead of a dict
         non_mapping = tmp_path / "list.yaml"
@@ -93,6 +140,11 @@ class TestConfigLoaderLoadJson:
         config = loader.load_json(config_file)
         assert config.agent_name == "json-agent"
 
+    def test_load_json_decodes_utf8(self, tmp_path: Path) -> None:
+        config_file = tmp_path / "agentcore.json"
+        config_file.write_text('{"agent_name": "agént-ü"}', encoding="utf-8")
+        assert ConfigLoader().load_json(config_file).agent_name == "agént-ü"
+
     def test_missing_json_file_raises_configuration_error(self, tmp_path: Path) -> None:
         loader = ConfigLoader()
         with pytest.raises(ConfigurationError, match="not found"):
@@ -112,6 +164,21 @@ class TestConfigLoaderLoadJson:
         config = loader.load_json(list_json)
         assert isinstance(config, AgentConfig)
 
+    def test_load_json_keeps_large_integers_exact(self, tmp_path: Path) -> None:
+        config_file = tmp_path / "agentcore.json"
+        config_file.write_text(
+            '{"custom_settings": {"account": 18446744073709551617}}', encoding="utf-8"
+        )
+        config = ConfigLoader().load_json(config_file)
+        assert config.custom_settings == {"account": 2**64 + 1}
+
+    def test_load_json_accepts_non_finite_numbers(self, tmp_path: Path) -> None:
+        config_file = tmp_path / "agentcore.json"
+        config_file.write_text('{"custom_settings": {"x": NaN, "y": 1e400}}', encoding="utf-8")
+        settings = ConfigLoader().load_json(config_file).custom_settings
+        assert math.isnan(settings["x"])  # type: ignore[arg-type]
+        assert settings["y"] == math.inf
+
 
 # ---------------------------------------------------------------------------
 # ConfigLoader.load_env
@@ -136,6 +203,21 @@ class TestConfigLoaderLoadEnv:
         config = loader.load_env(prefix="MYAPP_")
         assert config.agent_name == "prefix-agent"
 
+    def test_load_env_reads_only_prefixed_values(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        looked_up: list[str] = []
+
+        class CountingEnviron(dict[str, str]):
+            def __getitem__(self, key: str) -> str:
+                looked_up.append(key)
+                return super().__getitem__(key)
+
+        environ = CountingEnviron(
+            {"HOME": "/root", "PATH": "/bin", "AGENTCORE_AGENT_NAME": "counted"}
+        )
+        monkeypatch.setattr(os, "environ", environ)
+        assert ConfigLoader().load_env().agent_name == "counted"
+        assert looked_up == ["AGENTCORE_AGENT_NAME"]
+
 
 # ---------------------------------------------------------------------------
 # ConfigLoader.load_auto
@@ -192,9 +274,98 @@ class TestConfigLoaderLoadAuto:
         config = loader.load_auto(search_dir=tmp_path)
         assert config.agent_name == "fallback-json"
 
+    def test_load_auto_single_scandir_call(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        (tmp_path / "agentcore.json").write_text(json.dumps({"agent_name": "x"}), "utf-8")
+        calls: list[object] = []
+        real_scandir = os.scandir
+
+        def counting_scandir(path: object) -> object:
+            calls.append(path)
+            return real_scandir(path)
+
+        monkeypatch.setattr(os, "scandir", counting_scandir)
+        monkeypatch.setattr(Path, "exists", lambda self: pytest.fail("unexpected exists()"))
+        config = ConfigLoader().load_auto(search_dir=tmp_path)
+        assert config.agent_name == "x"
+        assert calls == [tmp_path]
+
+    def test_load_auto_missing_search_dir_uses_defaults(self, tmp_path: Path) -> None:
+        config = ConfigLoader().load_auto(search_dir=tmp_path / "absent")
+        assert config.agent_name == AgentConfig().agent_name
+
     def test_load_auto_hidden_yaml_variant(self, tmp_path: Path) -> None:
         config_file = tmp_path / ".agentcore.yaml"
         config_file.write_text("agent_name: hidden-yaml\n", encoding="utf-8")
         loader = ConfigLoader()
         config = loader.load_auto(search_dir=tmp_path)
         assert config.agent_name == "hidden-yaml"
+
+
+# ---------------------------------------------------------------------------
+# Parsed-file cache
+# ---------------------------------------------------------------------------
+
+class TestConfigLoaderCache:
+    @pytest.fixture(autouse=True)
+    def _empty_cache(self) -> None:
+        ConfigLoader.clear_cache()
+
+    @pytest.fixture()
+    def parse_count(self, monkeypatch: pytest.MonkeyPatch) -> list[int]:
+        calls = [0]
+        real_load = yaml.load
+
+        def counting_load(stream: object, Loader: type) -> object:  # noqa: N803
+            calls[0] += 1
+            return real_load(stream, Loader=Loader)
+
+        monkeypatch.setattr(yaml, "load", counting_load)
+        return calls
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path: Path, parse_count: list[int]) -> None:
+        config_file = tmp_path / "agentcore.yaml"
+        config_file.write_text("agent_name: cached\n", encoding="utf-8")
+        loader = ConfigLoader()
+
+        first = loader.load_yaml(config_file)
+        second = loader.load_yaml(config_file)
+
+        assert parse_count[0] == 1
+        assert first.agent_name == second.agent_name == "cached"
+
+    def test_modified_file_is_reparsed(self, tmp_path: Path, parse_count: list[int]) -> None:
+        config_file = tmp_path / "agentcore.yaml"
+        config_file.write_text("agent_name: before\n", encoding="utf-8")
+        loader = ConfigLoader()
+        loader.load_yaml(config_file)
+        stat = config_file.stat()
+
+        # Same size and modification time: only the content tells them apart
+        config_file.write_text("agent_name: after!\n", encoding="utf-8")
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert config_file.stat().st_size == stat.st_size
+        assert loader.load_yaml(config_file).agent_name == "after!"
+        assert parse_count[0] == 2
+
+    def test_cached_config_is_returned_as_a_copy(self, tmp_path: Path) -> None:
+        config_file = tmp_path / "agentcore.yaml"
+        config_file.write_text("agent_name: original\n", encoding="utf-8")
+        loader = ConfigLoader()
+
+        loader.load_yaml(config_file).agent_name = "mutated"
+
+        assert loader.load_yaml(config_file).agent_name == "original"
+
+    def test_clear_cache_forces_reparse(self, tmp_path: Path, parse_count: list[int]) -> None:
+        config_file = tmp_path / "agentcore.yaml"
+        config_file.write_text("agent_name: cached\n", encoding="utf-8")
+        loader = ConfigLoader()
+        loader.load_yaml(config_file)
+
+        ConfigLoader.clear_cache()
+        loader.load_yaml(config_file)
+
+        assert parse_count[0] == 2
@@ -5,6 +5,7 @@ import threading
 
 import pytest
 
+import agentcore.cost.pricing as pricing_module
 from agentcore.cost.budget import BasicBudgetManager
 from agentcore.cost.pricing import MODEL_PRICING, PricingEntry, get_pricing
 from agentcore.cost.tracker import AgentCosts, CostTracker, TokenUsage
@@ -53,6 +54,49 @@ class TestGetPricing:
         for model_id in MODEL_PRICING:
             assert get_pricing(model_id) is not None
 
+    def test_all_catalogue_entries_resolve_to_themselves(self) -> None:
+        for model_id, entry in MODEL_PRICING.items():
+            assert get_pricing(model_id) is entry
+
+    @pytest.mark.parametrize(
+        ("model", "expected"),
+        [
+            ("gpt-4o-mini-2024-07-18", "gpt-4o-mini"),
+            ("gpt-4o-2024-08-06", "gpt-4o"),
+            ("claude-sonnet-4-5-20250929", "claude-sonnet-4-5"),
+            ("Claude-Haiku-4-5@20251001", "claude-haiku-4-5"),
+        ],
+    )
+    def test_versioned_id_resolves_to_longest_known_prefix(
+        self, model: str, expected: str
+    ) -> None:
+        assert get_pricing(model) is MODEL_PRICING[expected]
+
+    def test_ambiguous_abbreviation_picks_first_alphabetical(self) -> None:
+        assert get_pricing("gpt") is MODEL_PRICING["gpt-3.5-turbo"]
+        assert get_pricing("gpt-4o-m") is MODEL_PRICING["gpt-4o-mini"]
+
+    def test_empty_model_returns_none(self) -> None:
+        assert get_pricing("") is None
+
+    def test_resolves_to_the_catalogue_key_object(self) -> None:
+        keys = {id(k) for k in MODEL_PRICING}
+        for model in ("GPT-4O", "claude-sonnet", "gemini-1.5-pro-002"):
+            assert id(pricing_module._resolve_model(model)) in keys
+
+    def test_resolution_is_memoised(self) -> None:
+        pricing_module._resolve_model.cache_clear()
+        get_pricing("Claude-Opus-4-20250514")
+        get_pricing("Claude-Opus-4-20250514")
+        info = pricing_module._resolve_model.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_price_edits_apply_to_memoised_models(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        get_pricing("gpt-4o")
+        repriced = PricingEntry(input_cost_per_1k=1.0, output_cost_per_1k=2.0)
+        monkeypatch.setitem(MODEL_PRICING, "gpt-4o", repriced)
+        assert get_pricing("gpt-4o") is repriced
+
 
 # ---------------------------------------------------------------------------
 # CostTracker
@@ -89,6 +133,14 @@ class TestCostTracker:
         del all_costs["agent-1"]
         assert tracker.get_total("agent-1") > 0
 
+    def test_get_all_costs_records_are_independent_lists(self) -> None:
+        tracker = CostTracker()
+        tracker.record("agent-1", "gpt-4o", 100, 50)
+        snapshot = tracker.get_all_costs()["agent-1"]
+        snapshot.records.clear()
+        assert len(tracker.get_all_costs()["agent-1"].records) == 1
+        assert not hasattr(snapshot, "__dict__")
+
     def test_get_token_counts_returns_zeros_for_unknown_agent(self) -> None:
         tracker = CostTracker()
         assert tracker.get_token_counts("nobody") == (0, 0)
@@ -127,6 +179,17 @@ class TestCostTracker:
         assert "agents=1" in text
         assert "total_usd=" in text
 
+    def test_repr_total_follows_writes_between_calls(self) -> None:
+        tracker = CostTracker()
+        first = tracker.record("a", "gpt-4o", 1000, 0)
+        assert f"total_usd={first:.6f}" in repr(tracker)
+        second = tracker.record("b", "gpt-4o", 2000, 0)
+        assert f"total_usd={first + second:.6f}" in repr(tracker)
+        tracker.reset("a")
+        assert f"total_usd={second:.6f}" in repr(tracker)
+        tracker.reset_all()
+        assert repr(tracker) == "CostTracker(agents=0, total_usd=0.000000)"
+
     def test_thread_safe_concurrent_recording(self) -> None:
         tracker = CostTracker()
         errors: list[Exception] = []
@@ -149,6 +212,49 @@ class TestCostTracker:
         assert inp == 50 * 5 * 10
         assert out == 50 * 5 * 5
 
+    def test_token_counts_read_during_recording_are_consistent(self) -> None:
+        tracker = CostTracker()
+        done = threading.Event()
+        torn: list[tuple[int, int]] = []
+
+        def record_many() -> None:
+            for _ in range(2000):
+                tracker.record("agent-1", "gpt-4o", 10, 5)
+            done.set()
+
+        writer = threading.Thread(target=record_many)
+        writer.start()
+        while not done.is_set():
+            inp, out = tracker.get_token_counts("agent-1")
+            if inp != 2 * out:
+                torn.append((inp, out))
+        writer.join()
+
+        assert torn == []
+        assert tracker.get_token_counts("agent-1") == (20_000, 10_000)
+
+    def test_thread_safe_concurrent_recording_across_agents(self) -> None:
+        tracker = CostTracker()
+        agent_ids = [f"agent-{i}" for i in range(40)]
+
+        def record_all() -> None:
+            for _ in range(25):
+                for agent_id in agent_ids:
+                    tracker.record(agent_id, "gpt-4o", 10, 5)
+
+        threads = [threading.Thread(target=record_all) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        all_costs = tracker.get_all_costs()
+        assert sorted(all_costs) == sorted(agent_ids)
+        assert {c.total_input_tokens for c in all_costs.values()} == {4 * 25 * 10}
+        tracker.reset_all()
+        assert tracker.get_all_costs() == {}
+        assert "agents=0" in repr(tracker)
+
 
 # ---------------------------------------------------------------------------
 # BasicBudgetManager
@@ -250,3 +356,13 @@ class TestBasicBudgetManager:
         assert errors == []
         remaining = manager.check_budget("shared")
         assert remaining == pytest.approx(1_000_000.00 - 500.00)
+
+    def test_reads_do_not_wait_for_writers(self) -> None:
+        manager = BasicBudgetManager()
+        manager.set_budget("agent-1", 10.00)
+        manager.record_spend("agent-1", 4.00)
+        with manager._lock:
+            # A writer holds the lock; single-agent reads still complete
+            assert manager.check_budget("agent-1") == pytest.approx(6.00)
+            assert manager.is_over_budget("agent-1") is False
+            assert "agents_with_budget=1" in repr(manager)
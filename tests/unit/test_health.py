@@ -1,6 +1,9 @@
 """Unit tests for agentcore.health.check."""
 from __future__ import annotations
 
+import threading
+from datetime import datetime, timedelta
+
 import pytest
 
 from agentcore.health.check import (
@@ -35,6 +38,12 @@ class TestCheckResult:
         result = CheckResult(name="db", status=HealthStatus.UNHEALTHY, message="timeout")
         assert result.message == "timeout"
 
+    def test_results_and_reports_are_slotted(self) -> None:
+        result = CheckResult(name="test", status=HealthStatus.HEALTHY)
+        report = HealthReport(status=HealthStatus.HEALTHY, checks={"test": result})
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(report, "__dict__")
+
 
 # ---------------------------------------------------------------------------
 # HealthReport
@@ -61,6 +70,11 @@ class TestHealthReport:
         assert "timestamp" in data
         assert "checks" in data
 
+    def test_default_timestamp_is_utc(self) -> None:
+        report = HealthReport(status=HealthStatus.HEALTHY)
+        assert report.timestamp.utcoffset() == timedelta(0)
+        assert datetime.fromisoformat(report.to_dict()["timestamp"]) == report.timestamp
+
     def test_to_dict_includes_check_details(self) -> None:
         check = CheckResult(name="c1", status=HealthStatus.DEGRADED, message="slow")
         report = HealthReport(status=HealthStatus.DEGRADED, checks={"c1": check})
@@ -91,6 +105,24 @@ class TestHealthCheckRegistration:
         report = hc.run_checks()
         assert set(report.checks.keys()) == {"c1", "c2"}
 
+    def test_register_checks_adds_every_entry(self) -> None:
+        hc = HealthCheck()
+        hc.register_checks(
+            {
+                "c1": lambda: CheckResult("c1", HealthStatus.HEALTHY),
+                "c2": lambda: CheckResult("c2", HealthStatus.DEGRADED),
+            }
+        )
+        report = hc.run_checks()
+        assert set(report.checks.keys()) == {"c1", "c2"}
+        assert report.status is HealthStatus.DEGRADED
+
+    def test_register_checks_replaces_existing_names(self) -> None:
+        hc = HealthCheck()
+        hc.register_check("c1", lambda: CheckResult("c1", HealthStatus.UNHEALTHY))
+        hc.register_checks({"c1": lambda: CheckResult("c1", HealthStatus.HEALTHY)})
+        assert hc.run_checks().is_healthy()
+
     def test_unregister_check_removes_it(self) -> None:
         hc = HealthCheck()
         hc.register_check("c1", lambda: CheckResult("c1", HealthStatus.HEALTHY))
@@ -141,6 +173,13 @@ class TestHealthCheckRunChecks:
         report = hc.run_checks()
         assert report.status is HealthStatus.UNHEALTHY
 
+    def test_worst_status_wins_regardless_of_order(self) -> None:
+        hc = HealthCheck()
+        hc.register_check("a", lambda: CheckResult("a", HealthStatus.UNHEALTHY))
+        hc.register_check("b", lambda: CheckResult("b", HealthStatus.DEGRADED))
+        hc.register_check("c", lambda: CheckResult("c", HealthStatus.HEALTHY))
+        assert hc.run_checks().status is HealthStatus.UNHEALTHY
+
     def test_check_that_raises_is_recorded_as_unhealthy(self) -> None:
         hc = HealthCheck()
 
@@ -160,6 +199,44 @@ class TestHealthCheckRunChecks:
         report = hc.run_checks()
         assert "ok" in report.checks
 
+    def test_checks_run_concurrently(self) -> None:
+        # Each check blocks until the other has started; run one after the
+        # other, the barrier would time out and both would be UNHEALTHY.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def rendezvous(name: str) -> CheckResult:
+            barrier.wait()
+            return CheckResult(name, HealthStatus.HEALTHY)
+
+        hc = HealthCheck(max_workers=2)
+        hc.register_check("a", lambda: rendezvous("a"))
+        hc.register_check("b", lambda: rendezvous("b"))
+        assert hc.run_checks().is_healthy()
+
+    def test_results_keep_registration_order(self) -> None:
+        hc = HealthCheck(max_workers=4)
+        names = [f"c{i}" for i in range(12)]
+        for name in names:
+            hc.register_check(name, lambda n=name: CheckResult(n, HealthStatus.HEALTHY))
+        assert list(hc.run_checks().checks) == names
+
+    def test_checks_run_on_calling_thread_by_default(self) -> None:
+        seen: list[threading.Thread] = []
+
+        def record() -> CheckResult:
+            seen.append(threading.current_thread())
+            return CheckResult("t", HealthStatus.HEALTHY)
+
+        hc = HealthCheck()
+        hc.register_check("t1", record)
+        hc.register_check("t2", record)
+        hc.run_checks()
+        assert seen == [threading.current_thread()] * 2
+
+    def test_max_workers_below_one_raises(self) -> None:
+        with pytest.raises(ValueError):
+            HealthCheck(max_workers=0)
+
 
 # ---------------------------------------------------------------------------
 # HealthCheck — built-in check factories
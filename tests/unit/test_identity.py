@@ -155,6 +155,18 @@ class TestAgentRegistry:
         assert identity_a.agent_id in all_ids
         assert identity_b.agent_id in all_ids
 
+    def test_list_all_is_unaffected_by_later_registrations(
+        self, registry: AgentRegistry
+    ) -> None:
+        first = create_identity("agent-a")
+        registry.register(first)
+        snapshot = registry.list_all()
+        for _ in snapshot:
+            registry.register(create_identity("agent-b"))
+            registry.unregister(first.agent_id)
+        assert snapshot == [first]
+        assert len(registry) == 1
+
     def test_list_all_empty_when_no_registrations(
         self, registry: AgentRegistry
     ) -> None:
@@ -184,6 +196,25 @@ class TestAgentRegistry:
         assert len(langchain_agents) == 1
         assert langchain_agents[0].framework == "langchain"
 
+    def test_find_results_keep_registration_order(self, registry: AgentRegistry) -> None:
+        identities = [create_identity("worker", framework="crewai") for _ in range(3)]
+        for identity in identities:
+            registry.register(identity)
+        assert registry.find_by_name("worker") == identities
+        assert registry.find_by_framework("crewai") == identities
+
+    def test_unregister_removes_from_find_results(self, registry: AgentRegistry) -> None:
+        keep = create_identity("worker", framework="crewai")
+        drop = create_identity("worker", framework="crewai")
+        registry.register(keep)
+        registry.register(drop)
+        registry.unregister(drop.agent_id)
+        assert registry.find_by_name("worker") == [keep]
+        assert registry.find_by_framework("crewai") == [keep]
+        registry.unregister(keep.agent_id)
+        assert registry.find_by_name("worker") == []
+        assert registry.find_by_framework("crewai") == []
+
     def test_repr_contains_count(self, registry: AgentRegistry) -> None:
         registry.register(create_identity("x"))
         assert "1" in repr(registry)
@@ -235,6 +266,26 @@ class TestBasicIdentityProvider:
         object.__setattr__(identity, "agent_id", "not-a-uuid")
         assert provider.verify_identity(identity) is False
 
+    @pytest.mark.parametrize(
+        "agent_id",
+        [
+            str(uuid.uuid1()),
+            str(uuid.uuid4()).upper(),
+            uuid.uuid4().hex,
+            "{" + str(uuid.uuid4()) + "}",
+            str(uuid.uuid4()) + "\n",
+            "12345678-1234-4234-7234-123456789abc",
+            None,
+        ],
+        ids=["uuid1", "uppercase", "unhyphenated", "braced", "newline", "variant", "none"],
+    )
+    def test_verify_identity_requires_canonical_uuid4(
+        self, provider: BasicIdentityProvider, agent_id: object
+    ) -> None:
+        identity = create_identity("bot")
+        object.__setattr__(identity, "agent_id", agent_id)
+        assert provider.verify_identity(identity) is False
+
     def test_rotate_identity_produces_new_uuid(
         self, provider: BasicIdentityProvider
     ) -> None:
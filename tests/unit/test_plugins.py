@@ -1,12 +1,15 @@
 """Unit tests for agentcore.plugins.registry and agentcore.plugins.loader."""
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+import importlib.metadata
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+from unittest.mock import Mock, patch
 
 import pytest
 
+import agentcore.plugins.registry as registry_module
 from agentcore.plugins.loader import PluginLoader
 from agentcore.plugins.registry import (
     AgentPlugin,
@@ -14,16 +17,84 @@ from agentcore.plugins.registry import (
     PluginAlreadyRegisteredError,
     PluginNotFoundError,
     PluginRegistry,
+    clear_entry_point_cache,
 )
 from agentcore.schema.config import AgentConfig
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from contextlib import AbstractContextManager
+    from pathlib import Path
+
 
 # ---------------------------------------------------------------------------
 # Shared helpers
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(autouse=True)
+def _fresh_entry_point_scan() -> Iterator[None]:
+    """Keep patched entry-points from leaking through the process-wide cache."""
+    clear_entry_point_cache()
+    yield
+    clear_entry_point_cache()
+
+
+@dataclass(slots=True)
+class _FakeEntryPoint:
+    """The parts of ``importlib.metadata.EntryPoint`` that plugin discovery uses."""
+
+    name: str
+    load: Callable[[], object]
+    group: str = "agentcore.plugins"
+
+    def matches(self, **params: object) -> bool:
+        return all(getattr(self, key) == value for key, value in params.items())
+
+
+def _raising(exc: Exception) -> Callable[[], object]:
+    """Return an entry-point ``load`` that raises *exc*."""
+
+    def load() -> object:
+        raise exc
+
+    return load
+
+
+def _installed_entry_points(
+    *eps: _FakeEntryPoint, group: str = "agentcore.plugins"
+) -> AbstractContextManager[Any]:
+    """Patch the installed-distribution scan to report *eps* under *group*."""
+    for ep in eps:
+        ep.group = group
+    return patch(
+        "importlib.metadata.entry_points",
+        return_value=importlib.metadata.EntryPoints(eps),
+    )
+
+
+@pytest.fixture()
+def installed_entry_points(monkeypatch: pytest.MonkeyPatch) -> Callable[..., None]:
+    """Report the given entry-points to discovery for the rest of the test.
+
+    Replaces the cached scan rather than ``importlib.metadata``, so tests
+    that only exercise discovery skip the metadata patch entirely.
+    """
+
+    def install(*eps: _FakeEntryPoint, group: str = "agentcore.plugins") -> None:
+        for ep in eps:
+            ep.group = group
+        by_group = {group: eps}
+        monkeypatch.setattr(registry_module, "_entry_points_by_group", lambda: by_group)
+
+    return install
+
+
 def _make_null_plugin_class(name: str = "null") -> type[AgentPlugin]:
-    """Create a trivial AgentPlugin subclass."""
+    """Create a trivial AgentPlugin subclass.
+
+    Every call builds a distinct class, so no two tests share plugin
+    classes; at about 10us per class there is nothing worth caching.
+    """
 
     class NullPlugin(AgentPlugin):
         def get_name(self) -> str:
@@ -39,6 +110,13 @@ def _make_null_plugin_class(name: str = "null") -> type[AgentPlugin]:
     return NullPlugin
 
 
+class _PluginName(str, Enum):
+    """str-valued enum standing in for callers' own plugin name constants."""
+
+    SINGLE = "single"
+    BATCHED = "batched"
+
+
 # ---------------------------------------------------------------------------
 # PluginNotFoundError and PluginAlreadyRegisteredError
 # ---------------------------------------------------------------------------
@@ -56,6 +134,21 @@ class TestPluginErrors:
         assert exc.registry_name == "test-registry"
         assert isinstance(exc, ValueError)
 
+    def test_slotted_agent_plugin_subclass_has_no_dict(self) -> None:
+        class SlottedPlugin(AgentPlugin):
+            __slots__ = ()
+
+            def get_name(self) -> str:
+                return "slotted"
+
+            def initialize(self) -> None:
+                pass
+
+            def shutdown(self) -> None:
+                pass
+
+        assert not hasattr(SlottedPlugin(), "__dict__")
+
 
 # ---------------------------------------------------------------------------
 # PluginRegistry[T] — generic registry
@@ -116,6 +209,15 @@ class TestPluginRegistry:
         with pytest.raises(PluginAlreadyRegisteredError):
             reg.register_class("delta", DeltaPlugin)
 
+    def test_register_class_accepts_str_enum_name(self) -> None:
+        reg = self._make_registry()
+
+        class EpsilonPlugin(_BaseABC):
+            pass
+
+        reg.register_class(_PluginName.SINGLE, EpsilonPlugin)
+        assert reg.get("single") is EpsilonPlugin
+
     def test_get_unknown_raises_not_found(self) -> None:
         reg = self._make_registry()
         with pytest.raises(PluginNotFoundError):
@@ -165,6 +267,20 @@ class TestPluginRegistry:
         reg.deregister("e")
         assert "e" not in reg
 
+    def test_list_plugins_stays_sorted_across_deregister(self) -> None:
+        reg = self._make_registry()
+
+        class P(_BaseABC):
+            pass
+
+        for name in ("m", "c", "x", "a"):
+            reg.register_class(name, P)
+        reg.deregister("c")
+        reg.register_class("b", P)
+        assert reg.list_plugins() == ["a", "b", "m", "x"]
+        reg.list_plugins().clear()
+        assert len(reg.list_plugins()) == 4
+
     def test_deregister_unknown_raises_not_found(self) -> None:
         reg = self._make_registry()
         with pytest.raises(PluginNotFoundError):
@@ -182,7 +298,9 @@ class TestPluginRegistry:
         reg.load_entrypoints("fake.group.that.doesnt.exist")
         assert len(reg) == 0
 
-    def test_load_entrypoints_skips_already_registered(self) -> None:
+    def test_load_entrypoints_skips_already_registered(
+        self, installed_entry_points: Callable[..., None]
+    ) -> None:
         reg = self._make_registry()
 
         class ExistingPlugin(_BaseABC):
@@ -190,40 +308,38 @@ class TestPluginRegistry:
 
         reg.register_class("existing", ExistingPlugin)
 
-        mock_ep = MagicMock()
-        mock_ep.name = "existing"
+        fake_ep = _FakeEntryPoint("existing", Mock(return_value=None))
 
-        with patch("importlib.metadata.entry_points", return_value=[mock_ep]):
-            reg.load_entrypoints("some.group")
+        installed_entry_points(fake_ep, group="some.group")
+        reg.load_entrypoints("some.group")
 
         # Should still be one plugin (not duplicated or removed)
         assert len(reg) == 1
 
-    def test_load_entrypoints_skips_failed_load(self) -> None:
+    def test_load_entrypoints_skips_failed_load(
+        self, installed_entry_points: Callable[..., None]
+    ) -> None:
         reg = self._make_registry()
 
-        mock_ep = MagicMock()
-        mock_ep.name = "failing-ep"
-        mock_ep.load.side_effect = ImportError("missing dep")
+        fake_ep = _FakeEntryPoint("failing-ep", _raising(ImportError("missing dep")))
 
-        with patch("importlib.metadata.entry_points", return_value=[mock_ep]):
-            reg.load_entrypoints("some.group")
+        installed_entry_points(fake_ep, group="some.group")
+        reg.load_entrypoints("some.group")
 
         assert "failing-ep" not in reg
 
-    def test_load_entrypoints_skips_invalid_class(self) -> None:
+    def test_load_entrypoints_skips_invalid_class(
+        self, installed_entry_points: Callable[..., None]
+    ) -> None:
         reg = self._make_registry()
 
-        mock_ep = MagicMock()
-        mock_ep.name = "bad-class"
-
         class NotASubclass:
             pass
 
-        mock_ep.load.return_value = NotASubclass
+        fake_ep = _FakeEntryPoint("bad-class", lambda: NotASubclass)
 
-        with patch("importlib.metadata.entry_points", return_value=[mock_ep]):
-            reg.load_entrypoints("some.group")
+        installed_entry_points(fake_ep, group="some.group")
+        reg.load_entrypoints("some.group")
 
         assert "bad-class" not in reg
 
@@ -235,27 +351,78 @@ class TestPluginRegistry:
 class TestAgentPluginRegistry:
     def test_register_and_list(self) -> None:
         registry = AgentPluginRegistry()
-        NullPlugin = _make_null_plugin_class("null")
-        registry.register_plugin("null", NullPlugin)
+        null_plugin = _make_null_plugin_class("null")
+        registry.register_plugin("null", null_plugin)
         assert "null" in registry.list_plugins()
 
     def test_register_duplicate_raises(self) -> None:
         registry = AgentPluginRegistry()
-        NullPlugin = _make_null_plugin_class("n")
-        registry.register_plugin("n", NullPlugin)
+        null_plugin = _make_null_plugin_class("n")
+        registry.register_plugin("n", null_plugin)
         with pytest.raises(PluginAlreadyRegisteredError):
-            registry.register_plugin("n", NullPlugin)
+            registry.register_plugin("n", null_plugin)
 
     def test_register_non_agent_plugin_raises_type_error(self) -> None:
         registry = AgentPluginRegistry()
         with pytest.raises(TypeError):
             registry.register_plugin("bad", object)  # type: ignore[arg-type]
 
+    def test_register_accepts_virtual_agent_plugin_subclass(self) -> None:
+        # Subclass checks go through ABCMeta, so classes declared with
+        # AgentPlugin.register() are accepted even though they are not in
+        # AgentPlugin.__subclasses__()
+        class ExternalPlugin:
+            def get_name(self) -> str:
+                return "external"
+
+            def initialize(self) -> None:
+                pass
+
+            def shutdown(self) -> None:
+                pass
+
+        AgentPlugin.register(ExternalPlugin)
+        registry = AgentPluginRegistry()
+        registry.register_plugin("external", ExternalPlugin)  # type: ignore[arg-type]
+        assert registry.list_plugins() == ["external"]
+
+    def test_register_accepts_str_enum_names(self) -> None:
+        registry = AgentPluginRegistry()
+        single = _make_null_plugin_class("single")
+        batched = _make_null_plugin_class("batched")
+        registry.register_plugin(_PluginName.SINGLE, single)
+        registry.register_plugins({_PluginName.BATCHED: batched})
+        assert registry.get_plugin("single") is single
+        assert registry.get_plugin("batched") is batched
+
+    def test_register_plugins_skips_existing_names(self) -> None:
+        registry = AgentPluginRegistry()
+        existing = _make_null_plugin_class("b")
+        registry.register_plugin("b", existing)
+        registered = registry.register_plugins(
+            {
+                "c": _make_null_plugin_class("c"),
+                "b": _make_null_plugin_class("b2"),
+                "a": _make_null_plugin_class("a"),
+            }
+        )
+        assert registered == ["c", "a"]
+        assert registry.get_plugin("b") is existing
+        assert registry.list_plugins() == ["a", "b", "c"]
+
+    def test_register_plugins_rejects_the_whole_batch_on_bad_class(self) -> None:
+        registry = AgentPluginRegistry()
+        with pytest.raises(TypeError):
+            registry.register_plugins(
+                {"ok": _make_null_plugin_class("ok"), "bad": object}  # type: ignore[dict-item]
+            )
+        assert len(registry) == 0
+
     def test_get_plugin_returns_class(self) -> None:
         registry = AgentPluginRegistry()
-        NullPlugin = _make_null_plugin_class("ret")
-        registry.register_plugin("ret", NullPlugin)
-        assert registry.get_plugin("ret") is NullPlugin
+        null_plugin = _make_null_plugin_class("ret")
+        registry.register_plugin("ret", null_plugin)
+        assert registry.get_plugin("ret") is null_plugin
 
     def test_get_plugin_unknown_raises_not_found(self) -> None:
         registry = AgentPluginRegistry()
@@ -398,54 +565,56 @@ class TestAgentPluginRegistry:
 # ---------------------------------------------------------------------------
 
 class TestPluginLoader:
-    def test_load_from_entry_points_no_entries(self) -> None:
+    def test_load_from_entry_points_no_entries(
+        self, installed_entry_points: Callable[..., None]
+    ) -> None:
         registry = AgentPluginRegistry()
         loader = PluginLoader(registry)
-        with patch("importlib.metadata.entry_points", return_value=[]):
-            loaded = loader.load_from_entry_points()
+        installed_entry_points()
+        loaded = loader.load_from_entry_points()
         assert loaded == []
 
-    def test_load_from_entry_points_valid_plugin(self) -> None:
+    def test_load_from_entry_points_valid_plugin(
+        self, installed_entry_points: Callable[..., None]
+    ) -> None:
         registry = AgentPluginRegistry()
         loader = PluginLoader(registry)
 
-        NullPlugin = _make_null_plugin_class("ep-plugin")
+        null_plugin = _make_null_plugin_class("ep-plugin")
 
-        mock_ep = MagicMock()
-        mock_ep.name = "ep-plugin"
-        mock_ep.load.return_value = NullPlugin
+        fake_ep = _FakeEntryPoint("ep-plugin", lambda: null_plugin)
 
-        with patch("importlib.metadata.entry_points", return_value=[mock_ep]):
-            loaded = loader.load_from_entry_points()
+        installed_entry_points(fake_ep)
+        loaded = loader.load_from_entry_points()
 
         assert "ep-plugin" in loaded
 
-    def test_load_from_entry_points_skips_failed_load(self) -> None:
+    def test_load_from_entry_points_skips_failed_load(
+        self, installed_entry_points: Callable[..., None]
+    ) -> None:
         registry = AgentPluginRegistry()
         loader = PluginLoader(registry)
 
-        mock_ep = MagicMock()
-        mock_ep.name = "fail-ep"
-        mock_ep.load.side_effect = ImportError("missing")
+        fake_ep = _FakeEntryPoint("fail-ep", _raising(ImportError("missing")))
 
-        with patch("importlib.metadata.entry_points", return_value=[mock_ep]):
-            loaded = loader.load_from_entry_points()
+        installed_entry_points(fake_ep)
+        loaded = loader.load_from_entry_points()
 
         assert "fail-ep" not in loaded
 
-    def test_load_from_entry_points_skips_non_agent_plugin_class(self) -> None:
+    def test_load_from_entry_points_skips_non_agent_plugin_class(
+        self, installed_entry_points: Callable[..., None]
+    ) -> None:
         registry = AgentPluginRegistry()
         loader = PluginLoader(registry)
 
         class NotAnAgentPlugin:
             pass
 
-        mock_ep = MagicMock()
-        mock_ep.name = "not-agent-plugin"
-        mock_ep.load.return_value = NotAnAgentPlugin
+        fake_ep = _FakeEntryPoint("not-agent-plugin", lambda: NotAnAgentPlugin)
 
-        with patch("importlib.metadata.entry_points", return_value=[mock_ep]):
-            loaded = loader.load_from_entry_points()
+        installed_entry_points(fake_ep)
+        loaded = loader.load_from_entry_points()
 
         assert "not-agent-plugin" not in loaded
 
@@ -456,7 +625,7 @@ class TestPluginLoader:
         with pytest.raises(PluginError, match="not found"):
             loader.load_from_path("/nonexistent/path/plugin.py")
 
-    def test_load_from_path_valid_plugin_module(self) -> None:
+    def test_load_from_path_valid_plugin_module(self, tmp_path: Path) -> None:
         registry = AgentPluginRegistry()
         loader = PluginLoader(registry)
 
@@ -471,113 +640,114 @@ class FilePlugin(AgentPlugin):
     def shutdown(self):
         pass
 """
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".py", delete=False, encoding="utf-8"
-        ) as f:
-            f.write(plugin_code)
-            temp_path = f.name
-
-        try:
-            loaded = loader.load_from_path(temp_path)
-            assert "file-plugin" in loaded
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        plugin_file = tmp_path / "file_plugin.py"
+        plugin_file.write_text(plugin_code, encoding="utf-8")
+
+        loaded = loader.load_from_path(plugin_file)
+        assert "file-plugin" in loaded
 
     def test_load_from_config_empty_plugins_returns_empty(self) -> None:
         registry = AgentPluginRegistry()
         loader = PluginLoader(registry)
-        config = AgentConfig(plugins=[])
+        config = AgentConfig.model_construct(plugins=[])
         loaded = loader.load_from_config(config)
         assert loaded == []
 
-    def test_load_from_config_filters_by_allowed_names(self) -> None:
+    def test_load_from_config_filters_by_allowed_names(
+        self, installed_entry_points: Callable[..., None]
+    ) -> None:
         registry = AgentPluginRegistry()
         loader = PluginLoader(registry)
 
-        NullPlugin = _make_null_plugin_class("allowed-plugin")
+        null_plugin = _make_null_plugin_class("allowed-plugin")
 
-        mock_ep = MagicMock()
-        mock_ep.name = "allowed-plugin"
-        mock_ep.load.return_value = NullPlugin
+        fake_ep = _FakeEntryPoint("allowed-plugin", lambda: null_plugin)
 
-        with patch("importlib.metadata.entry_points", return_value=[mock_ep]):
-            # Config only allows "allowed-plugin"
-            config = AgentConfig(plugins=["allowed-plugin"])
-            loaded = loader.load_from_config(config)
+        installed_entry_points(fake_ep)
+        # Config only allows "allowed-plugin"
+        config = AgentConfig.model_construct(plugins=["allowed-plugin"])
+        loaded = loader.load_from_config(config)
 
         assert "allowed-plugin" in loaded
 
-    def test_load_from_config_excludes_unlisted_plugins(self) -> None:
+    def test_load_from_config_excludes_unlisted_plugins(
+        self, installed_entry_points: Callable[..., None]
+    ) -> None:
         registry = AgentPluginRegistry()
         loader = PluginLoader(registry)
 
-        NullPlugin = _make_null_plugin_class("other-plugin")
+        null_plugin = _make_null_plugin_class("other-plugin")
 
-        mock_ep = MagicMock()
-        mock_ep.name = "other-plugin"
-        mock_ep.load.return_value = NullPlugin
+        fake_ep = _FakeEntryPoint("other-plugin", lambda: null_plugin)
 
-        with patch("importlib.metadata.entry_points", return_value=[mock_ep]):
-            config = AgentConfig(plugins=["allowed-only"])
-            loaded = loader.load_from_config(config)
+        installed_entry_points(fake_ep)
+        config = AgentConfig.model_construct(plugins=["allowed-only"])
+        loaded = loader.load_from_config(config)
 
         assert "other-plugin" not in loaded
 
-    def test_load_from_entry_points_skips_registration_error(self) -> None:
-        """Covers loader.py lines 90-91: exception during register_plugin."""
+    def test_load_from_entry_points_skips_registration_error(
+        self, installed_entry_points: Callable[..., None]
+    ) -> None:
+        """Covers the exception raised by register_plugin during loading."""
         registry = AgentPluginRegistry()
         loader = PluginLoader(registry)
 
-        NullPlugin = _make_null_plugin_class("dup-reg")
-        # Pre-register so that the second registration raises PluginAlreadyRegisteredError,
-        # but PluginLoader catches all exceptions (lines 90-91).
-        registry.register_plugin("dup-reg", NullPlugin)
+        null_plugin = _make_null_plugin_class("dup-reg")
 
-        mock_ep = MagicMock()
-        mock_ep.name = "dup-reg"
-        mock_ep.load.return_value = NullPlugin
+        # Register the name while the entry-point loads, so the loader's own
+        # registration raises PluginAlreadyRegisteredError and is caught.
+        def _load_while_racing() -> type[AgentPlugin]:
+            registry.register_plugin("dup-reg", null_plugin)
+            return null_plugin
 
-        with patch("importlib.metadata.entry_points", return_value=[mock_ep]):
-            loaded = loader.load_from_entry_points()
+        fake_ep = _FakeEntryPoint("dup-reg", _load_while_racing)
+
+        installed_entry_points(fake_ep)
+        loaded = loader.load_from_entry_points()
 
-        # The pre-registered plugin was already there; loader skipped re-registration
         assert "dup-reg" not in loaded
+        assert registry.get_plugin("dup-reg") is null_plugin
+
+    def test_load_from_entry_points_skips_registered_names_without_loading(
+        self, installed_entry_points: Callable[..., None]
+    ) -> None:
+        registry = AgentPluginRegistry()
+        registry.register_plugin("known", _make_null_plugin_class("known"))
+        load = Mock(return_value=_make_null_plugin_class("known"))
+
+        installed_entry_points(_FakeEntryPoint("known", load))
+
+        assert PluginLoader(registry).load_from_entry_points() == []
+        load.assert_not_called()
 
-    def test_load_from_path_bad_module_spec_raises_plugin_error(self) -> None:
+    def test_load_from_path_bad_module_spec_raises_plugin_error(self, tmp_path: Path) -> None:
         """Covers loader.py lines 129-133: spec_from_file_location returns None."""
         from agentcore.schema.errors import PluginError
         registry = AgentPluginRegistry()
         loader = PluginLoader(registry)
 
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False) as f:
-            temp_path = f.name
-            f.write(b"# empty\n")
+        plugin_file = tmp_path / "empty_plugin.py"
+        plugin_file.write_bytes(b"# empty\n")
 
-        try:
-            with patch("importlib.util.spec_from_file_location", return_value=None):
-                with pytest.raises(PluginError, match="spec"):
-                    loader.load_from_path(temp_path)
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        with patch("importlib.util.spec_from_file_location", return_value=None):
+            with pytest.raises(PluginError, match="spec"):
+                loader.load_from_path(plugin_file)
 
-    def test_load_from_path_exec_failure_raises_plugin_error(self) -> None:
-        """Covers loader.py lines 138-142: exec_module raises an exception."""
+    def test_load_from_path_exec_failure_raises_plugin_error(self, tmp_path: Path) -> None:
+        """Covers the error raised when executing the module code fails."""
         from agentcore.schema.errors import PluginError
         registry = AgentPluginRegistry()
         loader = PluginLoader(registry)
 
-        with tempfile.NamedTemporaryFile(suffix=".py", delete=False) as f:
-            temp_path = f.name
-            f.write(b"raise RuntimeError('intentional')\n")
+        plugin_file = tmp_path / "raising_plugin.py"
+        plugin_file.write_bytes(b"raise RuntimeError('intentional')\n")
 
-        try:
-            with pytest.raises(PluginError, match="Failed to execute"):
-                loader.load_from_path(temp_path)
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        with pytest.raises(PluginError, match="Failed to execute"):
+            loader.load_from_path(plugin_file)
 
-    def test_load_from_path_skips_class_that_fails_instantiation(self) -> None:
-        """Covers loader.py lines 158-163: exception when instantiating plugin class."""
+    def test_load_from_path_skips_class_that_fails_instantiation(self, tmp_path: Path) -> None:
+        """Covers the exception raised when instantiating a plugin class."""
         registry = AgentPluginRegistry()
         loader = PluginLoader(registry)
 
@@ -594,17 +764,49 @@ class BrokenPlugin(AgentPlugin):
     def shutdown(self):
         pass
 """
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".py", delete=False, encoding="utf-8"
-        ) as f:
-            f.write(plugin_code)
-            temp_path = f.name
+        plugin_file = tmp_path / "broken_plugin.py"
+        plugin_file.write_text(plugin_code, encoding="utf-8")
+
+        loaded = loader.load_from_path(plugin_file)
+        assert "broken" not in loaded
+
 
-        try:
-            loaded = loader.load_from_path(temp_path)
-            assert "broken" not in loaded
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+# ---------------------------------------------------------------------------
+# Entry-point scan caching
+# ---------------------------------------------------------------------------
+
+class TestEntryPointCache:
+    def test_installed_packages_are_scanned_once(self) -> None:
+        with _installed_entry_points() as scan:
+            AgentPluginRegistry().auto_discover()
+            PluginLoader(AgentPluginRegistry()).load_from_entry_points()
+            PluginRegistry(_BaseABC, "base").load_entrypoints("some.group")
+        assert scan.call_count == 1
+
+    def test_discovery_only_loads_the_requested_group(self) -> None:
+        null_plugin = _make_null_plugin_class("ours")
+        ours = _FakeEntryPoint("ours", lambda: null_plugin)
+        load_theirs = Mock(return_value=null_plugin)
+        theirs = _FakeEntryPoint("theirs", load_theirs, group="other.group")
+
+        with patch(
+            "importlib.metadata.entry_points",
+            return_value=importlib.metadata.EntryPoints((ours, theirs)),
+        ):
+            assert AgentPluginRegistry().auto_discover() == ["ours"]
+        load_theirs.assert_not_called()
+
+    def test_clear_entry_point_cache_forces_a_rescan(self) -> None:
+        null_plugin = _make_null_plugin_class("late-install")
+        fake_ep = _FakeEntryPoint("late-install", lambda: null_plugin)
+        registry = AgentPluginRegistry()
+
+        with _installed_entry_points():
+            assert registry.auto_discover() == []
+        with _installed_entry_points(fake_ep):
+            assert registry.auto_discover() == []
+            clear_entry_point_cache()
+            assert registry.auto_discover() == ["late-install"]
 
 
 # ---------------------------------------------------------------------------
@@ -612,72 +814,71 @@ class BrokenPlugin(AgentPlugin):
 # ---------------------------------------------------------------------------
 
 class TestAgentPluginRegistryAutoDiscover:
-    def test_auto_discover_skips_already_registered(self) -> None:
+    def test_auto_discover_skips_already_registered(
+        self, installed_entry_points: Callable[..., None]
+    ) -> None:
         """Covers registry.py lines 411-414: ep.name already in _classes."""
         registry = AgentPluginRegistry()
-        NullPlugin = _make_null_plugin_class("pre-registered")
-        registry.register_plugin("pre-registered", NullPlugin)
+        null_plugin = _make_null_plugin_class("pre-registered")
+        registry.register_plugin("pre-registered", null_plugin)
 
-        mock_ep = MagicMock()
-        mock_ep.name = "pre-registered"
+        load = Mock(return_value=null_plugin)
+        fake_ep = _FakeEntryPoint("pre-registered", load)
 
-        with patch("importlib.metadata.entry_points", return_value=[mock_ep]):
-            discovered = registry.auto_discover("some.group")
+        installed_entry_points(fake_ep, group="some.group")
+        discovered = registry.auto_discover("some.group")
 
         assert "pre-registered" not in discovered
         # load() was never called because we short-circuited
-        mock_ep.load.assert_not_called()
+        load.assert_not_called()
 
-    def test_auto_discover_skips_non_agent_plugin_subclass(self) -> None:
+    def test_auto_discover_skips_non_agent_plugin_subclass(
+        self, installed_entry_points: Callable[..., None]
+    ) -> None:
         """Covers registry.py lines 420-422: loaded class is not AgentPlugin subclass."""
         registry = AgentPluginRegistry()
 
         class NotAnAgentPlugin:
             pass
 
-        mock_ep = MagicMock()
-        mock_ep.name = "not-plugin"
-        mock_ep.load.return_value = NotAnAgentPlugin
+        fake_ep = _FakeEntryPoint("not-plugin", lambda: NotAnAgentPlugin)
 
-        with patch("importlib.metadata.entry_points", return_value=[mock_ep]):
-            discovered = registry.auto_discover("some.group")
+        installed_entry_points(fake_ep, group="some.group")
+        discovered = registry.auto_discover("some.group")
 
         assert "not-plugin" not in discovered
 
-    def test_auto_discover_skips_failed_ep_load(self) -> None:
+    def test_auto_discover_skips_failed_ep_load(
+        self, installed_entry_points: Callable[..., None]
+    ) -> None:
         """Covers registry.py lines 415-419: ep.load() raises."""
         registry = AgentPluginRegistry()
 
-        mock_ep = MagicMock()
-        mock_ep.name = "exploding-ep"
-        mock_ep.load.side_effect = ImportError("missing package")
+        fake_ep = _FakeEntryPoint("exploding-ep", _raising(ImportError("missing package")))
 
-        with patch("importlib.metadata.entry_points", return_value=[mock_ep]):
-            discovered = registry.auto_discover("some.group")
+        installed_entry_points(fake_ep, group="some.group")
+        discovered = registry.auto_discover("some.group")
 
         assert "exploding-ep" not in discovered
 
-    def test_auto_discover_handles_already_registered_race(self) -> None:
-        """Covers registry.py lines 423-427: PluginAlreadyRegisteredError during register."""
+    def test_auto_discover_handles_already_registered_race(
+        self, installed_entry_points: Callable[..., None]
+    ) -> None:
+        """A plugin registered by another thread mid-discovery is skipped, not re-registered."""
         registry = AgentPluginRegistry()
-        NullPlugin = _make_null_plugin_class("race-plugin")
-
-        # Simulate the race: ep.name is NOT in _classes at the lock check, but
-        # register_plugin raises PluginAlreadyRegisteredError anyway (e.g., race).
-        mock_ep = MagicMock()
-        mock_ep.name = "race-plugin"
-        mock_ep.load.return_value = NullPlugin
-
-        original_register = registry.register_plugin
+        null_plugin = _make_null_plugin_class("race-plugin")
+        other_plugin = _make_null_plugin_class("race-plugin-other")
 
-        def _raise_on_register(name: str, cls: type) -> None:
-            from agentcore.plugins.registry import PluginAlreadyRegisteredError
-            raise PluginAlreadyRegisteredError(name, "AgentPluginRegistry")
+        # Simulate the race: ep.name is not registered when discovery starts,
+        # but another thread registers it while the entry-point is loading.
+        def _load_while_racing() -> type[AgentPlugin]:
+            registry.register_plugin("race-plugin", other_plugin)
+            return null_plugin
 
-        registry.register_plugin = _raise_on_register  # type: ignore[method-assign]
+        fake_ep = _FakeEntryPoint("race-plugin", _load_while_racing)
 
-        with patch("importlib.metadata.entry_points", return_value=[mock_ep]):
-            discovered = registry.auto_discover("some.group")
+        installed_entry_points(fake_ep, group="some.group")
+        discovered = registry.auto_discover("some.group")
 
-        # Exception was swallowed; plugin not reported as discovered
         assert "race-plugin" not in discovered
+        assert registry.get_plugin("race-plugin") is other_plugin
@@ -140,6 +140,13 @@ class TestAgentConfigFromYaml:
         cfg = AgentConfig.from_yaml(str(config_file))
         assert cfg.agent_name == "str-path"
 
+    def test_edited_file_is_reloaded(self, tmp_path: Path) -> None:
+        config_file = tmp_path / "agentcore.yaml"
+        config_file.write_text("agent_name: first\n", encoding="utf-8")
+        assert AgentConfig.from_yaml(config_file).agent_name == "first"
+        config_file.write_text("agent_name: other\n", encoding="utf-8")
+        assert AgentConfig.from_yaml(config_file).agent_name == "other"
+
 
 # ---------------------------------------------------------------------------
 # from_env
@@ -182,6 +189,13 @@ class TestAgentConfigFromEnv:
         cfg = AgentConfig.from_env()
         assert cfg.custom_settings == {"timeout": 30}
 
+    def test_custom_settings_keep_large_integers_exact(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("AGENTCORE_CUSTOM_SETTINGS", '{"account": 18446744073709551617}')
+        cfg = AgentConfig.from_env()
+        assert cfg.custom_settings == {"account": 2**64 + 1}
+
     def test_invalid_custom_settings_json_defaults_to_empty(
         self, monkeypatch: pytest.MonkeyPatch
     ) -> None:
@@ -233,6 +247,13 @@ class TestAgentConfigMerge:
         merged = base.merge(override)
         assert merged.plugins.count("beta") == 1
 
+    def test_plugins_merge_keeps_base_order_then_new_overrides(self) -> None:
+        base = AgentConfig(plugins=["beta", "alpha"])
+        override = AgentConfig(plugins=["gamma", "alpha", "gamma", "delta"])
+        merged = base.merge(override)
+        assert merged.plugins == ["beta", "alpha", "gamma", "delta"]
+        assert base.plugins == ["beta", "alpha"]
+
     def test_custom_settings_merged_shallowly(self) -> None:
         base = AgentConfig(custom_settings={"a": 1, "b": 2})
         override = AgentConfig(custom_settings={"b": 99, "c": 3})
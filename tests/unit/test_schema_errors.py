@@ -5,6 +5,8 @@ repr formatting, and exception chaining behaviour.
 """
 from __future__ import annotations
 
+import pickle
+
 import pytest
 
 from agentcore.schema.errors import (
@@ -154,6 +156,19 @@ class TestDomainErrorSubclasses:
         assert exc.severity is ErrorSeverity.INFO
         assert exc.context == ctx
 
+    @pytest.mark.parametrize("error_cls", [AgentCoreError, PluginError])
+    def test_pickle_round_trip_keeps_severity_and_context(
+        self, error_cls: type[AgentCoreError]
+    ) -> None:
+        exc = error_cls("msg", severity=ErrorSeverity.LOW, context={"key": "val"})
+        exc.note = "extra"  # type: ignore[attr-defined]
+        restored = pickle.loads(pickle.dumps(exc))
+        assert type(restored) is error_cls
+        assert str(restored) == "msg"
+        assert restored.severity is ErrorSeverity.LOW
+        assert restored.context == {"key": "val"}
+        assert restored.note == "extra"  # type: ignore[attr-defined]
+
     def test_distinct_domain_errors_are_not_interchangeable(self) -> None:
         with pytest.raises(ConfigurationError):
             raise ConfigurationError("cfg fail")
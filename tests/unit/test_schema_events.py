@@ -5,8 +5,12 @@ DecisionEvent, and serialisation round-trips for each.
 """
 from __future__ import annotations
 
+import json
+import math
 import uuid
+import weakref
 from datetime import datetime, timezone
+from enum import Enum
 
 import pytest
 
@@ -99,6 +103,16 @@ class TestAgentEventConstruction:
         b = AgentEvent(EventType.CUSTOM, "agent-x")
         assert a.event_id != b.event_id
 
+    def test_generated_event_ids_carry_uuid4_version_and_variant(self) -> None:
+        event_ids = {AgentEvent(EventType.CUSTOM, "agent-x").event_id for _ in range(256)}
+        event_ids.add(AgentEvent.from_dict({"event_type": "custom", "agent_id": "a"}).event_id)
+        assert len(event_ids) == 257
+        for event_id in event_ids:
+            parsed = uuid.UUID(event_id)
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+            assert str(parsed) == event_id
+
     def test_timestamp_defaults_to_utc_now(self, base_event: AgentEvent) -> None:
         assert isinstance(base_event.timestamp, datetime)
         assert base_event.timestamp.tzinfo is not None
@@ -109,6 +123,14 @@ class TestAgentEventConstruction:
     def test_metadata_defaults_to_empty_dict(self, base_event: AgentEvent) -> None:
         assert base_event.metadata == {}
 
+    def test_default_metadata_is_a_fresh_mutable_dict(self) -> None:
+        first = AgentEvent(EventType.CUSTOM, "agent-x")
+        second = AgentEvent(EventType.CUSTOM, "agent-x")
+        first.metadata["trace_id"] = "t1"
+        assert type(first.metadata) is dict
+        assert second.metadata == {}
+        assert json.loads(first.to_json_bytes())["metadata"] == {"trace_id": "t1"}
+
     def test_parent_event_id_defaults_to_none(self, base_event: AgentEvent) -> None:
         assert base_event.parent_event_id is None
 
@@ -121,6 +143,16 @@ class TestAgentEventConstruction:
         )
         assert evt.parent_event_id == parent_id
 
+    @pytest.mark.parametrize("event_cls", [AgentEvent, ToolCallEvent, DecisionEvent])
+    def test_events_are_slotted(self, event_cls: type[AgentEvent]) -> None:
+        evt = event_cls(EventType.CUSTOM, "agent-x")
+        assert not hasattr(evt, "__dict__")
+
+    @pytest.mark.parametrize("event_cls", [AgentEvent, ToolCallEvent, DecisionEvent])
+    def test_events_support_weak_references(self, event_cls: type[AgentEvent]) -> None:
+        evt = event_cls(EventType.CUSTOM, "agent-x")
+        assert weakref.ref(evt)() is evt
+
 
 # ---------------------------------------------------------------------------
 # AgentEvent serialisation
@@ -151,6 +183,45 @@ class TestAgentEventSerialisation:
         assert isinstance(ts, str)
         datetime.fromisoformat(ts)
 
+    def test_to_dict_returns_independent_copies(self, base_event: AgentEvent) -> None:
+        first = base_event.to_dict()
+        first["agent_id"] = "changed"
+        del first["event_id"]
+        second = base_event.to_dict()
+        assert second["agent_id"] == base_event.agent_id
+        assert second["event_id"] == base_event.event_id
+
+    def test_to_dict_reflects_reassigned_fields(self) -> None:
+        event = AgentEvent(EventType.AGENT_STARTED, "agent-1")
+        assert event.to_dict()["parent_event_id"] is None
+        event.parent_event_id = "parent-1"
+        assert event.to_dict()["parent_event_id"] == "parent-1"
+
+    def test_to_json_bytes_encodes_to_dict(self, tool_event: ToolCallEvent) -> None:
+        tool_event.data["greeting"] = "héllo"
+        encoded = tool_event.to_json_bytes()
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == tool_event.to_dict()
+
+    def test_to_json_bytes_matches_json_dumps_for_edge_values(self) -> None:
+        # Non-str keys, integers wider than 64 bits and NaN encode exactly as
+        # json.dumps does, whatever optional packages are installed
+        evt = AgentEvent(
+            EventType.CUSTOM,
+            "agent-x",
+            data={"big": 2**70, "nan": math.nan},
+            metadata={1: "a"},  # type: ignore[dict-item]
+        )
+        expected = json.dumps(evt.to_dict(), ensure_ascii=False, separators=(",", ":"))
+        assert evt.to_json_bytes() == expected.encode()
+        assert b'"big":1180591620717411303424' in evt.to_json_bytes()
+        assert b'"nan":NaN' in evt.to_json_bytes()
+
+    def test_to_json_bytes_rejects_unserialisable_data(self) -> None:
+        evt = AgentEvent(EventType.CUSTOM, "agent-x", data={"obj": object()})
+        with pytest.raises(TypeError):
+            evt.to_json_bytes()
+
     def test_round_trip_base_event(self, base_event: AgentEvent) -> None:
         restored = AgentEvent.from_dict(base_event.to_dict())
         assert restored.event_id == base_event.event_id
@@ -166,6 +237,24 @@ class TestAgentEventSerialisation:
                 }
             )
 
+    @pytest.mark.parametrize("raw", [7, None, ["agent_started"]])
+    def test_from_dict_non_string_event_type_raises_value_error(self, raw: object) -> None:
+        with pytest.raises(ValueError):
+            AgentEvent.from_dict({"event_type": raw, "agent_id": "a1"})
+
+    def test_from_dict_accepts_event_type_member(self) -> None:
+        evt = AgentEvent.from_dict({"event_type": EventType.TOOL_FAILED, "agent_id": "a1"})
+        assert evt.event_type is EventType.TOOL_FAILED
+
+    def test_from_dict_keeps_str_enum_metadata_keys(self) -> None:
+        class Key(str, Enum):
+            TRACE = "trace_id"
+
+        evt = AgentEvent.from_dict(
+            {"event_type": "custom", "agent_id": "a1", "metadata": {Key.TRACE: "t1"}}
+        )
+        assert evt.metadata == {"trace_id": "t1"}
+
     def test_from_dict_missing_agent_id_raises_key_error(self) -> None:
         with pytest.raises(KeyError):
             AgentEvent.from_dict({"event_type": "agent_started"})
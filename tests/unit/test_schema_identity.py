@@ -6,21 +6,33 @@ fingerprinting determinism, and from_dict edge cases.
 from __future__ import annotations
 
 import hashlib
-import json
 import uuid
 from datetime import datetime, timezone
 
 import pytest
 
+import agentcore.schema.identity as identity_module
 from agentcore.schema.identity import AgentIdentity
 
 
+# SHA-256 of minimal_identity's stable fields in canonical form (sorted keys,
+# no whitespace).  Spelled out so a change to the canonical encoding fails here.
+_MINIMAL_IDENTITY_FINGERPRINT = hashlib.sha256(
+    b'{"framework":"custom","model":"claude-sonnet-4-5","name":"test-agent","version":"1.0.0"}'
+).hexdigest()
+
+
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture()
+# Identity fixtures are module-scoped: every test only reads them, so one
+# instance each serves the whole module.  Build a fresh identity in any
+# test that needs to mutate one.
+
+
+@pytest.fixture(scope="module")
 def minimal_identity() -> AgentIdentity:
     """AgentIdentity with only the four required fields."""
     return AgentIdentity(
@@ -31,7 +43,7 @@ def minimal_identity() -> AgentIdentity:
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def rich_identity() -> AgentIdentity:
     """AgentIdentity with metadata and an explicit agent_id."""
     return AgentIdentity(
@@ -44,6 +56,20 @@ def rich_identity() -> AgentIdentity:
     )
 
 
+@pytest.fixture(scope="module")
+def identity_variants() -> dict[str, AgentIdentity]:
+    """A base identity plus one variant per stable field, keyed by what differs."""
+    stable = {"name": "bot", "version": "1", "framework": "x", "model": "y"}
+    return {
+        "base": AgentIdentity(**stable),
+        "base_copy": AgentIdentity(**stable),
+        "name": AgentIdentity(**{**stable, "name": "bot-b"}),
+        "version": AgentIdentity(**{**stable, "version": "2.0.0"}),
+        "framework": AgentIdentity(**{**stable, "framework": "crewai"}),
+        "model": AgentIdentity(**{**stable, "model": "claude-opus-4"}),
+    }
+
+
 # ---------------------------------------------------------------------------
 # Construction
 # ---------------------------------------------------------------------------
@@ -62,6 +88,21 @@ class TestAgentIdentityConstruction:
         parsed = uuid.UUID(minimal_identity.agent_id, version=4)
         assert str(parsed) == minimal_identity.agent_id
 
+    def test_generated_agent_ids_carry_uuid4_version_and_variant(self) -> None:
+        agent_ids = {
+            AgentIdentity(name="a", version="1", framework="x", model="y").agent_id
+            for _ in range(256)
+        }
+        assert len(agent_ids) == 256
+        for agent_id in agent_ids:
+            parsed = uuid.UUID(agent_id)
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+            assert str(parsed) == agent_id
+
+    def test_identity_is_slotted(self, minimal_identity: AgentIdentity) -> None:
+        assert not hasattr(minimal_identity, "__dict__")
+
     def test_two_identities_get_different_agent_ids(self) -> None:
         a = AgentIdentity(name="a", version="1", framework="x", model="y")
         b = AgentIdentity(name="a", version="1", framework="x", model="y")
@@ -95,32 +136,37 @@ class TestAgentIdentityFingerprint:
         fp = minimal_identity.fingerprint()
         assert isinstance(fp, str)
         assert len(fp) == 64
-        assert all(c in "0123456789abcdef" for c in fp)
-
-    def test_same_stable_fields_produce_same_fingerprint(self) -> None:
-        a = AgentIdentity(name="bot", version="1", framework="x", model="y")
-        b = AgentIdentity(name="bot", version="1", framework="x", model="y")
-        assert a.fingerprint() == b.fingerprint()
-
-    def test_different_name_changes_fingerprint(self) -> None:
-        a = AgentIdentity(name="bot-a", version="1", framework="x", model="y")
-        b = AgentIdentity(name="bot-b", version="1", framework="x", model="y")
-        assert a.fingerprint() != b.fingerprint()
+        assert bytes.fromhex(fp).hex() == fp  # lower-case hex digits only
 
-    def test_different_version_changes_fingerprint(self) -> None:
-        a = AgentIdentity(name="bot", version="1.0.0", framework="x", model="y")
-        b = AgentIdentity(name="bot", version="2.0.0", framework="x", model="y")
-        assert a.fingerprint() != b.fingerprint()
-
-    def test_different_framework_changes_fingerprint(self) -> None:
-        a = AgentIdentity(name="bot", version="1", framework="langchain", model="y")
-        b = AgentIdentity(name="bot", version="1", framework="crewai", model="y")
-        assert a.fingerprint() != b.fingerprint()
+    def test_same_stable_fields_produce_same_fingerprint(
+        self, identity_variants: dict[str, AgentIdentity]
+    ) -> None:
+        base, copy = identity_variants["base"], identity_variants["base_copy"]
+        assert base.fingerprint() == copy.fingerprint()
 
-    def test_different_model_changes_fingerprint(self) -> None:
-        a = AgentIdentity(name="bot", version="1", framework="x", model="gpt-4o")
-        b = AgentIdentity(name="bot", version="1", framework="x", model="claude-opus-4")
-        assert a.fingerprint() != b.fingerprint()
+    @pytest.mark.parametrize("field", ["name", "version", "framework", "model"])
+    def test_different_stable_field_changes_fingerprint(
+        self, identity_variants: dict[str, AgentIdentity], field: str
+    ) -> None:
+        base, variant = identity_variants["base"], identity_variants[field]
+        assert base.fingerprint() != variant.fingerprint()
+
+    def test_fingerprint_is_memoised_on_stable_fields(self) -> None:
+        identity_module._fingerprint_of.cache_clear()
+        first = AgentIdentity(name="memo", version="1", framework="x", model="y")
+        second = AgentIdentity(name="memo", version="1", framework="x", model="y")
+
+        assert first.fingerprint() == second.fingerprint()
+        assert identity_module._fingerprint_of.cache_info().hits == 1
+
+    def test_fingerprint_follows_field_reassignment(self) -> None:
+        identity = AgentIdentity(name="bot", version="1", framework="x", model="y")
+        before = identity.fingerprint()
+        identity.version = "2"
+        after = identity.fingerprint()
+        fresh = AgentIdentity(name="bot", version="2", framework="x", model="y")
+        assert after != before
+        assert after == fresh.fingerprint()
 
     def test_metadata_does_not_affect_fingerprint(self) -> None:
         a = AgentIdentity(
@@ -149,15 +195,7 @@ class TestAgentIdentityFingerprint:
     def test_fingerprint_matches_manual_sha256(
         self, minimal_identity: AgentIdentity
     ) -> None:
-        stable = {
-            "framework": minimal_identity.framework,
-            "model": minimal_identity.model,
-            "name": minimal_identity.name,
-            "version": minimal_identity.version,
-        }
-        canonical = json.dumps(stable, sort_keys=True, separators=(",", ":"))
-        expected = hashlib.sha256(canonical.encode()).hexdigest()
-        assert minimal_identity.fingerprint() == expected
+        assert minimal_identity.fingerprint() == _MINIMAL_IDENTITY_FINGERPRINT
 
 
 # ---------------------------------------------------------------------------
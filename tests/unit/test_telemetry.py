@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 import json
-import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -37,7 +36,7 @@ class TestAccumulator:
             acc.record(v)
         assert acc.minimum == 5.0
         assert acc.maximum == 15.0
-        assert acc.average == pytest.approx(10.0)
+        assert acc.average == 10.0
 
     def test_average_zero_when_no_records(self) -> None:
         acc = _Accumulator()
@@ -68,8 +67,8 @@ class TestMetricCollector:
 
         s1 = collector.get_summary("latency", {"model": "gpt-4o"})
         s2 = collector.get_summary("latency", {"model": "claude-opus-4"})
-        assert s1 is not None and s1.average == pytest.approx(50.0)
-        assert s2 is not None and s2.average == pytest.approx(80.0)
+        assert s1 is not None and s1.average == 50.0
+        assert s2 is not None and s2.average == 80.0
 
     def test_tags_order_is_normalised(self) -> None:
         collector = MetricCollector()
@@ -116,10 +115,10 @@ class TestMetricCollector:
         assert s.name == "m"
         assert s.tags == {"env": "test"}
         assert s.count == 2
-        assert s.total == pytest.approx(30.0)
-        assert s.minimum == pytest.approx(10.0)
-        assert s.maximum == pytest.approx(20.0)
-        assert s.average == pytest.approx(15.0)
+        assert s.total == 30.0
+        assert s.minimum == 10.0
+        assert s.maximum == 20.0
+        assert s.average == 15.0
 
 
 # ---------------------------------------------------------------------------
@@ -127,43 +126,52 @@ class TestMetricCollector:
 # ---------------------------------------------------------------------------
 
 class TestConsoleExporter:
-    def test_export_empty_list_does_not_print(self, capsys: pytest.CaptureFixture[str]) -> None:
-        exporter = ConsoleExporter()
-        exporter.export([])
-        captured = capsys.readouterr()
-        assert captured.out == ""
-
-    def test_export_one_summary_prints_line(self, capsys: pytest.CaptureFixture[str]) -> None:
-        exporter = ConsoleExporter()
-        summary = MetricSummary(
-            name="test_metric",
-            tags={"model": "gpt-4o"},
-            count=5,
-            total=500.0,
-            minimum=80.0,
-            maximum=120.0,
-            average=100.0,
-        )
-        exporter.export([summary])
-        captured = capsys.readouterr()
-        assert "test_metric" in captured.out
-        assert "model=gpt-4o" in captured.out
-        assert "count=5" in captured.out
-
-    def test_export_summary_without_tags(self, capsys: pytest.CaptureFixture[str]) -> None:
-        exporter = ConsoleExporter()
-        summary = MetricSummary(
-            name="no_tags",
-            tags={},
-            count=1,
-            total=10.0,
-            minimum=10.0,
-            maximum=10.0,
-            average=10.0,
-        )
-        exporter.export([summary])
-        captured = capsys.readouterr()
-        assert "no_tags" in captured.out
+    @pytest.mark.parametrize(
+        ("summaries", "expected"),
+        [
+            ([], []),
+            (
+                [
+                    MetricSummary(
+                        name="test_metric",
+                        tags={"model": "gpt-4o"},
+                        count=5,
+                        total=500.0,
+                        minimum=80.0,
+                        maximum=120.0,
+                        average=100.0,
+                    )
+                ],
+                ["metric=test_metric [model=gpt-4o]", "count=5"],
+            ),
+            (
+                [
+                    MetricSummary(
+                        name="no_tags",
+                        tags={},
+                        count=1,
+                        total=10.0,
+                        minimum=10.0,
+                        maximum=10.0,
+                        average=10.0,
+                    )
+                ],
+                ["metric=no_tags count=1"],
+            ),
+        ],
+        ids=["empty", "tagged", "untagged"],
+    )
+    def test_export_prints_one_line_per_summary(
+        self,
+        summaries: list[MetricSummary],
+        expected: list[str],
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        ConsoleExporter().export(summaries)
+        out = capsys.readouterr().out
+        assert len(out.splitlines()) == len(summaries)
+        for fragment in expected:
+            assert fragment in out
 
     def test_flush_is_noop(self) -> None:
         exporter = ConsoleExporter()
@@ -174,7 +182,19 @@ class TestConsoleExporter:
 # JSONFileExporter
 # ---------------------------------------------------------------------------
 
+def _read_jsonl(path: Path) -> list[dict[str, object]]:
+    """Parse each line of a JSON Lines file; ``json.loads`` takes the raw bytes."""
+    return [json.loads(line) for line in path.read_bytes().splitlines()]
+
+
 class TestJSONFileExporter:
+    # Each test writes its own file name, so the whole class shares one
+    # directory instead of creating a tmp_path per test.
+    @pytest.fixture(scope="class")
+    @classmethod
+    def out_dir(cls, tmp_path_factory: pytest.TempPathFactory) -> Path:
+        return tmp_path_factory.mktemp("exporter")
+
     def _make_summary(self, name: str = "m", value: float = 10.0) -> MetricSummary:
         return MetricSummary(
             name=name,
@@ -186,47 +206,45 @@ class TestJSONFileExporter:
             average=value,
         )
 
-    def test_export_writes_jsonl(self, tmp_path: Path) -> None:
-        out_file = tmp_path / "metrics.jsonl"
+    def test_export_writes_jsonl(self, out_dir: Path) -> None:
+        out_file = out_dir / "metrics.jsonl"
         exporter = JSONFileExporter(out_file)
         exporter.export([self._make_summary("m1"), self._make_summary("m2")])
 
-        lines = out_file.read_text(encoding="utf-8").strip().split("\n")
-        assert len(lines) == 2
-        record = json.loads(lines[0])
+        records = _read_jsonl(out_file)
+        assert len(records) == 2
+        record = records[0]
         assert "name" in record
         assert "timestamp" in record
 
-    def test_export_empty_list_does_not_write_file(self, tmp_path: Path) -> None:
-        out_file = tmp_path / "empty.jsonl"
+    def test_export_empty_list_does_not_write_file(self, out_dir: Path) -> None:
+        out_file = out_dir / "empty.jsonl"
         exporter = JSONFileExporter(out_file)
         exporter.export([])
         assert not out_file.exists()
 
-    def test_append_mode_accumulates(self, tmp_path: Path) -> None:
-        out_file = tmp_path / "app.jsonl"
+    def test_append_mode_accumulates(self, out_dir: Path) -> None:
+        out_file = out_dir / "app.jsonl"
         exporter = JSONFileExporter(out_file, append=True)
         exporter.export([self._make_summary("first")])
         exporter.export([self._make_summary("second")])
-        lines = out_file.read_text(encoding="utf-8").strip().split("\n")
-        assert len(lines) == 2
+        assert len(_read_jsonl(out_file)) == 2
 
-    def test_non_append_mode_overwrites(self, tmp_path: Path) -> None:
-        out_file = tmp_path / "over.jsonl"
+    def test_non_append_mode_overwrites(self, out_dir: Path) -> None:
+        out_file = out_dir / "over.jsonl"
         exporter = JSONFileExporter(out_file, append=False)
         exporter.export([self._make_summary("first")])
         exporter.export([self._make_summary("second")])
-        lines = out_file.read_text(encoding="utf-8").strip().split("\n")
-        assert len(lines) == 1
-        record = json.loads(lines[0])
-        assert record["name"] == "second"
+        records = _read_jsonl(out_file)
+        assert len(records) == 1
+        assert records[0]["name"] == "second"
 
-    def test_flush_is_noop(self, tmp_path: Path) -> None:
-        exporter = JSONFileExporter(tmp_path / "f.jsonl")
+    def test_flush_is_noop(self, out_dir: Path) -> None:
+        exporter = JSONFileExporter(out_dir / "f.jsonl")
         exporter.flush()  # must not raise
 
-    def test_export_record_contains_all_fields(self, tmp_path: Path) -> None:
-        out_file = tmp_path / "fields.jsonl"
+    def test_export_record_contains_all_fields(self, out_dir: Path) -> None:
+        out_file = out_dir / "fields.jsonl"
         exporter = JSONFileExporter(out_file)
         summary = MetricSummary(
             name="full",
@@ -238,7 +256,7 @@ class TestJSONFileExporter:
             average=10.0,
         )
         exporter.export([summary])
-        record = json.loads(out_file.read_text(encoding="utf-8").strip())
+        (record,) = _read_jsonl(out_file)
         for key in ("name", "tags", "count", "total", "minimum", "maximum", "average", "timestamp"):
             assert key in record
 
@@ -264,18 +282,25 @@ class TestNullExporter:
 # OTelBridge — no-op mode (otel not installed in test env)
 # ---------------------------------------------------------------------------
 
+# The bridge only reads events, so the OTel tests share one per event type.
+_AGENT_STARTED = AgentEvent(EventType.AGENT_STARTED, "agent-1")
+_TOOL_CALLED = AgentEvent(EventType.TOOL_CALLED, "agent-1")
+_AGENT_STOPPED = AgentEvent(EventType.AGENT_STOPPED, "agent-1")
+
+
 class TestOTelBridgeNoOp:
+    @pytest.fixture(autouse=True)
+    def otel_unavailable(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("agentcore.telemetry.otel_bridge._OTEL_AVAILABLE", False)
+
     def test_is_available_false_without_otel(self) -> None:
-        with patch("agentcore.telemetry.otel_bridge._OTEL_AVAILABLE", False):
-            bridge = OTelBridge()
-            assert bridge.is_available() is False
+        bridge = OTelBridge()
+        assert bridge.is_available() is False
 
     def test_start_span_returns_none_when_otel_absent(self) -> None:
         bridge = OTelBridge()
-        with patch("agentcore.telemetry.otel_bridge._OTEL_AVAILABLE", False):
-            bridge._tracer = None
-            event = AgentEvent(EventType.AGENT_STARTED, "agent-1")
-            result = bridge.start_span(event)
+        bridge._tracer = None
+        result = bridge.start_span(_AGENT_STARTED)
         assert result is None
 
     def test_end_span_with_none_key_is_safe(self) -> None:
@@ -285,8 +310,7 @@ class TestOTelBridgeNoOp:
     def test_record_event_is_noop_when_otel_absent(self) -> None:
         bridge = OTelBridge()
         bridge._event_counter = None
-        event = AgentEvent(EventType.AGENT_STARTED, "agent-1")
-        bridge.record_event(event)  # must not raise
+        bridge.record_event(_AGENT_STARTED)  # must not raise
 
     def test_record_metric_is_noop_when_otel_absent(self) -> None:
         bridge = OTelBridge()
@@ -295,21 +319,30 @@ class TestOTelBridgeNoOp:
 
     def test_flush_is_noop_when_otel_absent(self) -> None:
         bridge = OTelBridge()
-        with patch("agentcore.telemetry.otel_bridge._OTEL_AVAILABLE", False):
-            bridge.flush()  # must not raise
+        bridge.flush()  # must not raise
 
     def test_translate_event_is_noop_when_otel_absent(self) -> None:
         bridge = OTelBridge()
         bridge._tracer = None
         bridge._event_counter = None
-        event = AgentEvent(EventType.TOOL_CALLED, "agent-1")
-        bridge.translate_event(event)  # must not raise
+        bridge.translate_event(_TOOL_CALLED)  # must not raise
+
+
+# (bridge, tracer, event counter)
+_MockedBridge = tuple[OTelBridge, MagicMock, MagicMock]
 
 
 class TestOTelBridgeWithMockedOTel:
     """Tests that exercise OTelBridge with the otel API mocked."""
 
-    def _make_bridge_with_mock_otel(self) -> tuple[OTelBridge, MagicMock, MagicMock]:
+    @pytest.fixture()
+    def bridge_with_mocks(self, monkeypatch: pytest.MonkeyPatch) -> _MockedBridge:
+        """A bridge wired to fresh tracer, meter and counter mocks, with otel enabled.
+
+        Built per test rather than drawn from a shared pool: several tests
+        reconfigure ``return_value`` on the mocks, which ``reset_mock()``
+        leaves in place.
+        """
         mock_tracer = MagicMock()
         mock_meter = MagicMock()
         mock_counter = MagicMock()
@@ -322,79 +355,70 @@ class TestOTelBridgeWithMockedOTel:
         bridge._tracer = mock_tracer
         bridge._meter = mock_meter
         bridge._event_counter = mock_counter
+        # Enabled only after construction so __init__ skips the real otel API.
+        monkeypatch.setattr("agentcore.telemetry.otel_bridge._OTEL_AVAILABLE", True)
 
         return bridge, mock_tracer, mock_counter
 
-    def test_start_span_stores_active_span(self) -> None:
-        bridge, mock_tracer, _ = self._make_bridge_with_mock_otel()
-        event = AgentEvent(EventType.AGENT_STARTED, "agent-x")
+    def test_start_span_stores_active_span(self, bridge_with_mocks: _MockedBridge) -> None:
+        bridge, mock_tracer, _ = bridge_with_mocks
 
-        with patch("agentcore.telemetry.otel_bridge._OTEL_AVAILABLE", True):
-            span_key = bridge.start_span(event)
+        span_key = bridge.start_span(_AGENT_STARTED)
 
         assert span_key is not None
         assert span_key in bridge._active_spans
 
-    def test_end_span_calls_span_end(self) -> None:
-        bridge, mock_tracer, _ = self._make_bridge_with_mock_otel()
+    def test_end_span_calls_span_end(self, bridge_with_mocks: _MockedBridge) -> None:
+        bridge, mock_tracer, _ = bridge_with_mocks
         mock_span = MagicMock()
         bridge._active_spans["test-key"] = mock_span
 
-        with patch("agentcore.telemetry.otel_bridge._OTEL_AVAILABLE", True):
-            bridge.end_span("test-key")
+        bridge.end_span("test-key")
 
         mock_span.end.assert_called_once()
         assert "test-key" not in bridge._active_spans
 
-    def test_record_event_increments_counter(self) -> None:
-        bridge, _, mock_counter = self._make_bridge_with_mock_otel()
-        event = AgentEvent(EventType.TOOL_CALLED, "agent-x")
+    def test_record_event_increments_counter(self, bridge_with_mocks: _MockedBridge) -> None:
+        bridge, _, mock_counter = bridge_with_mocks
 
-        with patch("agentcore.telemetry.otel_bridge._OTEL_AVAILABLE", True):
-            bridge.record_event(event)
+        bridge.record_event(_TOOL_CALLED)
 
         mock_counter.add.assert_called_once()
 
-    def test_record_metric_creates_histogram(self) -> None:
-        bridge, _, _ = self._make_bridge_with_mock_otel()
+    def test_record_metric_creates_histogram(self, bridge_with_mocks: _MockedBridge) -> None:
+        bridge, _, _ = bridge_with_mocks
         mock_histogram = MagicMock()
         bridge._meter.create_histogram.return_value = mock_histogram
 
-        with patch("agentcore.telemetry.otel_bridge._OTEL_AVAILABLE", True):
-            bridge.record_metric("latency", 42.5, {"model": "gpt-4o"})
+        bridge.record_metric("latency", 42.5, {"model": "gpt-4o"})
 
         bridge._meter.create_histogram.assert_called_once()
         mock_histogram.record.assert_called_once_with(42.5, attributes={"model": "gpt-4o"})
 
-    def test_flush_calls_force_flush(self) -> None:
-        bridge, _, _ = self._make_bridge_with_mock_otel()
+    def test_flush_calls_force_flush(self, bridge_with_mocks: _MockedBridge) -> None:
+        bridge, _, _ = bridge_with_mocks
         mock_provider = MagicMock()
         mock_provider.force_flush = MagicMock()
 
-        with patch("agentcore.telemetry.otel_bridge._OTEL_AVAILABLE", True):
-            with patch("agentcore.telemetry.otel_bridge.otel_trace") as mock_trace_mod:
-                mock_trace_mod.get_tracer_provider.return_value = mock_provider
-                bridge.flush()
+        with patch("agentcore.telemetry.otel_bridge.otel_trace") as mock_trace_mod:
+            mock_trace_mod.get_tracer_provider.return_value = mock_provider
+            bridge.flush()
 
         mock_provider.force_flush.assert_called_once()
 
-    def test_flush_swallows_exception(self) -> None:
-        bridge, _, _ = self._make_bridge_with_mock_otel()
+    def test_flush_swallows_exception(self, bridge_with_mocks: _MockedBridge) -> None:
+        bridge, _, _ = bridge_with_mocks
 
-        with patch("agentcore.telemetry.otel_bridge._OTEL_AVAILABLE", True):
-            with patch("agentcore.telemetry.otel_bridge.otel_trace") as mock_trace_mod:
-                mock_trace_mod.get_tracer_provider.side_effect = RuntimeError("provider error")
-                bridge.flush()  # must not raise
+        with patch("agentcore.telemetry.otel_bridge.otel_trace") as mock_trace_mod:
+            mock_trace_mod.get_tracer_provider.side_effect = RuntimeError("provider error")
+            bridge.flush()  # must not raise
 
-    def test_translate_event_full_pipeline(self) -> None:
-        bridge, mock_tracer, mock_counter = self._make_bridge_with_mock_otel()
+    def test_translate_event_full_pipeline(self, bridge_with_mocks: _MockedBridge) -> None:
+        bridge, mock_tracer, mock_counter = bridge_with_mocks
         mock_span = MagicMock()
         mock_tracer.start_span.return_value = mock_span
 
-        event = AgentEvent(EventType.AGENT_STOPPED, "agent-z")
-
-        with patch("agentcore.telemetry.otel_bridge._OTEL_AVAILABLE", True):
-            bridge.translate_event(event)
+        bridge.translate_event(_AGENT_STOPPED)
 
         mock_tracer.start_span.assert_called_once()
         mock_counter.add.assert_called_once()